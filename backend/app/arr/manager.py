@@ -1,6 +1,7 @@
 # arr/manager.py
 
-from ..db import get_db
+from ..db import (get_db, get_arr_sync_data, set_arr_sync_data,
+                  delete_arr_sync_data)
 import json
 import logging
 
@@ -47,25 +48,29 @@ def save_arr_config(config):
                 '''
                 INSERT INTO arr_config (
                     name, type, tags, arr_server, api_key, 
-                    data_to_sync, last_sync_time, sync_percentage,
+                    last_sync_time, sync_percentage,
                     sync_method, sync_interval, import_as_unique,
                     import_task_id
                 )
-                VALUES (?, ?, ?, ?, ?, ?, NULL, 0, ?, ?, ?, NULL)
+                VALUES (?, ?, ?, ?, ?, NULL, 0, ?, ?, ?, NULL)
                 ''', (
                     config['name'],
                     config['type'],
                     json.dumps(config.get('tags', [])),
                     config['arrServer'],
                     config['apiKey'],
-                    json.dumps(config.get('data_to_sync', {})),
                     config.get('sync_method', 'manual'),
                     config.get('sync_interval', 0),
                     config.get('import_as_unique', False),
                 ))
-            conn.commit()
-
             new_config_id = cursor.lastrowid
+
+            # Store the selected formats/profiles in arr_sync_items, in the
+            # same transaction as the row they belong to
+            set_arr_sync_data(new_config_id,
+                              config.get('data_to_sync', {}),
+                              conn=conn)
+            conn.commit()
             logger.info(
                 f"[save_arr_config] Created new arr_config row #{new_config_id} for '{config['name']}'"
             )
@@ -97,6 +102,7 @@ def save_arr_config(config):
             return {'success': True, 'id': new_config_id}
 
         except Exception as e:
+            conn.rollback()
             logger.error(
                 f"[save_arr_config] Error saving arr config: {str(e)}")
             return {'success': False, 'error': str(e)}
@@ -148,25 +154,23 @@ def update_arr_config(id, config):
                     tags = ?,
                     arr_server = ?,
                     api_key = ?,
-                    data_to_sync = ?,
                     sync_method = ?,
                     sync_interval = ?,
                     import_as_unique = ?
                 WHERE id = ?
-                ''',
-                (config['name'], config['type'],
-                 json.dumps(config.get('tags', [])), config['arrServer'],
-                 config['apiKey'], json.dumps(config.get(
-                     'data_to_sync', {})), config.get('sync_method', 'manual'),
-                 config.get('sync_interval',
-                            0), config.get('import_as_unique', False), id))
-            conn.commit()
+                ''', (config['name'], config['type'],
+                      json.dumps(config.get('tags', [])), config['arrServer'],
+                      config['apiKey'], config.get('sync_method', 'manual'),
+                      config.get('sync_interval', 0),
+                      config.get('import_as_unique', False), id))
             if cursor.rowcount == 0:
                 logger.debug(
                     f"[update_arr_config] arr_config #{id} not found for update"
                 )
                 return {'success': False, 'error': 'Configuration not found'}
 
+            set_arr_sync_data(id, config.get('data_to_sync', {}), conn=conn)
+            conn.commit()
             logger.info(f"[update_arr_config] Updated arr_config row #{id}")
 
             # 3) Create/Update/Remove the scheduled task row
@@ -194,6 +198,7 @@ def update_arr_config(id, config):
             return {'success': True}
 
         except Exception as e:
+            conn.rollback()
             logger.error(
                 f"[update_arr_config] Error updating arr config: {str(e)}")
             return {'success': False, 'error': str(e)}
@@ -220,13 +225,14 @@ def delete_arr_config(id):
             # 2) Delete the arr_config
             logger.debug(f"[delete_arr_config] Removing arr_config #{id}")
             cursor.execute('DELETE FROM arr_config WHERE id = ?', (id, ))
-            conn.commit()
             if cursor.rowcount == 0:
                 logger.debug(
                     f"[delete_arr_config] arr_config #{id} not found for deletion"
                 )
                 return {'success': False, 'error': 'Configuration not found'}
 
+            delete_arr_sync_data(id, conn=conn)
+            conn.commit()
             logger.info(f"[delete_arr_config] Deleted arr_config #{id}")
 
             # 3) If there's a scheduled task, remove it
@@ -241,6 +247,7 @@ def delete_arr_config(id):
             return {'success': True}
 
         except Exception as e:
+            conn.rollback()
             logger.error(
                 f"[delete_arr_config] Error deleting arr config: {str(e)}")
             return {'success': False, 'error': str(e)}
@@ -251,6 +258,7 @@ def get_all_arr_configs():
         cursor = conn.execute('SELECT * FROM arr_config')
         rows = cursor.fetchall()
         try:
+            sync_data = get_arr_sync_data([row['id'] for row in rows])
             configs = []
             for row in rows:
                 configs.append({
@@ -266,8 +274,8 @@ def get_all_arr_configs():
                     row['arr_server'],
                     'apiKey':
                     row['api_key'],
-                    'data_to_sync': (json.loads(row['data_to_sync'])
-                                     if row['data_to_sync'] else {}),
+                    'data_to_sync':
+                    sync_data[row['id']],
                     'last_sync_time':
                     row['last_sync_time'],
                     'sync_percentage':
@@ -308,8 +316,8 @@ def get_arr_config(id):
                         row['arr_server'],
                         'apiKey':
                         row['api_key'],
-                        'data_to_sync': (json.loads(row['data_to_sync'])
-                                         if row['data_to_sync'] else {}),
+                        'data_to_sync':
+                        get_arr_sync_data([row['id']])[row['id']],
                         'last_sync_time':
                         row['last_sync_time'],
                         'sync_percentage':
@@ -363,6 +371,7 @@ def get_pull_configs():
         rows = conn.execute(
             'SELECT * FROM arr_config WHERE sync_method = "pull"').fetchall()
 
+        sync_data = get_arr_sync_data([row['id'] for row in rows])
         results = []
         for row in rows:
             results.append({
@@ -378,8 +387,8 @@ def get_pull_configs():
                 row['arr_server'],
                 'apiKey':
                 row['api_key'],
-                'data_to_sync': (json.loads(row['data_to_sync'])
-                                 if row['data_to_sync'] else {}),
+                'data_to_sync':
+                sync_data[row['id']],
                 'last_sync_time':
                 row['last_sync_time'],
                 'sync_percentage':
@@ -402,20 +411,26 @@ def check_active_sync_configs():
     Returns (has_active_configs, details) tuple.
     """
     with get_db() as conn:
+        # Only configs that actually select something count as active
         cursor = conn.execute('''
-            SELECT id, name, sync_method, data_to_sync 
+            SELECT id, name, sync_method
             FROM arr_config 
             WHERE sync_method != 'manual'
+            AND EXISTS (
+                SELECT 1 FROM arr_sync_items
+                WHERE arr_sync_items.arr_config_id = arr_config.id
+            )
         ''')
         active_configs = cursor.fetchall()
 
         if not active_configs:
             return False, None
 
+        sync_data = get_arr_sync_data(
+            [config['id'] for config in active_configs])
         details = []
         for config in active_configs:
-            data_to_sync = json.loads(
-                config['data_to_sync'] if config['data_to_sync'] else '{}')
+            data_to_sync = sync_data[config['id']]
             if data_to_sync.get('profiles') or data_to_sync.get(
                     'customFormats'):
                 details.append({
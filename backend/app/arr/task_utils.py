@@ -65,6 +65,8 @@ def update_import_task_for_arr_config(config_id, config_name, sync_method,
                 logger.debug(
                     f"[update_import_task_for_arr_config] Removing old task {existing_task_id} because sync_method={sync_method}"
                 )
+                cursor.execute('DELETE FROM task_runs WHERE task_id = ?',
+                               (existing_task_id, ))
                 cursor.execute('DELETE FROM scheduled_tasks WHERE id = ?',
                                (existing_task_id, ))
                 deleted_count = cursor.rowcount
@@ -130,6 +132,7 @@ def delete_import_task_for_arr_config(task_id):
         return
     with get_db() as conn:
         cursor = conn.cursor()
+        cursor.execute('DELETE FROM task_runs WHERE task_id = ?', (task_id, ))
         cursor.execute('DELETE FROM scheduled_tasks WHERE id = ?', (task_id, ))
         conn.commit()
         if cursor.rowcount > 0:
@@ -1,7 +1,7 @@
 # app/backup/__init__.py
 from flask import Blueprint, request, jsonify, send_file
 import logging
-from ..task.backup.backup import BackupManager
+from ..task.backup.backup import BackupManager, MANIFEST_SUFFIX
 from ..db import get_db
 import os
 from datetime import datetime
@@ -40,8 +40,9 @@ def list_backups():
 def create_backup():
     """Create a new backup manually"""
     try:
+        data = request.get_json(silent=True) or {}
         manager = BackupManager()
-        success, result = manager.create_backup()
+        success, result = manager.create_backup(mode=data.get('mode'))
 
         if success:
             return jsonify({
@@ -66,10 +67,29 @@ def download_backup(filename):
         if not os.path.exists(file_path):
             return jsonify({'error': 'Backup file not found'}), 404
 
-        return send_file(file_path,
-                         mimetype='application/zip',
-                         as_attachment=True,
-                         download_name=filename)
+        if not manager.is_incremental(filename):
+            return send_file(file_path,
+                             mimetype='application/zip',
+                             as_attachment=True,
+                             download_name=filename)
+
+        # Incremental backups are reassembled into a standalone zip
+        fd, zip_path = tempfile.mkstemp(suffix='.zip',
+                                        dir=manager.backup_dir)
+        os.close(fd)
+        try:
+            manager.export_backup(filename, zip_path)
+        except Exception:
+            # Don't leave a partial export behind for the listing to find
+            os.remove(zip_path)
+            raise
+        response = send_file(zip_path,
+                             mimetype='application/zip',
+                             as_attachment=True,
+                             download_name=filename[:-len(MANIFEST_SUFFIX)] +
+                             '.zip')
+        response.call_on_close(lambda: os.remove(zip_path))
+        return response
     except Exception as e:
         logger.error(f'Error downloading backup: {str(e)}')
         return jsonify({'error': 'Failed to download backup'}), 500
@@ -111,6 +131,9 @@ def delete_backup(filename):
                          (filename, ))
             conn.commit()
 
+        if manager.is_incremental(filename):
+            manager.prune_chunk_store()
+
         return jsonify({'message': 'Backup deleted successfully'}), 200
     except Exception as e:
         logger.error(f'Error deleting backup: {str(e)}')
@@ -4,8 +4,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 import json
-import yaml
 
+from ..utils import yaml_io
 from .mappings import TargetApp, ValueResolver
 
 
@@ -172,7 +172,7 @@ class FormatProcessor:
         patterns = {}
         for file_path in patterns_dir.glob('*.yml'):
             with file_path.open('r') as f:
-                pattern_data = yaml.safe_load(f)
+                pattern_data = yaml_io.load(f)
                 patterns[pattern_data['name']] = pattern_data['pattern']
         return patterns
 
@@ -182,7 +182,7 @@ class FormatProcessor:
             return None
 
         with format_path.open('r') as f:
-            raw_data = yaml.safe_load(f)
+            raw_data = yaml_io.load(f)
             return CustomFormat(**raw_data)
 
     def process_format(self,
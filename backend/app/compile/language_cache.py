@@ -0,0 +1,115 @@
+# app/compile/language_cache.py
+"""Cache of the language format templates and the variants built from them"""
+from collections import OrderedDict
+import copy
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..data.utils import get_category_directory
+from ..utils import yaml_io
+from ..metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+# Custom formats every language variant is derived from
+LANGUAGE_TEMPLATES = ('Not English', 'Not Only English',
+                      'Not Only English (Missing)')
+
+# Template files are re-checked at most this often, so an import that
+# builds variants for many languages stats them once rather than per
+# profile
+TEMPLATE_CHECK_SECONDS = 2
+MAX_CACHED_VARIANTS = 256
+
+
+class LanguageFormatCache:
+    """
+    Keeps the parsed language templates in memory with the SHA-256 of
+    each file and caches built variants under (kind, behaviour, language,
+    arr_type, template digests). Editing or pulling a template changes its
+    digest, so stale variants are never served; they simply age out.
+    """
+
+    def __init__(self):
+        self._templates = {}  # name -> (stat key, digest, data)
+        self._variants = OrderedDict()
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        now = time.monotonic()
+        if (self._checked_at is not None
+                and now - self._checked_at < TEMPLATE_CHECK_SECONDS):
+            return
+        directory = get_category_directory('custom_format')
+        for name in LANGUAGE_TEMPLATES:
+            path = os.path.join(directory, f'{name}.yml')
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                self._templates.pop(name, None)
+                continue
+            stat_key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            cached = self._templates.get(name)
+            if cached and cached[0] == stat_key:
+                continue
+            with open(path, 'rb') as f:
+                content = f.read()
+            self._templates[name] = (stat_key,
+                                     hashlib.sha256(content).hexdigest(),
+                                     yaml_io.load(content))
+            logger.debug(f'Loaded language template {name}')
+        self._checked_at = now
+
+    def get_variants(
+        self, kind: str, behaviour: str, language: str, arr_type: str,
+        build: Callable[[Dict[str, Any]], List[Dict]]
+    ) -> List[Dict]:
+        """
+        Return the variants for a language, calling build(templates) on a
+        miss. `kind` separates callers that build differently shaped
+        variants. Callers get their own copies and may modify them.
+        """
+        with self._lock:
+            self._refresh()
+            digests: Tuple[Optional[str], ...] = tuple(
+                self._templates[name][1] if name in self._templates else None
+                for name in LANGUAGE_TEMPLATES)
+            key = (kind, behaviour, language, str(arr_type), digests)
+            variants = self._variants.get(key)
+            if variants is not None:
+                self._variants.move_to_end(key)
+                record_cache('language_formats', hits=1)
+                return copy.deepcopy(variants)
+            record_cache('language_formats', misses=1)
+            templates = {
+                name: copy.deepcopy(entry[2])
+                for name, entry in self._templates.items()
+            }
+
+        variants = build(templates)
+        with self._lock:
+            self._variants[key] = variants
+            while len(self._variants) > MAX_CACHED_VARIANTS:
+                self._variants.popitem(last=False)
+        return copy.deepcopy(variants)
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+            self._variants.clear()
+            self._checked_at = None
+
+
+language_format_cache = LanguageFormatCache()
+
+
+def get_template(templates: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """A template passed to a build callback, or FileNotFoundError"""
+    if name not in templates:
+        raise FileNotFoundError(f"Language template not found: {name}.yml")
+    return templates[name]
@@ -1,8 +1,14 @@
 # app/compile/mappings.py
 """Centralized constants and mappings for arr applications"""
+from collections import namedtuple
 from enum import Enum, auto
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional
 import logging
+import sys
+
+from ..metrics import register_lru_cache
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -879,18 +885,12 @@ class QualityNameMapper:
         if not name:
             return name
 
-        # First check for remux mappings
-        if name in cls.REMUX_MAPPINGS.get(target_app, {}):
-            return cls.REMUX_MAPPINGS[target_app][name]
-
-        # Then check for alternate spellings
-        normalized_name = name.upper().replace("-", "").replace("_", "")
-        for alt_name, standard_name in cls.ALTERNATE_NAMES.items():
-            if normalized_name == alt_name.upper().replace("-", "").replace(
-                    "_", ""):
-                return standard_name
+        return _map_quality_name(name, target_app)
 
-        return name
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Key used to compare alternate spellings"""
+        return name.upper().replace("-", "").replace("_", "")
 
 
 class LanguageNameMapper:
@@ -918,44 +918,198 @@ class LanguageNameMapper:
         if not name:
             return name
 
-        normalized = name.lower().replace(" ", "_")
-        return cls.ALTERNATE_NAMES.get(normalized, normalized)
+        return _normalize_language_name(name)
+
+
+# Lookup tables compiled once at import time. Keys are pre-normalized and
+# interned, and every table is read-only so both compile and importer can
+# share them safely between threads.
+LookupTables = namedtuple('LookupTables', [
+    'indexer_flags', 'sources', 'qualities', 'quality_names', 'languages'
+])
+
+
+def _freeze(mapping: Dict[str, Any]) -> MappingProxyType:
+    return MappingProxyType({sys.intern(k): v for k, v in mapping.items()})
+
+
+def _build_quality_names(target_app: TargetApp) -> MappingProxyType:
+    """Exact spellings -> mapped quality name, remux names first"""
+    names = dict(QualityNameMapper.ALTERNATE_NAMES)
+    names.update(QualityNameMapper.REMUX_MAPPINGS[target_app])
+    return _freeze(names)
+
+
+def _build_quality_aliases() -> MappingProxyType:
+    """Normalized alternate spelling -> standard quality name"""
+    return _freeze({
+        QualityNameMapper.normalize(alt_name): standard_name
+        for alt_name, standard_name in QualityNameMapper.ALTERNATE_NAMES.items()
+    })
+
+
+def _build_languages(languages: Dict[str, Any]) -> MappingProxyType:
+    """Normalized and alternate language names -> language data"""
+    table = dict(languages)
+    for alt_name, normalized in LanguageNameMapper.ALTERNATE_NAMES.items():
+        if normalized in languages:
+            table[alt_name] = languages[normalized]
+    return _freeze(table)
+
+
+TABLES = MappingProxyType({
+    TargetApp.RADARR:
+    LookupTables(indexer_flags=_freeze(IndexerFlags.RADARR),
+                 sources=_freeze(Sources.RADARR),
+                 qualities=Qualities.RADARR,
+                 quality_names=_build_quality_names(TargetApp.RADARR),
+                 languages=_build_languages(Languages.RADARR)),
+    TargetApp.SONARR:
+    LookupTables(indexer_flags=_freeze(IndexerFlags.SONARR),
+                 sources=_freeze(Sources.SONARR),
+                 qualities=Qualities.SONARR,
+                 quality_names=_build_quality_names(TargetApp.SONARR),
+                 languages=_build_languages(Languages.SONARR))
+})
+QUALITY_ALIASES = _build_quality_aliases()
+RESOLUTIONS = _freeze(Qualities.COMMON_RESOLUTIONS)
+QUALITY_MODIFIERS = _freeze(Quality_Modifiers.RADARR)
+RELEASE_TYPES = _freeze(Release_Types.SONARR)
+SONARR_PROFILE_LANGUAGE = MappingProxyType({'id': -2, 'name': 'Original'})
+
+
+_RADARR_TABLES = TABLES[TargetApp.RADARR]
+_SONARR_TABLES = TABLES[TargetApp.SONARR]
+
+
+def _tables(target_app: TargetApp) -> LookupTables:
+    # Identity check; hashing an Enum member runs Python code
+    return _RADARR_TABLES if target_app is TargetApp.RADARR else _SONARR_TABLES
+
+
+# Inputs come from a small, fixed set of YAML spellings, so memoizing the
+# string normalization keeps it out of the per-condition cost
+@lru_cache(maxsize=1024)
+def _normalize_language_name(name: str) -> str:
+    normalized = name.lower().replace(" ", "_")
+    return sys.intern(
+        LanguageNameMapper.ALTERNATE_NAMES.get(normalized, normalized))
+
+
+@lru_cache(maxsize=1024)
+def _quality_alias(name: str) -> str:
+    return QUALITY_ALIASES.get(QualityNameMapper.normalize(name), name)
+
+
+register_lru_cache('language_names', _normalize_language_name)
+register_lru_cache('quality_aliases', _quality_alias)
+
+
+def _map_quality_name(name: str, target_app: TargetApp) -> str:
+    mapped = _tables(target_app).quality_names.get(name)
+    if mapped is not None:
+        return mapped
+    return _quality_alias(name)
+
+
+# Immutable per-app quality templates for building profiles: frozen
+# quality data by name, a lowercase -> name lookup and every quality in
+# the order unused ones are emitted as disabled items.
+QualityTemplate = namedtuple('QualityTemplate',
+                             ['qualities', 'lookup', 'ordered'])
+
+
+def _build_quality_template(qualities: Dict[str, Any]) -> QualityTemplate:
+    frozen = {
+        sys.intern(name): MappingProxyType(dict(data))
+        for name, data in qualities.items()
+    }
+    return QualityTemplate(
+        qualities=MappingProxyType(frozen),
+        lookup=MappingProxyType({name.lower(): name
+                                 for name in frozen}),
+        ordered=tuple(frozen.values()))
+
+
+_RADARR_QUALITIES = _build_quality_template(Qualities.RADARR)
+_SONARR_QUALITIES = _build_quality_template(Qualities.SONARR)
+
+
+def _quality_template(target_app: TargetApp) -> QualityTemplate:
+    if target_app is TargetApp.RADARR:
+        return _RADARR_QUALITIES
+    return _SONARR_QUALITIES
+
+
+def _resolve_quality(name: str, target_app: TargetApp) -> Optional[str]:
+    if not name:
+        return None
+    template = _quality_template(target_app)
+    mapped = _map_quality_name(name, target_app)
+    if mapped in template.qualities:
+        return mapped
+    return (template.lookup.get(mapped.lower())
+            or template.lookup.get(name.lower()))
 
 
 class ValueResolver:
     """Helper class to resolve values based on target app"""
 
+    # Table values are never None, so a miss on the exact key falls back
+    # to the lowercased one without a second sentinel
+
     @classmethod
     def get_indexer_flag(cls, flag: str, target_app: TargetApp) -> int:
-        flags = IndexerFlags.RADARR if target_app == TargetApp.RADARR else IndexerFlags.SONARR
-        return flags.get(flag.lower(), 0)
+        flags = _tables(target_app).indexer_flags
+        value = flags.get(flag)
+        return value if value is not None else flags.get(flag.lower(), 0)
 
     @classmethod
     def get_source(cls, source: str, target_app: TargetApp) -> int:
-        sources = Sources.RADARR if target_app == TargetApp.RADARR else Sources.SONARR
-        return sources.get(source.lower(), 0)
+        sources = _tables(target_app).sources
+        value = sources.get(source)
+        return value if value is not None else sources.get(source.lower(), 0)
 
     @classmethod
     def get_resolution(cls, resolution: str) -> int:
-        return Qualities.COMMON_RESOLUTIONS.get(resolution.lower(), 0)
+        value = RESOLUTIONS.get(resolution)
+        return value if value is not None else RESOLUTIONS.get(
+            resolution.lower(), 0)
 
     @classmethod
     def get_qualities(cls, target_app: TargetApp) -> Dict[str, Any]:
-        qualities = Qualities.RADARR if target_app == TargetApp.RADARR else Qualities.SONARR
-        return qualities
+        return _tables(target_app).qualities
 
     @classmethod
     def get_quality_name(cls, name: str, target_app: TargetApp) -> str:
         """Maps quality names between different formats based on target app"""
         return QualityNameMapper.map_quality_name(name, target_app)
 
+    @classmethod
+    def get_quality_template(cls, target_app: TargetApp) -> QualityTemplate:
+        return _quality_template(target_app)
+
+    @classmethod
+    def resolve_quality(cls, name: str,
+                        target_app: TargetApp) -> Optional[str]:
+        """
+        Template key for a quality name as written in YAML: the mapped
+        name, then a case-insensitive match on the mapped or original
+        name. Returns None for qualities the target app doesn't have.
+        """
+        return _resolve_quality(name, target_app)
+
     @classmethod
     def get_quality_modifier(cls, quality_modifier: str) -> int:
-        return Quality_Modifiers.RADARR.get(quality_modifier.lower(), 0)
+        value = QUALITY_MODIFIERS.get(quality_modifier)
+        return value if value is not None else QUALITY_MODIFIERS.get(
+            quality_modifier.lower(), 0)
 
     @classmethod
     def get_release_type(cls, release_type: str) -> int:
-        return Release_Types.SONARR.get(release_type.lower(), 0)
+        value = RELEASE_TYPES.get(release_type)
+        return value if value is not None else RELEASE_TYPES.get(
+            release_type.lower(), 0)
 
     @classmethod
     def get_language(cls,
@@ -970,11 +1124,14 @@ class ValueResolver:
             target_app: Target application (RADARR or SONARR)
             for_profile: If True, this is for a quality profile. If False, this is for a custom format.
         """
-        languages = Languages.RADARR if target_app == TargetApp.RADARR else Languages.SONARR
-
         # For profiles, only Radarr uses language settings
         if for_profile and target_app == TargetApp.SONARR:
-            return {'id': -2, 'name': 'Original'}
+            return dict(SONARR_PROFILE_LANGUAGE)
+
+        languages = _tables(target_app).languages
+        language_data = languages.get(language_name)
+        if language_data:
+            return language_data
 
         # Normalize the language name
         normalized_name = LanguageNameMapper.normalize_language_name(
@@ -3,14 +3,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable
 import json
-import yaml
 import logging
 import asyncio
 import aiohttp
 
+from ..utils import yaml_io
 from .mappings import TargetApp, ValueResolver
-from ..data.utils import load_yaml_file, get_category_directory
-from ..importarr.format_memory import import_format_from_memory, async_import_format_from_memory
+from .language_cache import language_format_cache, get_template
 from ..db.queries.settings import get_language_import_score
 
 logger = logging.getLogger(__name__)
@@ -44,26 +43,20 @@ class ProfileConverter:
         self.api_key = api_key
         self.format_importer = format_importer
         self.import_as_unique = import_as_unique
-        self.quality_mappings = ValueResolver.get_qualities(target_app)
+        self.quality_template = ValueResolver.get_quality_template(
+            target_app)
 
     def _convert_group_id(self, group_id: int) -> int:
         if group_id < 0:
             return 1000 + abs(group_id)
         return group_id
 
-    def _create_all_qualities(self,
-                              allowed_qualities: List[str]) -> List[Dict]:
-        qualities = []
-        for quality_name in allowed_qualities:
-            if quality_name in self.quality_mappings:
-                qualities.append({
-                    "quality":
-                    self.quality_mappings[quality_name].copy(),
-                    "items": [],
-                    "allowed":
-                    True
-                })
-        return qualities
+    def _quality_item(self, quality_name: str, allowed: bool = True) -> Dict:
+        return {
+            "quality": dict(self.quality_template.qualities[quality_name]),
+            "items": [],
+            "allowed": allowed
+        }
 
     def _generate_language_formats(self,
                                behaviour: str,
@@ -80,60 +73,63 @@ class ProfileConverter:
             List of format configurations for the specified language
         """
         try:
-            formats_to_import = []
-            
-            # Get the base format as a template
-            base_format_path = f"{get_category_directory('custom_format')}/Not English.yml"
-            base_format = load_yaml_file(base_format_path)
-            
-            # Get language data for translations
-            language_data = ValueResolver.get_language(
-                language, self.target_app, for_profile=False
-            )
-            
-            # Create the main "Not X" format (e.g., "Not French")
-            modified_format = base_format.copy()
-            base_name = f"Not {language_data['name']}"
-            modified_format['name'] = base_name
-            
-            # Update conditions to refer to the specific language
-            for condition in modified_format['conditions']:
-                if condition.get('type') == 'language':
-                    condition['language'] = language
-                    if condition.get('name') == 'Not English':
-                        condition['name'] = f"Not {language_data['name']}"
-                    elif condition.get('name') == 'Includes English':
-                        condition['name'] = f"Includes {language_data['name']}"
-            
-            formats_to_import.append(modified_format)
-            
-            # Add additional formats for 'only' behavior
-            if behaviour == 'only':
-                additional_formats = [
-                    "Not Only English", "Not Only English (Missing)"
-                ]
-                for format_name in additional_formats:
-                    format_path = f"{get_category_directory('custom_format')}/{format_name}.yml"
-                    format_data = load_yaml_file(format_path)
-                    format_data['name'] = format_data['name'].replace(
-                        'English', language_data['name'])
-                    
-                    for c in format_data.get('conditions', []):
-                        if c.get('type') == 'language':
-                            c['language'] = language
-                            if c.get('name') == 'Not English':
-                                c['name'] = f"Not {language_data['name']}"
-                            elif c.get('name') == 'Includes English':
-                                c['name'] = f"Includes {language_data['name']}"
-                    
-                    formats_to_import.append(format_data)
-            
-            return formats_to_import
-            
+            return language_format_cache.get_variants(
+                'compile', behaviour, language, self.target_app,
+                lambda templates: self._build_language_formats(
+                    templates, behaviour, language))
+
         except Exception as e:
             logger.error(f"Error generating language formats: {str(e)}")
             raise
 
+    def _build_language_formats(self, templates: Dict[str, Any],
+                                behaviour: str,
+                                language: str) -> List[Dict]:
+        formats_to_import = []
+
+        # Get language data for translations
+        language_data = ValueResolver.get_language(
+            language, self.target_app, for_profile=False
+        )
+
+        # Create the main "Not X" format (e.g., "Not French")
+        modified_format = get_template(templates, 'Not English')
+        base_name = f"Not {language_data['name']}"
+        modified_format['name'] = base_name
+
+        # Update conditions to refer to the specific language
+        for condition in modified_format['conditions']:
+            if condition.get('type') == 'language':
+                condition['language'] = language
+                if condition.get('name') == 'Not English':
+                    condition['name'] = f"Not {language_data['name']}"
+                elif condition.get('name') == 'Includes English':
+                    condition['name'] = f"Includes {language_data['name']}"
+
+        formats_to_import.append(modified_format)
+
+        # Add additional formats for 'only' behavior
+        if behaviour == 'only':
+            additional_formats = [
+                "Not Only English", "Not Only English (Missing)"
+            ]
+            for format_name in additional_formats:
+                format_data = get_template(templates, format_name)
+                format_data['name'] = format_data['name'].replace(
+                    'English', language_data['name'])
+
+                for c in format_data.get('conditions', []):
+                    if c.get('type') == 'language':
+                        c['language'] = language
+                        if c.get('name') == 'Not English':
+                            c['name'] = f"Not {language_data['name']}"
+                        elif c.get('name') == 'Includes English':
+                            c['name'] = f"Includes {language_data['name']}"
+
+                formats_to_import.append(format_data)
+
+        return formats_to_import
+
     def _process_language_formats(
             self,
             behaviour: str,
@@ -206,6 +202,9 @@ class ProfileConverter:
                     import_as_unique=import_as_unique
                 ))
             
+            # importarr imports this module, so import it lazily
+            from ..importarr.format_memory import import_format_from_memory
+
             # For single format, use regular synchronous version
             for format_data in formats_to_import:
                 try:
@@ -250,6 +249,8 @@ class ProfileConverter:
         """
         Asynchronous version of _process_language_formats for concurrent imports
         """
+        from ..importarr.format_memory import async_import_format_from_memory
+
         logger.info(f"Processing language formats asynchronously: {len(formats_to_import)} formats")
         format_configs = []
         tasks = []
@@ -293,27 +294,16 @@ class ProfileConverter:
         original_id = group.get("id", 0)
         converted_id = self._convert_group_id(original_id)
 
-        allowed_qualities = []
+        items = []
         for q_item in group.get("qualities", []):
-            input_name = q_item.get("name", "")
-
-            # First map the quality name to handle remux qualities properly
-            mapped_name = ValueResolver.get_quality_name(
-                input_name, self.target_app)
-
-            # Create a case-insensitive lookup map
-            quality_map = {k.lower(): k for k in self.quality_mappings}
-
-            # Try to find the mapped name in quality mappings
-            if mapped_name.lower() in quality_map:
-                allowed_qualities.append(quality_map[mapped_name.lower()])
-            # Fallback to the original name
-            elif input_name.lower() in quality_map:
-                allowed_qualities.append(quality_map[input_name.lower()])
+            quality_name = ValueResolver.resolve_quality(
+                q_item.get("name", ""), self.target_app)
+            if quality_name:
+                items.append(self._quality_item(quality_name))
 
         converted_group = {
             "name": group["name"],
-            "items": self._create_all_qualities(allowed_qualities),
+            "items": items,
             "allowed": True,
             "id": converted_id
         }
@@ -371,44 +361,29 @@ class ProfileConverter:
                                          profile.get("minScoreIncrement", 1)),
             language=selected_language)
 
-        used_qualities = set()
-        quality_ids_in_groups = set()
-        
-        # First pass: Gather all quality IDs in groups to avoid duplicates
-        for quality_entry in profile.get("qualities", []):
-            if quality_entry.get("id", 0) < 0:  # It's a group
-                # Process this group to collect quality IDs
-                converted_group = self.convert_quality_group(quality_entry)
-                for item in converted_group["items"]:
-                    if "quality" in item and "id" in item["quality"]:
-                        quality_ids_in_groups.add(item["quality"]["id"])
-
-        # Second pass: Add groups and individual qualities to the profile
+        # Single pass over the profile: each group is converted once and
+        # the quality IDs it uses are collected as we go
+        used_ids = set()
         for quality_entry in profile.get("qualities", []):
             if quality_entry.get("id", 0) < 0:  # It's a group
                 converted_group = self.convert_quality_group(quality_entry)
                 if converted_group["items"]:
                     converted_profile.items.append(converted_group)
-                    for q in quality_entry.get("qualities", []):
-                        used_qualities.add(q.get("name", "").upper())
+                    used_ids.update(item["quality"]["id"]
+                                    for item in converted_group["items"])
             else:  # It's a single quality
-                quality_name = quality_entry.get("name")
-                mapped_name = ValueResolver.get_quality_name(
-                    quality_name, self.target_app)
-                if mapped_name in self.quality_mappings:
-                    converted_profile.items.append({
-                        "quality": self.quality_mappings[mapped_name],
-                        "items": [],
-                        "allowed": True
-                    })
-                    used_qualities.add(mapped_name.upper())
-
-        # Add all unused qualities as disabled, but skip those already in groups
-        for quality_name, quality_data in self.quality_mappings.items():
-            if (quality_name.upper() not in used_qualities and 
-                quality_data["id"] not in quality_ids_in_groups):
+                quality_name = ValueResolver.resolve_quality(
+                    quality_entry.get("name"), self.target_app)
+                if quality_name:
+                    item = self._quality_item(quality_name)
+                    converted_profile.items.append(item)
+                    used_ids.add(item["quality"]["id"])
+
+        # Add all unused qualities as disabled
+        for quality_data in self.quality_template.ordered:
+            if quality_data["id"] not in used_ids:
                 converted_profile.items.append({
-                    "quality": quality_data,
+                    "quality": dict(quality_data),
                     "items": [],
                     "allowed": False
                 })
@@ -417,14 +392,13 @@ class ProfileConverter:
             cutoff_id = profile["upgrade_until"]["id"]
             cutoff_name = profile["upgrade_until"]["name"]
 
-            mapped_cutoff_name = ValueResolver.get_quality_name(
-                cutoff_name, self.target_app)
-
             if cutoff_id < 0:
                 converted_profile.cutoff = self._convert_group_id(cutoff_id)
             else:
-                converted_profile.cutoff = self.quality_mappings[
-                    mapped_cutoff_name]["id"]
+                cutoff_quality = ValueResolver.resolve_quality(
+                    cutoff_name, self.target_app)
+                converted_profile.cutoff = self.quality_template.qualities[
+                    cutoff_quality]["id"]
 
         for cf in profile.get("custom_formats", []):
             format_item = {"name": cf["name"], "score": cf["score"]}
@@ -471,7 +445,7 @@ class ProfileProcessor:
         if not profile_path.exists():
             return None
         with profile_path.open('r') as f:
-            return yaml.safe_load(f)
+            return yaml_io.load(f)
 
     def process_profile(
             self,
@@ -18,10 +18,29 @@ class Config:
     GENERAL_LOG_FILE = os.path.join(LOG_DIR, 'profilarr.log')
     IMPORTARR_LOG_FILE = os.path.join(LOG_DIR, 'importarr.log')
     HASH_LOG_FILE = os.path.join(LOG_DIR, 'hash.log')
+    # Recent lines kept in memory per followed log, and how long a single
+    # live log stream stays open before the client reconnects
+    LOG_STREAM_BUFFER_LINES = int(os.getenv('LOG_STREAM_BUFFER_LINES', '2000'))
+    LOG_STREAM_MAX_SECONDS = int(os.getenv('LOG_STREAM_MAX_SECONDS', '300'))
+    # Live log streams open at once per worker. Each holds one of the
+    # server's 8 request threads, so keep this well below that.
+    LOG_STREAM_MAX_CONCURRENT = max(
+        1, int(os.getenv('LOG_STREAM_MAX_CONCURRENT', '2')))
+
+    # Request profiling
+    # Where profiled requests are written and how many of them are kept
+    PROFILING_DIR = os.path.join(LOG_DIR, 'profiles')
+    PROFILING_KEEP = int(os.getenv('PROFILING_KEEP', '50'))
+    # How often the sampling profiler records the request's stack
+    PROFILING_SAMPLE_INTERVAL_MS = float(
+        os.getenv('PROFILING_SAMPLE_INTERVAL_MS', '5'))
 
     # Flask Configuration
     FLASK_ENV = os.getenv('FLASK_ENV', 'production')
     DEBUG = FLASK_ENV == 'development'
+    # Serve before the heavier subsystems (git, data, imports, arr) are
+    # loaded and the scheduler is started; they follow in the background
+    LAZY_STARTUP = os.getenv('LAZY_STARTUP', 'true').lower() == 'true'
 
     # CORS Configuration
     CORS_ORIGINS = "*"
@@ -32,6 +51,28 @@ class Config:
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
 
+    # Scheduler Configuration
+    # Only the worker holding the scheduler lease runs scheduled tasks
+    SCHEDULER_LEASE_SECONDS = int(os.getenv('SCHEDULER_LEASE_SECONDS', '30'))
+    SCHEDULER_LEASE_RENEW_SECONDS = max(
+        1, SCHEDULER_LEASE_SECONDS // 3)
+    # Cap on arr sync tasks running at once across all arr servers
+    MAX_CONCURRENT_SYNC_TASKS = max(
+        1, int(os.getenv('MAX_CONCURRENT_SYNC_TASKS', '2')))
+    # Number of runs kept per task in the task_runs history
+    TASK_RUN_HISTORY_LIMIT = int(os.getenv('TASK_RUN_HISTORY_LIMIT', '200'))
+
+    # Backup Configuration
+    # 'full' writes a standalone zip, 'incremental' a manifest over a
+    # deduplicated chunk store
+    BACKUP_MODE = os.getenv('BACKUP_MODE', 'full').lower()
+    # 'default', 'fast' (lower ratio, much less CPU) or 'none'
+    BACKUP_COMPRESSION = os.getenv('BACKUP_COMPRESSION', 'default').lower()
+    # Threads compressing incremental backup chunks
+    BACKUP_WORKERS = max(1, int(os.getenv('BACKUP_WORKERS', '2')))
+    # Cap on backup read throughput in MB/s, 0 for unlimited
+    BACKUP_THROTTLE_MBPS = float(os.getenv('BACKUP_THROTTLE_MBPS', '0'))
+
     # Git Configuration
     GIT_USER_NAME = os.getenv('GIT_USER_NAME')
     GIT_USER_EMAIL = os.getenv('GIT_USER_EMAIL')
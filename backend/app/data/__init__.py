@@ -1,58 +1,144 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, make_response
 import logging
 import os
-import yaml
+from ..utils import yaml_io
 from .utils import (get_category_directory, load_yaml_file, validate,
                     save_yaml_file, update_yaml_file, get_file_modified_date,
                     test_regex_pattern, test_format_conditions,
-                    check_delete_constraints, filename_to_display)
-from ..db import add_format_to_renames, remove_format_from_renames, is_format_in_renames
+                    check_delete_constraints, filename_to_display,
+                    category_etag, file_etag, SUMMARY_FIELDS)
+from .summary_index import summary_index
+from ..utils.json_stream import stream_json
+from ..utils.repo_lock import serialize_writes
+from ..db import (add_format_to_renames, remove_format_from_renames,
+                  is_format_in_renames, get_format_renames)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 bp = Blueprint('data', __name__)
+serialize_writes(bp)
+
+
+def _with_etag(response, etag):
+    """Tag a response and make clients revalidate before reusing it"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _not_modified(etag):
+    """A 304 response if the client already holds this version, else None"""
+    if request.if_none_match.contains_weak(etag):
+        return _with_etag(make_response('', 304), etag)
+    return None
+
+
+def _parse_list_args(category):
+    """
+    Read the listing options: summary mode, a `fields` projection and
+    limit/cursor paging. Raises ValueError for bad values.
+    """
+    summary = request.args.get('summary', '').lower() in ('1', 'true', 'yes')
+    fields = request.args.get('fields')
+    fields = [f.strip() for f in fields.split(',') if f.strip()] if fields else None
+    limit = request.args.get('limit')
+    if limit is not None:
+        if not limit.isdigit() or int(limit) < 1:
+            raise ValueError("limit must be a positive integer")
+        limit = int(limit)
+    cursor = request.args.get('cursor')
+    # Summaries answer any projection that stays within them
+    if fields and not summary:
+        summary_fields, _ = SUMMARY_FIELDS[category]
+        summary = set(fields) <= set(summary_fields) | {'counts', 'metadata'}
+    return summary, fields, limit, cursor
 
 
 @bp.route('/<string:category>', methods=['GET'])
 def retrieve_all(category):
     try:
         directory = get_category_directory(category)
-        files = [f for f in os.listdir(directory) if f.endswith('.yml')]
+        summary, fields, limit, cursor = _parse_list_args(category)
+        renames = (get_format_renames()
+                   if category == 'custom_format' else None)
+        etag = category_etag(directory, renames,
+                             request.query_string.decode())
+        not_modified = _not_modified(etag)
+        if not_modified:
+            return not_modified
+
+        files = sorted(f for f in os.listdir(directory) if f.endswith('.yml'))
         logger.debug(f"Found {len(files)} files in {category}")
 
-        if not files:
-            return jsonify([]), 200
+        # Pages are ordered by file name; the cursor is the last file
+        # name of the previous page
+        page = [f for f in files if f > cursor] if cursor else files
+        next_cursor = None
+        if limit is not None and len(page) > limit:
+            page = page[:limit]
+            next_cursor = page[-1]
+
+        summaries = (summary_index.summaries(category, directory, page, files)
+                     if summary else None)
+        renamed = set(renames or [])
+
+        def iter_items():
+            errors = 0
+            for file_name in page:
+                file_path = os.path.join(directory, file_name)
+                if summary:
+                    # Files deleted while listing are skipped
+                    if file_name not in summaries:
+                        continue
+                    content = summaries[file_name]
+                    content = dict(content) if content is not None else None
+                else:
+                    try:
+                        content = load_yaml_file(file_path)
+                    except FileNotFoundError:
+                        continue
+                    except yaml_io.YAMLError:
+                        content = None
+                    if not isinstance(content, dict):
+                        content = None
+
+                if content is None:
+                    errors += 1
+                    yield {
+                        "file_name": file_name,
+                        "error": "Failed to parse YAML"
+                    }
+                    continue
 
-        result = []
-        errors = 0
-        for file_name in files:
-            file_path = os.path.join(directory, file_name)
-            try:
-                content = load_yaml_file(file_path)
                 # Add metadata for custom formats
                 if category == 'custom_format':
                     content['metadata'] = {
-                        'includeInRename':
-                        is_format_in_renames(content['name'])
+                        'includeInRename': content.get('name') in renamed
+                    }
+                if fields:
+                    content = {
+                        field: content[field]
+                        for field in fields if field in content
                     }
-                result.append({
-                    "file_name":
-                    file_name,
-                    "content":
-                    content,
-                    "modified_date":
-                    get_file_modified_date(file_path)
-                })
-            except yaml.YAMLError:
-                errors += 1
-                result.append({
+                yield {
                     "file_name": file_name,
-                    "error": "Failed to parse YAML"
-                })
+                    "content": content,
+                    "modified_date": get_file_modified_date(file_path)
+                }
 
-        logger.info(
-            f"Processed {len(files)} {category} files ({errors} errors)")
-        return jsonify(result), 200
+            logger.info(
+                f"Processed {len(page)} {category} files ({errors} errors)")
+
+        # Items are encoded as they are read, so memory stays flat no
+        # matter how large the category is
+        if limit is None and cursor is None:
+            return _with_etag(stream_json(iter_items()), etag)
+        return _with_etag(
+            stream_json({
+                "items": iter_items(),
+                "next_cursor": next_cursor,
+                "total": len(files)
+            }), etag)
 
     except ValueError as ve:
         logger.error(ve)
@@ -75,24 +161,34 @@ def handle_item(category, name):
 
         if request.method == 'GET':
             try:
+                renames = (get_format_renames()
+                           if category == 'custom_format' else None)
+                etag = file_etag(file_path, renames)
+                not_modified = _not_modified(etag)
+                if not_modified:
+                    return not_modified
+
                 content = load_yaml_file(file_path)
+                if not isinstance(content, dict):
+                    return jsonify(
+                        {"error": f"Failed to parse YAML file {file_name}"}), 500
                 # Add metadata for custom formats
                 if category == 'custom_format':
                     content['metadata'] = {
-                        'includeInRename':
-                        is_format_in_renames(content['name'])
+                        'includeInRename': content.get('name') in renames
                     }
-                return jsonify({
-                    "file_name":
-                    file_name,
-                    "content":
-                    content,
-                    "modified_date":
-                    get_file_modified_date(file_path)
-                }), 200
+                return _with_etag(
+                    jsonify({
+                        "file_name":
+                        file_name,
+                        "content":
+                        content,
+                        "modified_date":
+                        get_file_modified_date(file_path)
+                    }), etag), 200
             except FileNotFoundError:
                 return jsonify({"error": f"File {file_name} not found"}), 404
-            except yaml.YAMLError:
+            except yaml_io.YAMLError:
                 return jsonify(
                     {"error": f"Failed to parse YAML file {file_name}"}), 500
 
@@ -0,0 +1,83 @@
+# app/data/summary_index.py
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from .utils import SUMMARY_FIELDS, load_yaml_file
+from ..utils import yaml_io
+from ..metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+
+def summarize(category: str, content: Dict[str, Any]) -> Dict[str, Any]:
+    """The list-view subset of a file's content"""
+    fields, counted = SUMMARY_FIELDS[category]
+    summary = {field: content[field] for field in fields if field in content}
+    summary['counts'] = {
+        field: len(content.get(field) or [])
+        for field in counted
+    }
+    return summary
+
+
+class SummaryIndex:
+    """
+    Per-file summaries for each category directory, keyed by the file's
+    inode, size and mtime. Listing a category only parses files that
+    changed since the last listing; everything else comes from memory.
+    """
+
+    def __init__(self):
+        self._entries = {}  # directory -> {file_name: (stat key, summary)}
+        self._lock = threading.Lock()
+
+    def summaries(self,
+                  category: str,
+                  directory: str,
+                  file_names: List[str],
+                  present: List[str] = None) -> Dict[str, Optional[Dict]]:
+        """
+        Summaries for `file_names`, or None for files that failed to
+        parse or don't hold a mapping. Files that disappeared while listing are left out.
+        `present` is every file currently in the directory; cached
+        entries for any other file are dropped.
+        """
+        with self._lock:
+            cached = self._entries.setdefault(directory, {})
+            if present is not None:
+                for file_name in set(cached) - set(present):
+                    del cached[file_name]
+
+            result = {}
+            misses = 0
+            for file_name in file_names:
+                file_path = os.path.join(directory, file_name)
+                try:
+                    stats = os.stat(file_path)
+                except FileNotFoundError:
+                    cached.pop(file_name, None)
+                    continue
+                stat_key = (stats.st_ino, stats.st_size, stats.st_mtime_ns)
+                entry = cached.get(file_name)
+                if entry is None or entry[0] != stat_key:
+                    misses += 1
+                    try:
+                        content = load_yaml_file(file_path)
+                    except FileNotFoundError:
+                        cached.pop(file_name, None)
+                        continue
+                    except yaml_io.YAMLError:
+                        content = None
+                    # Empty or scalar documents are listed as parse errors
+                    summary = (summarize(category, content)
+                               if isinstance(content, dict) else None)
+                    entry = cached[file_name] = (stat_key, summary)
+                result[file_name] = entry[1]
+
+        record_cache('summary_index', len(result) - misses, misses)
+        return result
+
+
+summary_index = SummaryIndex()
@@ -1,5 +1,5 @@
 import os
-import yaml
+import hashlib
 import shutil
 import logging
 from datetime import datetime
@@ -7,6 +7,7 @@ from typing import Dict, List, Any, Tuple, Union
 import git
 import regex
 import logging
+from ..utils import yaml_io
 from ..db.queries.arr import update_arr_config_on_rename, update_arr_config_on_delete
 
 logger = logging.getLogger(__name__)
@@ -47,6 +48,18 @@ CATEGORY_MAP = {
 }
 
 
+# Per category: fields kept in list summaries, and list fields that
+# summaries only report a length for
+SUMMARY_FIELDS = {
+    "custom_format": (["name", "description", "tags"],
+                      ["conditions", "tests"]),
+    "regex_pattern": (["name", "pattern", "description", "tags"], ["tests"]),
+    "profile": (["name", "description", "tags", "upgradesAllowed",
+                 "language"], ["custom_formats", "custom_formats_radarr",
+                               "custom_formats_sonarr", "qualities"])
+}
+
+
 def display_to_filename(name: str) -> str:
     """Convert display name (with []) to filename (with ())"""
     return f"{name.replace('[', '(').replace(']', ')')}.yml"
@@ -58,17 +71,6 @@ def filename_to_display(filename: str) -> str:
     return name.replace('(', '[').replace(')', ']')
 
 
-def _setup_yaml_quotes():
-    """Configure YAML to quote string values"""
-
-    def str_presenter(dumper, data):
-        return dumper.represent_scalar('tag:yaml.org,2002:str',
-                                       data,
-                                       style="'")
-
-    yaml.add_representer(str, str_presenter)
-
-
 def get_file_modified_date(file_path: str) -> str:
     """Get file last modified date in ISO format"""
     try:
@@ -79,6 +81,43 @@ def get_file_modified_date(file_path: str) -> str:
         return None
 
 
+def _digest_etag(lines: List[str]) -> str:
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode('utf-8', errors='surrogateescape'))
+        digest.update(b'\n')
+    return digest.hexdigest()[:32]
+
+
+def _stat_line(name: str, stats: os.stat_result) -> str:
+    return f"{name}\0{stats.st_ino}\0{stats.st_size}\0{stats.st_mtime_ns}"
+
+
+def category_etag(directory: str,
+                  renames: List[str] = None,
+                  variant: str = '') -> str:
+    """
+    Strong ETag for a category listing, computed from the name, inode,
+    size and mtime of every .yml file without reading any of them.
+    `renames` folds the format renames table into the tag for custom
+    formats, whose listing includes it; `variant` distinguishes
+    representations of the same listing (summary, projection, page).
+    """
+    with os.scandir(directory) as entries:
+        lines = sorted(
+            _stat_line(entry.name, entry.stat()) for entry in entries
+            if entry.name.endswith('.yml') and entry.is_file())
+    return _digest_etag(lines + ['renames'] + list(renames or []) +
+                        ['variant', variant])
+
+
+def file_etag(file_path: str, renames: List[str] = None) -> str:
+    """Strong ETag for a single data file; see category_etag"""
+    file_path = file_path.replace('[', '(').replace(']', ')')
+    lines = [_stat_line(os.path.basename(file_path), os.stat(file_path))]
+    return _digest_etag(lines + ['renames'] + list(renames or []))
+
+
 def get_category_directory(category: str) -> str:
     try:
         directory, _ = CATEGORY_MAP[category]
@@ -102,10 +141,10 @@ def load_yaml_file(file_path: str) -> Dict[str, Any]:
 
     try:
         with open(file_path, 'r') as f:
-            content = yaml.safe_load(f)
+            content = yaml_io.load(f)
             return content
 
-    except yaml.YAMLError as e:
+    except yaml_io.YAMLError as e:
         logger.error(f"Error parsing YAML file {file_path}: {e}")
         raise
 
@@ -148,10 +187,8 @@ def save_yaml_file(file_path: str,
     _, fields = CATEGORY_MAP[category]
     ordered_data = {field: data[field] for field in fields}
 
-    _setup_yaml_quotes()
-
     with open(safe_file_path, 'w') as f:
-        yaml.safe_dump(ordered_data, f, sort_keys=False)
+        yaml_io.dump(ordered_data, f, sort_keys=False)
 
 
 def update_yaml_file(file_path: str, data: Dict[str, Any],
@@ -576,7 +613,7 @@ def test_format_conditions(conditions: List[Dict],
                 pattern_path = os.path.join(patterns_dir, pattern_file)
                 try:
                     with open(pattern_path, 'r') as f:
-                        pattern_data = yaml.safe_load(f)
+                        pattern_data = yaml_io.load(f)
                         if pattern_data and 'name' in pattern_data and 'pattern' in pattern_data:
                             pattern_map[
                                 pattern_data['name']] = pattern_data['pattern']
@@ -1,15 +1,26 @@
 from .connection import get_db
-from .queries.settings import get_settings, get_secret_key, save_settings, update_pat_status
+from .queries.settings import (get_settings, get_secret_key, save_settings,
+                               update_pat_status, get_settings_snapshot,
+                               get_settings_version)
 from .queries.arr import (get_unique_arrs, update_arr_config_on_rename,
-                          update_arr_config_on_delete)
+                          update_arr_config_on_delete, get_arr_sync_data,
+                          set_arr_sync_data, delete_arr_sync_data,
+                          get_arrs_syncing_item)
 from .queries.format_renames import (add_format_to_renames,
                                      remove_format_from_renames,
-                                     is_format_in_renames)
+                                     is_format_in_renames,
+                                     get_format_renames)
+from .queries.task_runs import (record_task_run, get_task_runs,
+                                get_task_run_stats)
 from .migrations.runner import run_migrations
 
 __all__ = [
     'get_db', 'get_settings', 'get_secret_key', 'save_settings',
     'get_unique_arrs', 'update_arr_config_on_rename',
-    'update_arr_config_on_delete', 'run_migrations', 'add_format_to_renames',
-    'remove_format_from_renames', 'is_format_in_renames', 'update_pat_status'
+    'update_arr_config_on_delete', 'get_arr_sync_data', 'set_arr_sync_data',
+    'delete_arr_sync_data', 'get_arrs_syncing_item', 'run_migrations',
+    'add_format_to_renames', 'remove_format_from_renames',
+    'is_format_in_renames', 'get_format_renames', 'update_pat_status',
+    'get_settings_snapshot', 'get_settings_version', 'record_task_run', 'get_task_runs',
+    'get_task_run_stats'
 ]
@@ -1,12 +1,48 @@
 # backend/app/db/connection.py
 import sqlite3
+import time
 from ..config import config
+from ..metrics import sqlite_queries, statement_label
 
 DB_PATH = config.DB_PATH
 
 
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that records how long each statement takes to execute"""
+
+    def execute(self, sql, *args):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, *args)
+        finally:
+            sqlite_queries.observe(time.perf_counter() - start,
+                                   statement_label(sql))
+
+    def executemany(self, sql, *args):
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, *args)
+        finally:
+            sqlite_queries.observe(time.perf_counter() - start,
+                                   statement_label(sql))
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose cursors, including the ones execute() creates
+    implicitly, are instrumented"""
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, *args):
+        return self.cursor().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        return self.cursor().executemany(sql, *args)
+
+
 def get_db():
     """Create and return a database connection with Row factory."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, factory=InstrumentedConnection)
     conn.row_factory = sqlite3.Row
     return conn
@@ -27,15 +27,28 @@ def get_applied_migrations():
         return [row[0] for row in result.fetchall()]
 
 
-def get_available_migrations():
-    """Get all migration files from versions directory."""
-    versions_dir = Path(__file__).parent / 'versions'
+VERSIONS_DIR = Path(__file__).parent / 'versions'
+
+
+def get_migration_files():
+    """Map version number (the NNN_ file name prefix) to module name."""
+    return {
+        int(file.stem.split('_', 1)[0]): file.stem
+        for file in VERSIONS_DIR.glob('[0-9]*.py')
+    }
+
+
+def get_available_migrations(versions=None):
+    """
+    Get migration files from versions directory, importing only the given
+    versions (all of them by default).
+    """
     migrations = []
 
-    for file in versions_dir.glob('[0-9]*.py'):
-        if file.stem != '__init__':
+    for version, stem in get_migration_files().items():
+        if versions is None or version in versions:
             # Import the migration module
-            module = importlib.import_module(f'.versions.{file.stem}',
+            module = importlib.import_module(f'.versions.{stem}',
                                              package='app.db.migrations')
             migrations.append((module.version, module.name, module))
 
@@ -43,10 +56,16 @@ def get_available_migrations():
 
 
 def run_migrations():
-    """Run all pending migrations in order."""
+    """
+    Run all pending migrations in order. When the schema is current this
+    is one query and a directory listing; no migration module is imported.
+    """
     init_migrations()
     applied = set(get_applied_migrations())
-    available = get_available_migrations()
+    pending = set(get_migration_files()) - applied
+    if not pending:
+        return
+    available = get_available_migrations(pending)
 
     for version, name, module in available:
         if version not in applied:
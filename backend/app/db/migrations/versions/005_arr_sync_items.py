@@ -0,0 +1,84 @@
+# backend/app/db/migrations/versions/005_arr_sync_items.py
+import json
+import logging
+from ...connection import get_db
+
+version = 5
+name = "arr_sync_items"
+
+logger = logging.getLogger(__name__)
+
+SYNC_CATEGORIES = ('customFormats', 'profiles')
+
+
+def up():
+    """Move arr_config.data_to_sync selections into an indexed join table."""
+    with get_db() as conn:
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS arr_sync_items (
+            arr_config_id INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            name TEXT NOT NULL,
+            position INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (arr_config_id, category, name),
+            FOREIGN KEY (arr_config_id) REFERENCES arr_config(id)
+                ON DELETE CASCADE
+        )
+        ''')
+
+        # Lookups by item drive rename/delete propagation and
+        # "which arrs sync this item" queries
+        conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_arr_sync_items_item
+        ON arr_sync_items (category, name)
+        ''')
+
+        # Backfill from the legacy JSON blob
+        rows = conn.execute(
+            'SELECT id, data_to_sync FROM arr_config WHERE data_to_sync IS NOT NULL'
+        ).fetchall()
+        for row in rows:
+            try:
+                data = json.loads(row['data_to_sync']) or {}
+            except json.JSONDecodeError:
+                logger.error(f"Invalid JSON in arr_config id={row['id']}")
+                continue
+
+            for category in SYNC_CATEGORIES:
+                for position, item_name in enumerate(data.get(category) or []):
+                    conn.execute(
+                        '''
+                        INSERT OR IGNORE INTO arr_sync_items
+                            (arr_config_id, category, name, position)
+                        VALUES (?, ?, ?, ?)
+                        ''', (row['id'], category, item_name, position))
+
+        # The join table is now the source of truth
+        conn.execute('UPDATE arr_config SET data_to_sync = NULL')
+        conn.commit()
+
+
+def down():
+    """Fold arr_sync_items back into arr_config.data_to_sync."""
+    with get_db() as conn:
+        rows = conn.execute('''
+            SELECT arr_config_id, category, name
+            FROM arr_sync_items
+            ORDER BY arr_config_id, category, position
+        ''').fetchall()
+
+        data_by_arr = {}
+        for row in rows:
+            data = data_by_arr.setdefault(
+                row['arr_config_id'],
+                {category: []
+                 for category in SYNC_CATEGORIES})
+            data.setdefault(row['category'], []).append(row['name'])
+
+        for arr_config_id, data in data_by_arr.items():
+            conn.execute('UPDATE arr_config SET data_to_sync = ? WHERE id = ?',
+                         (json.dumps(data), arr_config_id))
+
+        conn.execute('DROP INDEX IF EXISTS idx_arr_sync_items_item')
+        conn.execute('DROP TABLE IF EXISTS arr_sync_items')
+        conn.commit()
@@ -0,0 +1,26 @@
+# backend/app/db/migrations/versions/006_leader_leases.py
+from ...connection import get_db
+
+version = 6
+name = "leader_leases"
+
+
+def up():
+    """Add table for time-limited leader leases shared between workers."""
+    with get_db() as conn:
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS leader_leases (
+            name TEXT PRIMARY KEY NOT NULL,
+            holder TEXT NOT NULL,
+            acquired_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        )
+        ''')
+        conn.commit()
+
+
+def down():
+    """Remove the leader_leases table."""
+    with get_db() as conn:
+        conn.execute('DROP TABLE IF EXISTS leader_leases')
+        conn.commit()
@@ -0,0 +1,40 @@
+# backend/app/db/migrations/versions/007_task_runs.py
+from ...connection import get_db
+
+version = 7
+name = "task_runs"
+
+
+def up():
+    """Add table recording every execution of a scheduled task."""
+    with get_db() as conn:
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS task_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER NOT NULL,
+            started_at TIMESTAMP NOT NULL,
+            finished_at TIMESTAMP NOT NULL,
+            duration_seconds REAL NOT NULL,
+            status TEXT NOT NULL,
+            items_processed INTEGER,
+            items_failed INTEGER,
+            error TEXT,
+            FOREIGN KEY (task_id) REFERENCES scheduled_tasks(id)
+                ON DELETE CASCADE
+        )
+        ''')
+
+        # Stats and retention both read a task's most recent runs
+        conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_task_runs_task
+        ON task_runs (task_id, id)
+        ''')
+        conn.commit()
+
+
+def down():
+    """Remove the task_runs table."""
+    with get_db() as conn:
+        conn.execute('DROP INDEX IF EXISTS idx_task_runs_task')
+        conn.execute('DROP TABLE IF EXISTS task_runs')
+        conn.commit()
@@ -0,0 +1,19 @@
+# backend/app/db/migrations/versions/008_task_run_details.py
+from ...connection import get_db
+
+version = 8
+name = "task_run_details"
+
+
+def up():
+    """Add a JSON details column to task_runs (e.g. import timings)."""
+    with get_db() as conn:
+        conn.execute('ALTER TABLE task_runs ADD COLUMN details TEXT')
+        conn.commit()
+
+
+def down():
+    """Remove the details column from task_runs."""
+    with get_db() as conn:
+        conn.execute('ALTER TABLE task_runs DROP COLUMN details')
+        conn.commit()
@@ -1,5 +1,4 @@
 from ..connection import get_db
-import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,9 +33,122 @@ def get_unique_arrs(arr_ids):
         }
 
 
+SYNC_CATEGORIES = ('customFormats', 'profiles')
+
+
+def _empty_sync_data():
+    return {category: [] for category in SYNC_CATEGORIES}
+
+
+def get_arr_sync_data(arr_ids):
+    """
+    Get the selected formats/profiles for a list of arr IDs.
+    Args:
+        arr_ids (list): List of arr configuration IDs
+    Returns:
+        dict: Dictionary mapping arr IDs to {'customFormats': [...], 'profiles': [...]}
+    """
+    if not arr_ids:
+        return {}
+
+    sync_data = {arr_id: _empty_sync_data() for arr_id in arr_ids}
+
+    with get_db() as conn:
+        placeholders = ','.join('?' * len(arr_ids))
+        rows = conn.execute(
+            f'''
+            SELECT arr_config_id, category, name
+            FROM arr_sync_items
+            WHERE arr_config_id IN ({placeholders})
+            ORDER BY arr_config_id, category, position
+            ''', list(arr_ids)).fetchall()
+
+        for row in rows:
+            sync_data[row['arr_config_id']].setdefault(row['category'],
+                                                       []).append(row['name'])
+
+    return sync_data
+
+
+def _write_arr_sync_data(conn, arr_config_id, data_to_sync):
+    conn.execute('DELETE FROM arr_sync_items WHERE arr_config_id = ?',
+                 (arr_config_id, ))
+    conn.executemany(
+        '''
+        INSERT OR IGNORE INTO arr_sync_items
+            (arr_config_id, category, name, position)
+        VALUES (?, ?, ?, ?)
+        ''', [(arr_config_id, category, item_name, position)
+              for category in SYNC_CATEGORIES
+              for position, item_name in enumerate(
+                  data_to_sync.get(category) or [])])
+
+
+def set_arr_sync_data(arr_config_id, data_to_sync, conn=None):
+    """
+    Replace the selected formats/profiles for an arr config.
+    Args:
+        arr_config_id (int): arr_config row ID
+        data_to_sync (dict): {'customFormats': [...], 'profiles': [...]}
+        conn: Connection to write on as part of the caller's transaction,
+            which the caller commits. Opens and commits its own if omitted.
+    """
+    data_to_sync = data_to_sync or {}
+
+    if conn is not None:
+        _write_arr_sync_data(conn, arr_config_id, data_to_sync)
+        return
+
+    with get_db() as conn:
+        _write_arr_sync_data(conn, arr_config_id, data_to_sync)
+        conn.commit()
+
+
+def delete_arr_sync_data(arr_config_id, conn=None):
+    """
+    Remove all selections for an arr config. Like set_arr_sync_data, a
+    given conn is left for the caller to commit.
+    """
+    if conn is not None:
+        conn.execute('DELETE FROM arr_sync_items WHERE arr_config_id = ?',
+                     (arr_config_id, ))
+        return
+
+    with get_db() as conn:
+        conn.execute('DELETE FROM arr_sync_items WHERE arr_config_id = ?',
+                     (arr_config_id, ))
+        conn.commit()
+
+
+def get_arrs_syncing_item(category, name):
+    """
+    Get the arr configs that sync a given format or profile.
+    Args:
+        category (str): Either 'customFormats' or 'profiles'
+        name (str): Name of the format or profile
+    Returns:
+        list: [{'id': ..., 'name': ..., 'sync_method': ...}] of matching arr configs
+    """
+    with get_db() as conn:
+        rows = conn.execute(
+            '''
+            SELECT a.id, a.name, a.sync_method
+            FROM arr_sync_items s
+            JOIN arr_config a ON a.id = s.arr_config_id
+            WHERE s.category = ? AND s.name = ?
+            ORDER BY a.id
+            ''', (category, name)).fetchall()
+
+        return [{
+            'id': row['id'],
+            'name': row['name'],
+            'sync_method': row['sync_method']
+        } for row in rows]
+
+
 def update_arr_config_on_rename(category, old_name, new_name):
     """
-    Update arr_config data_to_sync when a format or profile is renamed.
+    Update arr sync selections when a format or profile is renamed.
     Args:
         category (str): Either 'customFormats' or 'profiles'
         old_name (str): Original name being changed
@@ -44,36 +156,30 @@ def update_arr_config_on_rename(category, old_name, new_name):
     Returns:
         list: IDs of arr_config rows that were updated
     """
-    updated_ids = []
+    # Nothing to move, and the cleanup below would drop every selection
+    if old_name == new_name:
+        return []
 
     with get_db() as conn:
-        # Get all configs that might reference this name
-        rows = conn.execute(
-            'SELECT id, data_to_sync FROM arr_config WHERE data_to_sync IS NOT NULL'
-        ).fetchall()
-
-        for row in rows:
-            try:
-                data = json.loads(row['data_to_sync'])
-                # Check if this config has the relevant category data
-                if category in data:
-                    # Update any matching names
-                    if old_name in data[category]:
-                        # Replace old name with new name
-                        data[category] = [
-                            new_name if x == old_name else x
-                            for x in data[category]
-                        ]
-                        # Save changes back to database
-                        conn.execute(
-                            'UPDATE arr_config SET data_to_sync = ? WHERE id = ?',
-                            (json.dumps(data), row['id']))
-                        updated_ids.append(row['id'])
-            except json.JSONDecodeError:
-                logger.error(f"Invalid JSON in arr_config id={row['id']}")
-                continue
+        updated_ids = [
+            row['arr_config_id'] for row in conn.execute(
+                '''
+                SELECT arr_config_id FROM arr_sync_items
+                WHERE category = ? AND name = ?
+                ''', (category, old_name)).fetchall()
+        ]
 
         if updated_ids:
+            # OR IGNORE skips arrs that already select new_name; their
+            # leftover old_name rows are dropped below
+            conn.execute(
+                '''
+                UPDATE OR IGNORE arr_sync_items SET name = ?
+                WHERE category = ? AND name = ?
+                ''', (new_name, category, old_name))
+            conn.execute(
+                'DELETE FROM arr_sync_items WHERE category = ? AND name = ?',
+                (category, old_name))
             conn.commit()
 
     return updated_ids
@@ -81,39 +187,26 @@ def update_arr_config_on_rename(category, old_name, new_name):
 
 def update_arr_config_on_delete(category, name):
     """
-    Update arr_config data_to_sync when a format or profile is deleted.
+    Update arr sync selections when a format or profile is deleted.
     Args:
         category (str): Either 'customFormats' or 'profiles' 
         name (str): Name being deleted
     Returns:
         list: IDs of arr_config rows that were updated
     """
-    updated_ids = []
-
     with get_db() as conn:
-        # Get all configs that might reference this name
-        rows = conn.execute(
-            'SELECT id, data_to_sync FROM arr_config WHERE data_to_sync IS NOT NULL'
-        ).fetchall()
-
-        for row in rows:
-            try:
-                data = json.loads(row['data_to_sync'])
-                # Check if this config has the relevant category data
-                if category in data:
-                    # Remove any matching names
-                    if name in data[category]:
-                        data[category].remove(name)
-                        # Save changes back to database
-                        conn.execute(
-                            'UPDATE arr_config SET data_to_sync = ? WHERE id = ?',
-                            (json.dumps(data), row['id']))
-                        updated_ids.append(row['id'])
-            except json.JSONDecodeError:
-                logger.error(f"Invalid JSON in arr_config id={row['id']}")
-                continue
+        updated_ids = [
+            row['arr_config_id'] for row in conn.execute(
+                '''
+                SELECT arr_config_id FROM arr_sync_items
+                WHERE category = ? AND name = ?
+                ''', (category, name)).fetchall()
+        ]
 
         if updated_ids:
+            conn.execute(
+                'DELETE FROM arr_sync_items WHERE category = ? AND name = ?',
+                (category, name))
             conn.commit()
 
     return updated_ids
@@ -31,3 +31,12 @@ def is_format_in_renames(format_name: str) -> bool:
             'SELECT 1 FROM format_renames WHERE format_name = ?',
             (format_name, )).fetchone()
         return bool(result)
+
+
+def get_format_renames() -> list:
+    """All format names in the renames table, sorted"""
+    with get_db() as conn:
+        rows = conn.execute(
+            'SELECT format_name FROM format_renames ORDER BY format_name'
+        ).fetchall()
+        return [row['format_name'] for row in rows]
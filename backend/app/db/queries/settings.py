@@ -1,18 +1,94 @@
 # backend/app/db/queries/settings.py
-from ..connection import get_db
+from ..connection import get_db, DB_PATH
+from ...metrics import record_cache
+from collections import namedtuple
+from types import MappingProxyType
 import logging
 import os
+import sqlite3
+import threading
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LANGUAGE_IMPORT_SCORE = -99999
+
+# Immutable view of the settings shared by every reader in this process.
+# `version` increases whenever the content changes, so compile caches can
+# use it as part of their key.
+SettingsSnapshot = namedtuple('SettingsSnapshot',
+                              ['version', 'settings', 'language_import_score'])
+
+_snapshot_lock = threading.Lock()
+_snapshot = None
+_watch_conn = None
+_data_version = None
+
+
+def _current_data_version():
+    """
+    Return SQLite's data_version for a long-lived connection. The value
+    changes whenever another connection (in any process) commits, so the
+    snapshot can be revalidated without re-reading the tables.
+    """
+    global _watch_conn
+    if _watch_conn is None:
+        _watch_conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    return _watch_conn.execute('PRAGMA data_version').fetchone()[0]
+
+
+def _refresh_snapshot(force=False):
+    """Reload the snapshot if the database changed. Caller holds the lock."""
+    global _snapshot, _data_version
+    data_version = _current_data_version()
+    if not force and _snapshot is not None and data_version == _data_version:
+        record_cache('settings_snapshot', hits=1)
+        return _snapshot
+    record_cache('settings_snapshot', misses=1)
+
+    rows = _watch_conn.execute(
+        'SELECT key, value FROM settings WHERE key NOT IN ("secret_key")'
+    ).fetchall()
+    settings = {key: value for key, value in rows}
+    score_row = _watch_conn.execute(
+        'SELECT score FROM language_import_config ORDER BY id DESC LIMIT 1'
+    ).fetchone()
+    score = score_row[0] if score_row else DEFAULT_LANGUAGE_IMPORT_SCORE
+    _data_version = data_version
+
+    if (_snapshot is None or dict(_snapshot.settings) != settings
+            or _snapshot.language_import_score != score):
+        version = _snapshot.version + 1 if _snapshot else 1
+        _snapshot = SettingsSnapshot(version, MappingProxyType(settings),
+                                     score)
+        logger.debug(f"Settings snapshot refreshed to version {version}")
+
+    return _snapshot
+
+
+def get_settings_snapshot():
+    """Get the current SettingsSnapshot, reloading only if the DB changed."""
+    with _snapshot_lock:
+        return _refresh_snapshot()
+
+
+def get_settings_version():
+    """Get the current settings version, for use as a cache key."""
+    return get_settings_snapshot().version
+
+
+def invalidate_settings_cache():
+    """Reload the snapshot now, bumping the version if anything changed."""
+    with _snapshot_lock:
+        _refresh_snapshot(force=True)
+
 
 def get_settings():
-    with get_db() as conn:
-        result = conn.execute(
-            'SELECT key, value FROM settings WHERE key NOT IN ("secret_key")'
-        ).fetchall()
-        settings = {row['key']: row['value'] for row in result}
-        return settings if 'gitRepo' in settings else None
+    """
+    Get all settings except secret_key as a read-only mapping, or None if
+    no repository has been configured yet.
+    """
+    settings = get_settings_snapshot().settings
+    return settings if 'gitRepo' in settings else None
 
 
 def get_secret_key():
@@ -35,6 +111,8 @@ def save_settings(settings_dict):
                 ''', (key, value))
         conn.commit()
 
+    invalidate_settings_cache()
+
 
 def update_pat_status():
     """Update the has_profilarr_pat setting based on current environment."""
@@ -56,22 +134,19 @@ def update_pat_status():
             ''', (pat_exists, pat_exists))
         conn.commit()
 
-        if current is None:
-            logger.info(f"PAT status created: {pat_exists}")
-        elif current[0] != pat_exists:
-            logger.info(
-                f"PAT status updated from {current[0]} to {pat_exists}")
-        else:
-            logger.debug("PAT status unchanged")
+    invalidate_settings_cache()
+
+    if current is None:
+        logger.info(f"PAT status created: {pat_exists}")
+    elif current[0] != pat_exists:
+        logger.info(f"PAT status updated from {current[0]} to {pat_exists}")
+    else:
+        logger.debug("PAT status unchanged")
 
 
 def get_language_import_score():
     """Get the current language import score."""
-    with get_db() as conn:
-        result = conn.execute(
-            'SELECT score FROM language_import_config ORDER BY id DESC LIMIT 1'
-        ).fetchone()
-        return result['score'] if result else -99999
+    return get_settings_snapshot().language_import_score
 
 
 def update_language_import_score(score):
@@ -105,7 +180,9 @@ def update_language_import_score(score):
                 ''', (score,))
         
         conn.commit()
-        if current_score is not None:
-            logger.info(f"Language import score updated from {current_score} to {score}")
-        else:
-            logger.info(f"Language import score set to: {score}")
+
+    invalidate_settings_cache()
+    if current_score is not None:
+        logger.info(f"Language import score updated from {current_score} to {score}")
+    else:
+        logger.info(f"Language import score set to: {score}")
@@ -0,0 +1,100 @@
+# backend/app/db/queries/task_runs.py
+import json
+import logging
+from ..connection import get_db
+from ...utils.stats import percentile
+
+logger = logging.getLogger(__name__)
+
+
+def record_task_run(task_id, started_at, finished_at, status,
+                    items_processed=None, items_failed=None, error=None,
+                    details=None, keep=None):
+    """
+    Store one execution of a task. `details` is any JSON-serializable
+    breakdown of the run (e.g. import timings). When `keep` is given, only
+    the task's most recent `keep` runs are retained, and runs of tasks
+    that no longer exist are dropped.
+    """
+    duration = (finished_at - started_at).total_seconds()
+    with get_db() as conn:
+        conn.execute(
+            '''
+            INSERT INTO task_runs
+                (task_id, started_at, finished_at, duration_seconds, status,
+                 items_processed, items_failed, error, details)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (task_id, started_at, finished_at, duration, status,
+                  items_processed, items_failed, error,
+                  json.dumps(details) if details is not None else None))
+        if keep:
+            conn.execute(
+                '''
+                DELETE FROM task_runs
+                WHERE task_id = ? AND id <= (
+                    SELECT id FROM task_runs WHERE task_id = ?
+                    ORDER BY id DESC LIMIT 1 OFFSET ?
+                )
+                ''', (task_id, task_id, keep))
+            # scheduled_tasks deletes don't cascade here
+            conn.execute(
+                '''
+                DELETE FROM task_runs
+                WHERE task_id NOT IN (SELECT id FROM scheduled_tasks)
+                ''')
+        conn.commit()
+
+
+def get_task_runs(task_id, limit=50):
+    """Get a task's most recent runs, newest first."""
+    with get_db() as conn:
+        rows = conn.execute(
+            '''
+            SELECT id, started_at, finished_at, duration_seconds, status,
+                   items_processed, items_failed, error, details
+            FROM task_runs WHERE task_id = ?
+            ORDER BY id DESC LIMIT ?
+            ''', (task_id, limit)).fetchall()
+
+    runs = []
+    for row in rows:
+        run = dict(row)
+        if run['details'] is not None:
+            run['details'] = json.loads(run['details'])
+        runs.append(run)
+    return runs
+
+
+def get_task_run_stats(task_ids=None):
+    """
+    Get duration statistics per task as {task_id: stats}. Tasks without any
+    recorded runs are absent from the result.
+    """
+    query = 'SELECT task_id, duration_seconds, status FROM task_runs'
+    params = ()
+    if task_ids is not None:
+        task_ids = list(task_ids)
+        if not task_ids:
+            return {}
+        query += f" WHERE task_id IN ({','.join('?' * len(task_ids))})"
+        params = tuple(task_ids)
+
+    with get_db() as conn:
+        rows = conn.execute(query, params).fetchall()
+
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row['task_id'], []).append(row)
+
+    stats = {}
+    for task_id, runs in grouped.items():
+        durations = sorted(run['duration_seconds'] for run in runs)
+        stats[task_id] = {
+            'runs': len(runs),
+            'failures': sum(1 for run in runs if run['status'] == 'failed'),
+            'p50_seconds': percentile(durations, 50),
+            'p95_seconds': percentile(durations, 95),
+            'max_seconds': durations[-1]
+        }
+    return stats
+
@@ -7,6 +7,8 @@ from .operations.manager import GitOperations
 from .repo.unlink import unlink_repository
 from .repo.clone import clone_repository
 from ..db import save_settings, get_settings
+from ..utils.json_stream import stream_json
+from ..utils.repo_lock import serialize_writes
 from ..config.config import config
 import logging
 
@@ -14,6 +16,7 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 bp = Blueprint('git', __name__)
+serialize_writes(bp)
 
 REPO_PATH = config.DB_DIR
 branch_manager = Branch_Manager(REPO_PATH)
@@ -366,7 +369,11 @@ def get_commit_history():
 
     if success:
         logger.debug("Successfully retrieved commit history")
-        return jsonify({'success': True, 'data': result}), 200
+        try:
+            return stream_json({'success': True, 'data': result})
+        except Exception as e:
+            logger.exception("Failed to format commit history")
+            return jsonify({'success': False, 'error': str(e)}), 500
     else:
         logger.error(f"Failed to retrieve commit history: {result}")
         return jsonify({'success': False, 'error': result}), 400
@@ -1,9 +1,9 @@
-import yaml
 from git import GitCommandError
 import logging
 from typing import Dict, Any
 import os
 from copy import deepcopy
+from ...utils import yaml_io
 from ...data.utils import CATEGORY_MAP
 
 logger = logging.getLogger(__name__)
@@ -23,7 +23,7 @@ def get_version_data(repo, ref, file_path):
     """Get YAML data from a specific version of a file."""
     try:
         content = repo.git.show(f'{ref}:{file_path}')
-        return yaml.safe_load(content) if content else None
+        return yaml_io.load(content) if content else None
     except GitCommandError:
         return None
 
@@ -124,7 +124,7 @@ def resolve_conflicts(
                         logger.debug(f"Keeping local version: {file_path}")
                         # Keep our version
                         with open(full_path, 'w') as f:
-                            yaml.safe_dump(head_data,
+                            yaml_io.dump(head_data,
                                            f,
                                            default_flow_style=False)
                         repo.index.add([file_path])
@@ -135,7 +135,7 @@ def resolve_conflicts(
                             f"Restoring from incoming version: {file_path}")
                         # Restore the file from MERGE_HEAD
                         with open(full_path, 'w') as f:
-                            yaml.safe_dump(merge_head_data,
+                            yaml_io.dump(merge_head_data,
                                            f,
                                            default_flow_style=False)
                         repo.index.add([file_path])
@@ -290,7 +290,7 @@ def resolve_conflicts(
                 # Write resolved version
                 full_path = os.path.join(repo.working_dir, file_path)
                 with open(full_path, 'w') as f:
-                    yaml.safe_dump(resolved_data, f, default_flow_style=False)
+                    yaml_io.dump(resolved_data, f, default_flow_style=False)
 
                 # Stage the resolved file
                 repo.index.add([file_path])
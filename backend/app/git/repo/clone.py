@@ -3,9 +3,9 @@
 import os
 import shutil
 import logging
-import yaml
 from git.exc import GitCommandError
 import git
+from ...utils import yaml_io
 from ..auth.authenticate import GitHubAuth
 
 logger = logging.getLogger(__name__)
@@ -93,7 +93,7 @@ def clone_repository(repo_url, repo_path):
                 for file_name in local_files:
                     old_file_path = os.path.join(backup_folder_path, file_name)
                     with open(old_file_path, 'r') as file:
-                        data = yaml.safe_load(file)
+                        data = yaml_io.load(file)
 
                     base_name = data['name']
                     new_name = base_name
@@ -108,7 +108,7 @@ def clone_repository(repo_url, repo_path):
                                                  f"{new_name}.yml")
 
                     with open(new_file_path, 'w') as file:
-                        yaml.dump(data, file)
+                        yaml_io.dump(data, file)
                     logger.debug(f"Merged file: {file_name} → {new_name}.yml")
 
         # Cleanup
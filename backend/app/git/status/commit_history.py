@@ -77,8 +77,8 @@ def get_git_commit_history(repo_path, branch=None):
     Returns:
         tuple: (success: bool, result: dict/str)
             On success, returns (True, {
-                'local_commits': [...],
-                'remote_commits': [...],
+                'local_commits': <generator of commits>,
+                'remote_commits': <generator of commits>,
                 'ahead_count': int,
                 'behind_count': int,
                 'branch': str,
@@ -98,40 +98,34 @@ def get_git_commit_history(repo_path, branch=None):
         except Exception as e:
             logger.debug(f"No tracking branch found: {e}")
 
-        local_commits = []
-        remote_commits = []
+        # Commit lists are generators: each commit's stats cost a git
+        # diff, so they are formatted while the response is written
+        local_commits = iter(())
+        remote_commits = iter(())
         ahead_count = 0
         behind_count = 0
 
+        def formatted(rev, **kwargs):
+            return (format_commit(commit, repo, tracking_branch)
+                    for commit in repo.iter_commits(rev, **kwargs))
+
         if tracking_branch:
             try:
-                # Find the merge base (common ancestor)
-                merge_base = repo.merge_base(tracking_branch,
-                                             current_branch)[0]
-
-                # Get commits that are in local but not in remote (ahead)
-                local_commits = [
-                    format_commit(commit, repo, tracking_branch)
-                    for commit in repo.iter_commits(
-                        f"{tracking_branch.name}..{current_branch.name}")
-                ]
-                ahead_count = len(local_commits)
-
-                # Get commits that are in remote but not in local (behind)
-                remote_commits = [
-                    format_commit(commit, repo, tracking_branch)
-                    for commit in repo.iter_commits(
-                        f"{current_branch.name}..{tracking_branch.name}")
-                ]
-                behind_count = len(remote_commits)
-
-                # If no divergence, get recent commits from current branch
-                if not local_commits and not remote_commits:
-                    local_commits = [
-                        format_commit(commit, repo, tracking_branch)
-                        for commit in repo.iter_commits(current_branch.name,
-                                                        max_count=50)
-                    ]
+                ahead_range = f"{tracking_branch.name}..{current_branch.name}"
+                behind_range = f"{current_branch.name}..{tracking_branch.name}"
+
+                # Commits that are in local but not in remote (ahead) and
+                # in remote but not in local (behind)
+                ahead_count = int(repo.git.rev_list('--count', ahead_range))
+                behind_count = int(repo.git.rev_list('--count', behind_range))
+
+                if ahead_count or behind_count:
+                    local_commits = formatted(ahead_range)
+                    remote_commits = formatted(behind_range)
+                else:
+                    # If no divergence, get recent commits from current branch
+                    local_commits = formatted(current_branch.name,
+                                              max_count=50)
 
             except git.GitCommandError as e:
                 logger.error(f"Git command error while getting commits: {e}")
@@ -139,11 +133,7 @@ def get_git_commit_history(repo_path, branch=None):
 
         else:
             # If no tracking branch, just get recent local commits
-            local_commits = [
-                format_commit(commit, repo)
-                for commit in repo.iter_commits(current_branch.name,
-                                                max_count=50)
-            ]
+            local_commits = formatted(current_branch.name, max_count=50)
 
         return True, {
             'local_commits': local_commits,
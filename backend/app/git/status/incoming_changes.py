@@ -1,7 +1,7 @@
 import os
-import yaml
 import logging
 from git import GitCommandError
+from ...utils import yaml_io
 from .comparison import create_change_summary
 from .utils import determine_type, parse_commit_message, extract_name_from_path
 
@@ -169,15 +169,15 @@ def get_incoming_changes(repo, branch):
                 # Get local and remote versions
                 try:
                     local_content = repo.git.show(f'HEAD:{old_path}')
-                    local_data = yaml.safe_load(local_content)
-                except (GitCommandError, yaml.YAMLError):
+                    local_data = yaml_io.load(local_content)
+                except (GitCommandError, yaml_io.YAMLError):
                     local_data = None
 
                 try:
                     remote_content = repo.git.show(
                         f'origin/{branch}:{file_path}')
-                    remote_data = yaml.safe_load(remote_content)
-                except (GitCommandError, yaml.YAMLError):
+                    remote_data = yaml_io.load(remote_content)
+                except (GitCommandError, yaml_io.YAMLError):
                     remote_data = None
 
                 # Skip if no actual changes
@@ -1,7 +1,7 @@
 import os
-import yaml
 import logging
 from git import GitCommandError
+from ...utils import yaml_io
 from .conflict_comparison import create_conflict_summary, UNRESOLVED, RESOLVED, MODIFY_DELETE
 
 logger = logging.getLogger(__name__)
@@ -11,7 +11,7 @@ def get_version_data(repo, ref, file_path):
     """Get YAML data from a specific version of a file"""
     try:
         content = repo.git.show(f'{ref}:{file_path}')
-        return yaml.safe_load(content) if content else None
+        return yaml_io.load(content) if content else None
     except GitCommandError:
         return None
 
@@ -41,7 +41,7 @@ def process_modify_delete_conflict(repo, file_path, deleted_in_head):
             # File exists locally, read it
             try:
                 with open(os.path.join(repo.working_dir, file_path), 'r') as f:
-                    existing_data = yaml.safe_load(f.read())
+                    existing_data = yaml_io.load(f.read())
             except Exception as read_error:
                 logger.warning(f"Could not read existing file {file_path}: {str(read_error)}")
                 existing_data = {'name': filename}
@@ -1,7 +1,7 @@
 import os
-import yaml
 import logging
 from git import GitCommandError
+from ...utils import yaml_io
 from .comparison import create_change_summary
 from .utils import determine_type, extract_name_from_path
 
@@ -66,10 +66,10 @@ def get_outgoing_changes(repo):
                 # Get old content (from HEAD)
                 try:
                     old_content = repo.git.show(f'HEAD:{original_path}')
-                    old_data = yaml.safe_load(old_content)
+                    old_data = yaml_io.load(old_content)
                 except GitCommandError:
                     old_data = None
-                except yaml.YAMLError as e:
+                except yaml_io.YAMLError as e:
                     logger.warning(
                         f"Failed to parse old YAML for {original_path}: {str(e)}"
                     )
@@ -79,8 +79,8 @@ def get_outgoing_changes(repo):
                 try:
                     full_path = os.path.join(repo.working_dir, new_path)
                     with open(full_path, 'r') as f:
-                        new_data = yaml.safe_load(f.read())
-                except (IOError, yaml.YAMLError) as e:
+                        new_data = yaml_io.load(f.read())
+                except (IOError, yaml_io.YAMLError) as e:
                     logger.warning(
                         f"Failed to read/parse current file {new_path}: {str(e)}"
                     )
@@ -2,27 +2,66 @@
 import git
 from git.exc import GitCommandError, InvalidGitRepositoryError
 import logging
+from ...utils import yaml_io
 from .incoming_changes import get_incoming_changes
 from .outgoing_changes import get_outgoing_changes
 from .merge_conflicts import get_merge_conflicts
 from .utils import determine_type
 import os
-import yaml
 import threading
 from datetime import datetime
 import json
+import time
 from ...db import get_settings
+from ...metrics import git_commands, git_duration, git_status_duration, timed
 
 logger = logging.getLogger(__name__)
 
 
+def _git_subcommand(command):
+    """The git subcommand (status, show, ...) of an executed command line"""
+    args = command.split() if isinstance(command, str) else list(command)
+    skip_next = False
+    for arg in args[1:]:
+        if skip_next:
+            skip_next = False
+        elif arg in ('-c', '-C'):
+            skip_next = True
+        elif not arg.startswith('-'):
+            return arg
+    return 'git'
+
+
+class InstrumentedGit(git.Git):
+    """Git command wrapper that records every git subprocess it runs"""
+
+    def execute(self, command, *args, **kwargs):
+        subcommand = _git_subcommand(command)
+        status = 'error'
+        start = time.perf_counter()
+        try:
+            result = super().execute(command, *args, **kwargs)
+            status = 'ok'
+            return result
+        finally:
+            # Persistent processes (as_process) are only counted; their
+            # work happens after execute returns
+            if not kwargs.get('as_process'):
+                git_duration.observe(time.perf_counter() - start, subcommand)
+            git_commands.inc(subcommand, status)
+
+
+class InstrumentedRepo(git.Repo):
+    GitCommandWrapperType = InstrumentedGit
+
+
 class GitStatusManager:
     _instance = None
     _lock = threading.Lock()
 
     def __init__(self, repo_path):
         self.repo_path = repo_path
-        self.repo = git.Repo(repo_path)
+        self.repo = InstrumentedRepo(repo_path)
         self.status = {
             # Local status
             "branch": "",
@@ -52,10 +91,11 @@ class GitStatusManager:
                     cls._instance = cls(repo_path)
         return cls._instance
 
+    @timed(git_status_duration, 'local')
     def update_local_status(self):
         """Update only local repository status"""
         try:
-            self.repo = git.Repo(self.repo_path)  # Refresh repo instance
+            self.repo = InstrumentedRepo(self.repo_path)  # Refresh repo instance
 
             with self._lock:
                 # Update branch
@@ -83,6 +123,7 @@ class GitStatusManager:
             logger.error(f"Error updating local status: {str(e)}")
             return False
 
+    @timed(git_status_duration, 'remote')
     def update_remote_status(self):
         """Update remote repository status - called by scheduled task"""
         try:
@@ -188,7 +229,7 @@ class GitStatusManager:
                 try:
                     with open(os.path.join(self.repo.working_dir, file_path),
                               'r') as f:
-                        content = yaml.safe_load(f.read())
+                        content = yaml_io.load(f.read())
 
                     detailed_changes.append({
                         'type':
@@ -1,9 +1,9 @@
 # git/status/utils.py
 
 import os
-import yaml
 import logging
 import re
+from ...utils import yaml_io
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +12,7 @@ def extract_data_from_yaml(file_path):
     logger.debug(f"Extracting data from file: {file_path}")
     try:
         with open(file_path, 'r') as f:
-            content = yaml.safe_load(f)
+            content = yaml_io.load(f)
             logger.debug(
                 f"File content: {content}")  # Log the full file content
             if content is None:
@@ -101,6 +101,14 @@ def handle_import_request(request: Dict[str, Any]) -> Dict[str, Any]:
         return {'success': False, 'error': str(e)}
 
 
+def _combine_timings(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Each strategy's timing breakdown, keyed by strategy"""
+    return {
+        result['strategy']: result['timings']
+        for result in results if 'strategy' in result and 'timings' in result
+    }
+
+
 def handle_scheduled_import(task_id: int) -> Dict[str, Any]:
     """
     Handle a scheduled import task.
@@ -111,8 +119,7 @@ def handle_scheduled_import(task_id: int) -> Dict[str, Any]:
     Returns:
         Import results
     """
-    from ..db import get_db
-    import json
+    from ..db import get_db, get_arr_sync_data
 
     try:
         # Find arr_config for this task
@@ -128,8 +135,8 @@ def handle_scheduled_import(task_id: int) -> Dict[str, Any]:
                     'error': f'No arr_config found for task {task_id}'
                 }
 
-        # Parse data_to_sync
-        data_to_sync = json.loads(arr_config['data_to_sync'] or '{}')
+        # Load selected formats/profiles
+        data_to_sync = get_arr_sync_data([arr_config['id']])[arr_config['id']]
 
         # Build import requests
         results = []
@@ -186,7 +193,8 @@ def handle_scheduled_import(task_id: int) -> Dict[str, Any]:
             'added': total_added,
             'updated': total_updated,
             'failed': total_failed,
-            'results': results
+            'results': results,
+            'timings': _combine_timings(results)
         }
 
         # Update sync status
@@ -206,8 +214,7 @@ def handle_pull_import(arr_config_id: int) -> Dict[str, Any]:
     This mirrors scheduled import behavior but is triggered immediately
     during a git pull (not scheduled).
     """
-    from ..db import get_db
-    import json
+    from ..db import get_db, get_arr_sync_data
 
     try:
         # Load arr_config by id
@@ -221,8 +228,8 @@ def handle_pull_import(arr_config_id: int) -> Dict[str, Any]:
                     'error': f'arr_config {arr_config_id} not found'
                 }
 
-        # Parse data_to_sync
-        data_to_sync = json.loads(arr_config['data_to_sync'] or '{}')
+        # Load selected formats/profiles
+        data_to_sync = get_arr_sync_data([arr_config['id']])[arr_config['id']]
 
         results: List[Dict[str, Any]] = []
 
@@ -274,6 +281,7 @@ def handle_pull_import(arr_config_id: int) -> Dict[str, Any]:
             'updated': total_updated,
             'failed': total_failed,
             'results': results,
+            'timings': _combine_timings(results),
         }
 
         # Update sync status
@@ -1,9 +1,11 @@
 """ArrHandler class - manages all Arr API communication."""
 import logging
+import time
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import Dict, List, Any, Optional
+from ..metrics import arr_requests, arr_duration, endpoint_label
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,8 @@ class ArrHandler:
             'Content-Type': 'application/json'
         }
         self.session = self._create_session()
+        # Duration of every request made through this handler, in seconds
+        self.request_times: List[float] = []
     
     def _create_session(self) -> requests.Session:
         """Create a session with connection pooling and retry logic."""
@@ -56,6 +60,24 @@ class ArrHandler:
         session.headers.update(self.headers)
         
         return session
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send a request through the session, recording its latency."""
+        labels = (self.base_url, method, endpoint_label(endpoint))
+        status = 'error'
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method,
+                                            f"{self.base_url}{endpoint}",
+                                            timeout=30,
+                                            **kwargs)
+            status = str(response.status_code)
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            self.request_times.append(elapsed)
+            arr_duration.observe(elapsed, *labels)
+            arr_requests.inc(*labels, status)
     
     def get(self, endpoint: str) -> Any:
         """
@@ -70,9 +92,8 @@ class ArrHandler:
         Raises:
             ArrApiError: If request fails
         """
-        url = f"{self.base_url}{endpoint}"
         try:
-            response = self.session.get(url, timeout=30)
+            response = self._send('GET', endpoint)
             if response.status_code != 200:
                 raise ArrApiError(
                     f"GET {endpoint} failed: {response.text}",
@@ -96,9 +117,8 @@ class ArrHandler:
         Raises:
             ArrApiError: If request fails
         """
-        url = f"{self.base_url}{endpoint}"
         try:
-            response = self.session.post(url, json=data, timeout=30)
+            response = self._send('POST', endpoint, json=data)
             if response.status_code not in [200, 201]:
                 raise ArrApiError(
                     f"POST {endpoint} failed: {response.text}",
@@ -122,9 +142,8 @@ class ArrHandler:
         Raises:
             ArrApiError: If request fails
         """
-        url = f"{self.base_url}{endpoint}"
         try:
-            response = self.session.put(url, json=data, timeout=30)
+            response = self._send('PUT', endpoint, json=data)
             if response.status_code not in [200, 202, 204]:
                 raise ArrApiError(
                     f"PUT {endpoint} failed: {response.text}",
@@ -6,6 +6,7 @@ from .utils import load_regex_patterns
 from ..db.queries.format_renames import is_format_in_renames
 from ..db.queries.settings import get_language_import_score
 from .logger import get_import_logger
+from ..metrics import record_cache
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +17,10 @@ def get_cached_patterns():
     """Get cached regex patterns, loading them once on first access."""
     global _CACHED_PATTERNS
     if _CACHED_PATTERNS is None:
+        record_cache('import_patterns', misses=1)
         _CACHED_PATTERNS = load_regex_patterns()
+    else:
+        record_cache('import_patterns', hits=1)
     return _CACHED_PATTERNS
 
 
@@ -174,7 +178,7 @@ def compile_profile_to_api_structure(
         Compiled profile ready for API
     """
     target_app = TargetApp.RADARR if arr_type.lower() == 'radarr' else TargetApp.SONARR
-    quality_mappings = ValueResolver.get_qualities(target_app)
+    template = ValueResolver.get_quality_template(target_app)
     
     compiled = {
         'name': profile_yaml.get('name', 'Unknown')
@@ -183,8 +187,7 @@ def compile_profile_to_api_structure(
     # Build quality items - following the structure from the working compile/profile_compiler.py
     items = []
     cutoff_id = None
-    used_qualities = set()
-    quality_ids_in_groups = set()
+    used_ids = set()
     
     # Convert group IDs (negative to positive with offset)
     def convert_group_id(group_id: int) -> int:
@@ -192,18 +195,13 @@ def compile_profile_to_api_structure(
             return 1000 + abs(group_id)
         return group_id
     
-    # First pass: gather quality IDs in groups to avoid duplicates
-    for quality_entry in profile_yaml.get('qualities', []):
-        if isinstance(quality_entry, dict) and quality_entry.get('id', 0) < 0:
-            # It's a group
-            for q in quality_entry.get('qualities', []):
-                if isinstance(q, dict):
-                    q_name = q.get('name', '')
-                    mapped_name = ValueResolver.get_quality_name(q_name, target_app)
-                    if mapped_name in quality_mappings:
-                        quality_ids_in_groups.add(quality_mappings[mapped_name]['id'])
+    def quality_item(quality_name: str, allowed: bool = True) -> Dict[str, Any]:
+        quality = dict(template.qualities[quality_name])
+        if allowed:
+            used_ids.add(quality['id'])
+        return {'quality': quality, 'items': [], 'allowed': allowed}
     
-    # Second pass: add groups and individual qualities
+    # Single pass: add groups and individual qualities, collecting used IDs
     for quality_entry in profile_yaml.get('qualities', []):
         if isinstance(quality_entry, dict):
             if quality_entry.get('id', 0) < 0:
@@ -218,46 +216,28 @@ def compile_profile_to_api_structure(
                 
                 for q in quality_entry.get('qualities', []):
                     if isinstance(q, dict):
-                        q_name = q.get('name', '')
-                        mapped_name = ValueResolver.get_quality_name(q_name, target_app)
-                        if mapped_name in quality_mappings:
-                            group_item['items'].append({
-                                'quality': quality_mappings[mapped_name].copy(),
-                                'items': [],
-                                'allowed': True
-                            })
-                            used_qualities.add(mapped_name.upper())
+                        quality_name = ValueResolver.resolve_quality(q.get('name', ''), target_app)
+                        if quality_name:
+                            group_item['items'].append(quality_item(quality_name))
                 
                 if group_item['items']:
                     items.append(group_item)
             else:
                 # Individual quality
-                q_name = quality_entry.get('name', '')
-                mapped_name = ValueResolver.get_quality_name(q_name, target_app)
-                if mapped_name in quality_mappings:
-                    items.append({
-                        'quality': quality_mappings[mapped_name].copy(),
-                        'items': [],
-                        'allowed': True
-                    })
-                    used_qualities.add(mapped_name.upper())
+                quality_name = ValueResolver.resolve_quality(quality_entry.get('name', ''), target_app)
+                if quality_name:
+                    items.append(quality_item(quality_name))
         elif isinstance(quality_entry, str):
             # Simple quality name string
-            mapped_name = ValueResolver.get_quality_name(quality_entry, target_app)
-            if mapped_name in quality_mappings:
-                items.append({
-                    'quality': quality_mappings[mapped_name].copy(),
-                    'items': [],
-                    'allowed': True
-                })
-                used_qualities.add(mapped_name.upper())
+            quality_name = ValueResolver.resolve_quality(quality_entry, target_app)
+            if quality_name:
+                items.append(quality_item(quality_name))
     
     # Add all unused qualities as disabled
-    for quality_name, quality_data in quality_mappings.items():
-        if (quality_name.upper() not in used_qualities and 
-            quality_data['id'] not in quality_ids_in_groups):
+    for quality_data in template.ordered:
+        if quality_data['id'] not in used_ids:
             items.append({
-                'quality': quality_data.copy(),
+                'quality': dict(quality_data),
                 'items': [],
                 'allowed': False
             })
@@ -266,12 +246,13 @@ def compile_profile_to_api_structure(
     if 'upgrade_until' in profile_yaml and isinstance(profile_yaml['upgrade_until'], dict):
         cutoff_id_raw = profile_yaml['upgrade_until'].get('id')
         cutoff_name = profile_yaml['upgrade_until'].get('name', '')
-        mapped_cutoff_name = ValueResolver.get_quality_name(cutoff_name, target_app)
         
         if cutoff_id_raw and cutoff_id_raw < 0:
             cutoff_id = convert_group_id(cutoff_id_raw)
-        elif mapped_cutoff_name in quality_mappings:
-            cutoff_id = quality_mappings[mapped_cutoff_name]['id']
+        else:
+            cutoff_quality = ValueResolver.resolve_quality(cutoff_name, target_app)
+            if cutoff_quality:
+                cutoff_id = template.qualities[cutoff_quality]['id']
     
     # Handle language
     language = profile_yaml.get('language', 'any')
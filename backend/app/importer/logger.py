@@ -1,7 +1,17 @@
 """Custom logger for importer with progress tracking and colored output."""
 import sys
-from typing import List, Dict, Any
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterable, Optional
 from datetime import datetime
+from ..utils.stats import percentile
+
+
+def _percentile_ms(sorted_seconds: List[float], pct: int) -> Optional[float]:
+    """Nearest-rank percentile of sorted durations, in milliseconds."""
+    seconds = percentile(sorted_seconds, pct)
+    return round(seconds * 1000, 1) if seconds is not None else None
 
 
 class ImportLogger:
@@ -25,6 +35,10 @@ class ImportLogger:
         self.start_time = None
         self.compilation_items: List[str] = []
         self.import_items: List[Dict[str, str]] = []
+
+        # Wall time per phase (load, compile, fetch, push) and per item
+        self.phase_times: Dict[str, float] = {}
+        self.item_times: List[Dict[str, Any]] = []
         
     def _write_colored(self, text: str, color: str = None):
         """Write colored text to stderr."""
@@ -45,10 +59,33 @@ class ImportLogger:
         self.current_compilation = 0
         self.current_import = 0
     
-    def update_compilation(self, item_name: str):
+    @contextmanager
+    def phase(self, name: str):
+        """Add the time spent inside the block to the named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = (self.phase_times.get(name, 0.0) +
+                                      time.perf_counter() - start)
+
+    def start_item(self) -> float:
+        """Mark the start of work on one item; pass the value to update_*."""
+        return time.perf_counter()
+
+    def _record_item(self, item_name: str, stage: str, started: Optional[float]):
+        if started is not None:
+            self.item_times.append({
+                'name': item_name,
+                'stage': stage,
+                'seconds': time.perf_counter() - started
+            })
+
+    def update_compilation(self, item_name: str, started: Optional[float] = None):
         """Track compilation progress."""
         self.current_compilation += 1
         self.compilation_items.append(item_name)
+        self._record_item(item_name, 'compile', started)
     
     def compilation_complete(self):
         """Show compilation summary."""
@@ -60,9 +97,11 @@ class ImportLogger:
                 for error in self.compilation_errors:
                     self._write_colored(f"ERROR: Failed to compile {error['item']}: {error['message']}", 'red')
     
-    def update_import(self, item_name: str, action: str):
+    def update_import(self, item_name: str, action: str,
+                      started: Optional[float] = None):
         """Track import progress."""
         self.import_items.append({'name': item_name, 'action': action})
+        self._record_item(item_name, 'import', started)
         
         # Update counts based on action
         if action == 'added':
@@ -101,6 +140,37 @@ class ImportLogger:
         """Log a warning."""
         self.warnings.append(message)
     
+    def timings(self, remote_times: Iterable[float] = ()) -> Dict[str, Any]:
+        """
+        Timing breakdown of this import: total and per-phase wall time,
+        per-item times (slowest first) and latency percentiles of the
+        given remote request durations.
+        """
+        remote = sorted(remote_times)
+        total = ((datetime.now() - self.start_time).total_seconds()
+                 if self.start_time else None)
+        return {
+            'total_seconds': round(total, 3) if total is not None else None,
+            'phases': {
+                name: round(seconds, 3)
+                for name, seconds in self.phase_times.items()
+            },
+            'items': [
+                dict(item, seconds=round(item['seconds'], 4))
+                for item in sorted(self.item_times,
+                                   key=lambda item: item['seconds'],
+                                   reverse=True)
+            ],
+            'remote': {
+                'requests': len(remote),
+                'total_seconds': round(sum(remote), 3),
+                'p50_ms': _percentile_ms(remote, 50),
+                'p95_ms': _percentile_ms(remote, 95),
+                'p99_ms': _percentile_ms(remote, 99),
+                'max_ms': _percentile_ms(remote, 100)
+            }
+        }
+
     def complete(self):
         """Complete the import and show final summary."""
         # Show import summary first if not already shown
@@ -118,21 +188,25 @@ class ImportLogger:
         print(f"\n{'='*50}", file=sys.stderr)
         print(f"Import Complete in {duration_str}", file=sys.stderr)
         print(f"Added: {self.added}, Updated: {self.updated}, Failed: {self.failed}", file=sys.stderr)
+        if self.phase_times:
+            phases = ", ".join(f"{name} {seconds:.2f}s"
+                               for name, seconds in self.phase_times.items())
+            print(f"Phases: {phases}", file=sys.stderr)
         print(f"{'='*50}\n", file=sys.stderr)
 
 
-# Global instance
-_logger = None
+# One instance per thread, so imports running at once (concurrent syncs,
+# or a manual import alongside one) keep their counts and timings apart
+_local = threading.local()
 
 def get_import_logger() -> ImportLogger:
-    """Get the import logger instance."""
-    global _logger
-    if _logger is None:
-        _logger = ImportLogger()
-    return _logger
+    """Get the current thread's import logger instance."""
+    logger = getattr(_local, 'logger', None)
+    if logger is None:
+        logger = _local.logger = ImportLogger()
+    return logger
 
 def reset_import_logger() -> ImportLogger:
-    """Reset and return a new import logger."""
-    global _logger
-    _logger = ImportLogger()
-    return _logger
\ No newline at end of file
+    """Reset and return a new import logger for the current thread."""
+    _local.logger = ImportLogger()
+    return _local.logger
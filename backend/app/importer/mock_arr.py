@@ -0,0 +1,371 @@
+# app/importer/mock_arr.py
+"""
+Local stand-in for the Radarr/Sonarr v3 API, for load and failure testing
+imports and media management syncs without a real Arr instance.
+
+    cd backend && python -m app.importer.mock_arr [--app radarr]
+        [--port N] [--latency MS] [--jitter MS] [--failure-rate F]
+        [--rate-limit N] [--seed S]
+
+Custom formats and quality profiles can be listed, fetched, created,
+updated and deleted; quality definitions, naming and media management
+config are seeded with defaults and can be read and updated. Latency,
+5xx failures and 429 rate limiting are injected from a seeded random
+generator, so a run with the same seed and request order fails the same
+requests.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from .mappings import Qualities
+
+COLLECTIONS = ('customformat', 'qualityprofile')
+CONFIGS = ('config/naming', 'config/mediamanagement')
+FAILURE_STATUSES = (500, 502, 503, 504)
+
+APP_VERSIONS = {'radarr': '5.14.0.9383', 'sonarr': '4.0.11.2680'}
+
+NAMING_DEFAULTS = {
+    'radarr': {
+        'renameMovies': False,
+        'replaceIllegalCharacters': True,
+        'colonReplacementFormat': 'delete',
+        'standardMovieFormat': '{Movie Title} ({Release Year}) {Quality Full}',
+        'movieFolderFormat': '{Movie Title} ({Release Year})'
+    },
+    'sonarr': {
+        'renameEpisodes': False,
+        'replaceIllegalCharacters': True,
+        'colonReplacementFormat': 4,
+        'customColonReplacementFormat': '',
+        'multiEpisodeStyle': 5,
+        'standardEpisodeFormat':
+        '{Series Title} - S{season:00}E{episode:00} - {Episode Title} {Quality Full}',
+        'dailyEpisodeFormat':
+        '{Series Title} - {Air-Date} - {Episode Title} {Quality Full}',
+        'animeEpisodeFormat':
+        '{Series Title} - S{season:00}E{episode:00} - {Episode Title} {Quality Full}',
+        'seriesFolderFormat': '{Series Title}',
+        'seasonFolderFormat': 'Season {season}',
+        'specialsFolderFormat': 'Specials'
+    }
+}
+
+MEDIA_MANAGEMENT_DEFAULTS = {
+    'downloadPropersAndRepacks': 'preferAndUpgrade',
+    'enableMediaInfo': True,
+    'recycleBin': '',
+    'recycleBinCleanupDays': 7
+}
+
+ROUTE_RE = re.compile(r'^/api/v3/(customformat|qualityprofile|qualitydefinition'
+                      r'|config/naming|config/mediamanagement|system/status)'
+                      r'(?:/(\d+|update))?/?$')
+
+
+class MockArrState:
+    """
+    The resources one mock instance serves, plus the injected-fault
+    settings and request counters. All access goes through `lock`.
+    """
+
+    def __init__(self,
+                 app: str = 'radarr',
+                 api_key: Optional[str] = None,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 failure_rate: float = 0.0,
+                 rate_limit: float = 0.0,
+                 seed: Optional[int] = None):
+        if app not in APP_VERSIONS:
+            raise ValueError(f"Unknown arr type: {app}")
+        self.app = app
+        self.api_key = api_key
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        # Requests per second, with a one second burst; 0 disables
+        self.rate_limit = rate_limit
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Back to the seeded defaults, with counters and faults rewound"""
+        with self.lock:
+            self.collections = {kind: {} for kind in COLLECTIONS}
+            self.next_id = 1
+            qualities = Qualities.RADARR if self.app == 'radarr' else Qualities.SONARR
+            self.quality_definitions = {
+                quality['id']: {
+                    'id': quality['id'],
+                    'quality': dict(quality),
+                    'title': name,
+                    'weight': weight,
+                    'minSize': 0,
+                    'maxSize': 400,
+                    'preferredSize': 95
+                }
+                for weight, (name, quality) in enumerate(qualities.items(), 1)
+            }
+            self.configs = {
+                'config/naming': dict(NAMING_DEFAULTS[self.app], id=1),
+                'config/mediamanagement': dict(MEDIA_MANAGEMENT_DEFAULTS, id=1)
+            }
+            self.random = random.Random(self.seed)
+            self.tokens = self.rate_limit
+            self.refilled_at = time.monotonic()
+            self.stats = {'requests': 0, 'failed': 0, 'throttled': 0,
+                          'by_route': {}}
+
+    def admit(self, route: str) -> Tuple[float, Optional[int]]:
+        """
+        Count a request and decide its fate: the delay to add and the
+        status to fail it with (429 or 5xx), or None to serve it.
+        """
+        with self.lock:
+            self.stats['requests'] += 1
+            by_route = self.stats['by_route']
+            by_route[route] = by_route.get(route, 0) + 1
+
+            delay = self.latency
+            if self.jitter:
+                delay += self.random.uniform(0, self.jitter)
+
+            if self.rate_limit:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.rate_limit,
+                    self.tokens + (now - self.refilled_at) * self.rate_limit)
+                self.refilled_at = now
+                if self.tokens < 1:
+                    self.stats['throttled'] += 1
+                    return delay, 429
+                self.tokens -= 1
+
+            if self.failure_rate and self.random.random() < self.failure_rate:
+                self.stats['failed'] += 1
+                return delay, self.random.choice(FAILURE_STATUSES)
+            return delay, None
+
+    def handle(self, method: str, kind: str, item: Optional[str],
+               body: Any) -> Tuple[int, Any]:
+        """Serve a routed request against the stored resources"""
+        with self.lock:
+            if kind == 'system/status':
+                if method != 'GET' or item:
+                    return 405, {'message': 'Method not allowed'}
+                return 200, {'appName': self.app.capitalize(),
+                             'instanceName': self.app.capitalize(),
+                             'version': APP_VERSIONS[self.app]}
+            if kind in CONFIGS:
+                return self._handle_config(method, kind, body)
+            if kind == 'qualitydefinition':
+                return self._handle_definitions(method, item, body)
+            return self._handle_collection(method, kind, item, body)
+
+    def _handle_config(self, method, kind, body):
+        if method == 'GET':
+            return 200, self.configs[kind]
+        if method == 'PUT':
+            if not isinstance(body, dict):
+                return 400, {'message': 'Expected a JSON object'}
+            self.configs[kind] = dict(body, id=1)
+            return 202, self.configs[kind]
+        return 405, {'message': 'Method not allowed'}
+
+    def _handle_definitions(self, method, item, body):
+        definitions = self.quality_definitions
+        if method == 'GET' and item is None:
+            return 200, list(definitions.values())
+        if method == 'GET' and item != 'update':
+            definition = definitions.get(int(item))
+            if definition is None:
+                return 404, {'message': 'NotFound'}
+            return 200, definition
+        if method == 'PUT' and item == 'update':
+            if not isinstance(body, list):
+                return 400, {'message': 'Expected a JSON array'}
+            for definition in body:
+                if definition.get('id') not in definitions:
+                    return 404, {'message': f"NotFound: {definition.get('id')}"}
+            for definition in body:
+                definitions[definition['id']] = definition
+            return 202, body
+        if method == 'PUT' and item is not None:
+            if int(item) not in definitions:
+                return 404, {'message': 'NotFound'}
+            definitions[int(item)] = dict(body, id=int(item))
+            return 202, definitions[int(item)]
+        return 405, {'message': 'Method not allowed'}
+
+    def _handle_collection(self, method, kind, item, body):
+        resources = self.collections[kind]
+        if item == 'update':
+            return 404, {'message': 'NotFound'}
+        resource_id = int(item) if item is not None else None
+
+        if method == 'GET' and resource_id is None:
+            return 200, list(resources.values())
+        if method == 'POST' and resource_id is None:
+            if not isinstance(body, dict) or not body.get('name'):
+                return 400, {'message': 'Name is required'}
+            if any(r['name'] == body['name'] for r in resources.values()):
+                return 400, {'message': 'Must be unique'}
+            resource = dict(body, id=self.next_id)
+            self.next_id += 1
+            resources[resource['id']] = resource
+            return 201, resource
+        if resource_id is None:
+            return 405, {'message': 'Method not allowed'}
+        if resource_id not in resources:
+            return 404, {'message': 'NotFound'}
+        if method == 'GET':
+            return 200, resources[resource_id]
+        if method == 'PUT':
+            if not isinstance(body, dict):
+                return 400, {'message': 'Expected a JSON object'}
+            resources[resource_id] = dict(body, id=resource_id)
+            return 202, resources[resource_id]
+        if method == 'DELETE':
+            del resources[resource_id]
+            return 200, {}
+        return 405, {'message': 'Method not allowed'}
+
+
+class MockArrHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; with Nagle on, every
+    # keep-alive response would stall on the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: Any = None,
+              headers: Optional[Dict[str, str]] = None):
+        payload = json.dumps(body).encode() if body is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _route(self):
+        state = self.server.state
+
+        # Always read the body so the connection can be reused
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+
+        match = ROUTE_RE.match(self.path.split('?', 1)[0])
+        kind = match.group(1) if match else 'unknown'
+        delay, failure = state.admit(f'{self.command} {kind}')
+        if delay:
+            time.sleep(delay)
+
+        if state.api_key and self.headers.get('X-Api-Key') != state.api_key:
+            return self._send(401, {'message': 'Unauthorized'})
+        if failure == 429:
+            return self._send(429, {'message': 'Too many requests'},
+                              {'Retry-After': '1'})
+        if failure:
+            return self._send(failure, {'message': 'Injected failure'})
+        if not match:
+            return self._send(404, {'message': 'NotFound'})
+
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except ValueError:
+            return self._send(400, {'message': 'Invalid JSON'})
+        status, response = state.handle(self.command, kind, match.group(2),
+                                        body)
+        self._send(status, response)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _route
+
+
+class MockArrServer:
+    """
+    A mock Arr instance on a background thread, usable as a context
+    manager. Takes the MockArrState arguments; times are in seconds.
+    """
+
+    def __init__(self, port: int = 0, host: str = '127.0.0.1', **options):
+        self.httpd = ThreadingHTTPServer((host, port), MockArrHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = MockArrState(**options)
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def state(self) -> MockArrState:
+        return self.httpd.state
+
+    def start(self) -> 'MockArrServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever,
+                                       daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'MockArrServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--app', choices=sorted(APP_VERSIONS), default='radarr')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7878)
+    parser.add_argument('--api-key', help='reject requests without this key')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='milliseconds added to every request')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='up to this many random extra milliseconds')
+    parser.add_argument('--failure-rate', type=float, default=0.0,
+                        help='fraction of requests answered with a 5xx')
+    parser.add_argument('--rate-limit', type=float, default=0.0,
+                        help='requests per second before answering 429')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    server = MockArrServer(args.port,
+                           args.host,
+                           app=args.app,
+                           api_key=args.api_key,
+                           latency=args.latency / 1000,
+                           jitter=args.jitter / 1000,
+                           failure_rate=args.failure_rate,
+                           rate_limit=args.rate_limit,
+                           seed=args.seed)
+    print(f'Mock {args.app.capitalize()} API listening on {server.url}')
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(json.dumps(server.state.stats, indent=2))
+
+
+if __name__ == '__main__':
+    main()
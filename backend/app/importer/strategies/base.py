@@ -30,6 +30,7 @@ class ImportStrategy(ABC):
         import_as_unique = arr_config['import_as_unique'] if 'import_as_unique' in arr_config.keys() else False
         self.import_as_unique = bool(import_as_unique) if import_as_unique is not None else False
         self.arr = ArrHandler(self.base_url, self.api_key)
+        self.import_logger = None
     
     @abstractmethod
     def compile(self, filenames: List[str]) -> Dict[str, Any]:
@@ -67,8 +68,10 @@ class ImportStrategy(ABC):
             dry_run: If True, simulate import without making changes
             
         Returns:
-            Import results
+            Import results, including a `timings` breakdown
         """
+        # compile() and import_data() record into this execution's logger
+        import_logger = self.import_logger = get_import_logger()
         try:
             # Compile
             compiled = self.compile(filenames)
@@ -81,16 +84,17 @@ class ImportStrategy(ABC):
                 results['dry_run'] = True
                 results['compiled_data'] = compiled
             
+            results['timings'] = import_logger.timings(self.arr.request_times)
             return results
             
         except Exception as e:
-            import_logger = get_import_logger()
             import_logger.error(f"Strategy execution failed: {e}", phase='import')
             return {
                 'added': 0,
                 'updated': 0,
                 'failed': len(filenames),
-                'error': str(e)
+                'error': str(e),
+                'timings': import_logger.timings(self.arr.request_times)
             }
         finally:
             # Clean up
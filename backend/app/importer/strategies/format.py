@@ -4,7 +4,6 @@ from typing import Dict, List, Any
 from .base import ImportStrategy
 from ..utils import load_yaml
 from ..compiler import compile_format_to_api_structure
-from ..logger import get_import_logger
 
 logger = logging.getLogger(__name__)
 
@@ -24,25 +23,28 @@ class FormatStrategy(ImportStrategy):
         """
         formats = []
         failed = []
-        import_logger = get_import_logger()
+        import_logger = self.import_logger
         
         # Don't try to predict - we'll count as we go
         import_logger.start(0, 0)  # Will update counts as we compile
         
         for filename in filenames:
+            started = import_logger.start_item()
             try:
                 # Load YAML
-                format_yaml = load_yaml(f"custom_format/{filename}.yml")
+                with import_logger.phase('load'):
+                    format_yaml = load_yaml(f"custom_format/{filename}.yml")
                 
                 # Compile to API structure
-                compiled = compile_format_to_api_structure(format_yaml, self.arr_type)
+                with import_logger.phase('compile'):
+                    compiled = compile_format_to_api_structure(format_yaml, self.arr_type)
                 
                 # Add unique suffix if needed
                 if self.import_as_unique:
                     compiled['name'] = self.add_unique_suffix(compiled['name'])
                 
                 formats.append(compiled)
-                import_logger.update_compilation(filename)
+                import_logger.update_compilation(filename, started)
                 
             except Exception as e:
                 import_logger.error(f"{e}", filename, 'compilation')
@@ -67,8 +69,11 @@ class FormatStrategy(ImportStrategy):
         Returns:
             Import results
         """
+        import_logger = self.import_logger
+
         # Get existing formats
-        existing = self.arr.get_all_formats()
+        with import_logger.phase('fetch'):
+            existing = self.arr.get_all_formats()
         existing_map = {f['name']: f['id'] for f in existing}
         
         results = {
@@ -78,26 +83,26 @@ class FormatStrategy(ImportStrategy):
             'details': []
         }
         
-        import_logger = get_import_logger()
-        
         # Set import count
         import_logger.total_import = len(compiled_data['formats'])
         import_logger._import_shown = False  # Reset import shown flag
         
         for format_data in compiled_data['formats']:
             format_name = format_data['name']
+            started = import_logger.start_item()
             
             try:
                 if format_name in existing_map:
                     # Update existing
                     if not dry_run:
                         format_data['id'] = existing_map[format_name]
-                        self.arr.put(
-                            f"/api/v3/customformat/{existing_map[format_name]}",
-                            format_data
-                        )
+                        with import_logger.phase('push'):
+                            self.arr.put(
+                                f"/api/v3/customformat/{existing_map[format_name]}",
+                                format_data
+                            )
                     
-                    import_logger.update_import(format_name, "updated")
+                    import_logger.update_import(format_name, "updated", started)
                     results['updated'] += 1
                     results['details'].append({
                         'name': format_name,
@@ -106,9 +111,10 @@ class FormatStrategy(ImportStrategy):
                 else:
                     # Add new
                     if not dry_run:
-                        self.arr.post("/api/v3/customformat", format_data)
+                        with import_logger.phase('push'):
+                            self.arr.post("/api/v3/customformat", format_data)
                     
-                    import_logger.update_import(format_name, "added")
+                    import_logger.update_import(format_name, "added", started)
                     results['added'] += 1
                     results['details'].append({
                         'name': format_name,
@@ -116,7 +122,7 @@ class FormatStrategy(ImportStrategy):
                     })
                     
             except Exception as e:
-                import_logger.update_import(format_name, "failed")
+                import_logger.update_import(format_name, "failed", started)
                 import_logger.error(f"Failed to import format {format_name}: {e}", format_name)
                 results['failed'] += 1
                 results['details'].append({
@@ -4,7 +4,6 @@ from typing import Dict, List, Any, Set
 from .base import ImportStrategy
 from ..utils import load_yaml, extract_format_names, generate_language_formats
 from ..compiler import compile_format_to_api_structure, compile_profile_to_api_structure
-from ..logger import get_import_logger
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +27,7 @@ class ProfileStrategy(ImportStrategy):
         # Cache for language formats to avoid recompiling
         language_formats_cache: Dict[str, List[Dict]] = {}
         
-        import_logger = get_import_logger()
+        import_logger = self.import_logger
         
         # Don't try to predict - we'll count as we go
         import_logger.start(0, 0)  # Will update counts as we compile
@@ -36,7 +35,8 @@ class ProfileStrategy(ImportStrategy):
         for filename in filenames:
             try:
                 # Load profile YAML
-                profile_yaml = load_yaml(f"profile/{filename}.yml")
+                with import_logger.phase('load'):
+                    profile_yaml = load_yaml(f"profile/{filename}.yml")
                 
                 # Extract referenced custom formats (only for the target arr type)
                 format_names = extract_format_names(profile_yaml, self.arr_type)
@@ -47,16 +47,19 @@ class ProfileStrategy(ImportStrategy):
                     if display_name in processed_formats:
                         continue
                     
+                    started = import_logger.start_item()
                     try:
-                        format_yaml = load_yaml(f"custom_format/{format_name}.yml")
-                        compiled_format = compile_format_to_api_structure(format_yaml, self.arr_type)
+                        with import_logger.phase('load'):
+                            format_yaml = load_yaml(f"custom_format/{format_name}.yml")
+                        with import_logger.phase('compile'):
+                            compiled_format = compile_format_to_api_structure(format_yaml, self.arr_type)
                         
                         if self.import_as_unique:
                             compiled_format['name'] = self.add_unique_suffix(compiled_format['name'])
                         
                         all_formats.append(compiled_format)
                         processed_formats.add(compiled_format['name'])
-                        import_logger.update_compilation(format_name)
+                        import_logger.update_compilation(format_name, started)
                         
                     except Exception as e:
                         # Count the failed attempt
@@ -67,12 +70,15 @@ class ProfileStrategy(ImportStrategy):
                 if language != 'any' and '_' in language:
                     # Check cache first
                     if language not in language_formats_cache:
-                        language_formats = generate_language_formats(language, self.arr_type)
+                        started = import_logger.start_item()
+                        with import_logger.phase('compile'):
+                            language_formats = generate_language_formats(language, self.arr_type)
                         compiled_langs = []
                         
                         for lang_format in language_formats:
                             lang_name = lang_format.get('name', 'Language format')
-                            compiled_lang = compile_format_to_api_structure(lang_format, self.arr_type)
+                            with import_logger.phase('compile'):
+                                compiled_lang = compile_format_to_api_structure(lang_format, self.arr_type)
                             
                             if self.import_as_unique:
                                 compiled_lang['name'] = self.add_unique_suffix(compiled_lang['name'])
@@ -83,13 +89,16 @@ class ProfileStrategy(ImportStrategy):
                             if compiled_lang['name'] not in processed_formats:
                                 all_formats.append(compiled_lang)
                                 processed_formats.add(compiled_lang['name'])
-                                import_logger.update_compilation(lang_name)
+                                import_logger.update_compilation(lang_name, started)
+                                started = import_logger.start_item()
                         
                         # Store in cache
                         language_formats_cache[language] = compiled_langs
                 
                 # Compile profile
-                compiled_profile = compile_profile_to_api_structure(profile_yaml, self.arr_type)
+                profile_started = import_logger.start_item()
+                with import_logger.phase('compile'):
+                    compiled_profile = compile_profile_to_api_structure(profile_yaml, self.arr_type)
                 
                 if self.import_as_unique:
                     compiled_profile['name'] = self.add_unique_suffix(compiled_profile['name'])
@@ -99,7 +108,8 @@ class ProfileStrategy(ImportStrategy):
                         item['name'] = self.add_unique_suffix(item['name'])
                 
                 profiles.append(compiled_profile)
-                import_logger.update_compilation(f"Profile: {compiled_profile['name']}")
+                import_logger.update_compilation(
+                    f"Profile: {compiled_profile['name']}", profile_started)
                 
             except Exception as e:
                 import_logger.error(f"{str(e)}", f"Profile: {filename}", 'compilation')
@@ -132,7 +142,7 @@ class ProfileStrategy(ImportStrategy):
             'details': []
         }
         
-        import_logger = get_import_logger()
+        import_logger = self.import_logger
         
         # Set total import count
         import_logger.total_import = len(compiled_data['formats']) + len(compiled_data['profiles'])
@@ -140,24 +150,27 @@ class ProfileStrategy(ImportStrategy):
         
         # Import formats first
         if compiled_data['formats']:
-            existing_formats = self.arr.get_all_formats()
+            with import_logger.phase('fetch'):
+                existing_formats = self.arr.get_all_formats()
             format_map = {f['name']: f['id'] for f in existing_formats}
             
             formats_failed = []
             
             for format_data in compiled_data['formats']:
                 format_name = format_data['name']
+                started = import_logger.start_item()
                 
                 try:
                     if format_name in format_map:
                         # Update existing
                         if not dry_run:
                             format_data['id'] = format_map[format_name]
-                            self.arr.put(
-                                f"/api/v3/customformat/{format_map[format_name]}",
-                                format_data
-                            )
-                        import_logger.update_import(format_name, "updated")
+                            with import_logger.phase('push'):
+                                self.arr.put(
+                                    f"/api/v3/customformat/{format_map[format_name]}",
+                                    format_data
+                                )
+                        import_logger.update_import(format_name, "updated", started)
                     else:
                         # Add new
                         if dry_run:
@@ -166,19 +179,21 @@ class ProfileStrategy(ImportStrategy):
                             fake_id = 999000 + len(format_map)
                             format_map[format_name] = fake_id
                         else:
-                            response = self.arr.post("/api/v3/customformat", format_data)
+                            with import_logger.phase('push'):
+                                response = self.arr.post("/api/v3/customformat", format_data)
                             format_map[format_name] = response['id']
-                        import_logger.update_import(format_name, "added")
+                        import_logger.update_import(format_name, "added", started)
                         
                 except Exception as e:
-                    import_logger.update_import(format_name, "failed")
+                    import_logger.update_import(format_name, "failed", started)
                     import_logger.error(f"Failed to import format {format_name}: {e}", format_name)
                     formats_failed.append(format_name)
         
         # Refresh format map for profile syncing (MUST be done after importing formats)
         if not dry_run:
             # In real mode, get the actual current formats from the server
-            existing_formats = self.arr.get_all_formats()
+            with import_logger.phase('fetch'):
+                existing_formats = self.arr.get_all_formats()
             format_map = {f['name']: f['id'] for f in existing_formats}
         # In dry run mode, format_map already has fake IDs from above
         
@@ -211,23 +226,26 @@ class ProfileStrategy(ImportStrategy):
             profile['formatItems'] = synced_items
         
         # Import profiles
-        existing_profiles = self.arr.get_all_profiles()
+        with import_logger.phase('fetch'):
+            existing_profiles = self.arr.get_all_profiles()
         profile_map = {p['name']: p['id'] for p in existing_profiles}
         
         for profile_data in compiled_data['profiles']:
             profile_name = profile_data['name']
+            started = import_logger.start_item()
             
             try:
                 if profile_name in profile_map:
                     # Update existing
                     if not dry_run:
                         profile_data['id'] = profile_map[profile_name]
-                        self.arr.put(
-                            f"/api/v3/qualityprofile/{profile_data['id']}",
-                            profile_data
-                        )
+                        with import_logger.phase('push'):
+                            self.arr.put(
+                                f"/api/v3/qualityprofile/{profile_data['id']}",
+                                profile_data
+                            )
                     
-                    import_logger.update_import(f"Profile: {profile_name}", "updated")
+                    import_logger.update_import(f"Profile: {profile_name}", "updated", started)
                     results['updated'] += 1
                     results['details'].append({
                         'name': profile_name,
@@ -236,9 +254,10 @@ class ProfileStrategy(ImportStrategy):
                 else:
                     # Add new
                     if not dry_run:
-                        self.arr.post("/api/v3/qualityprofile", profile_data)
+                        with import_logger.phase('push'):
+                            self.arr.post("/api/v3/qualityprofile", profile_data)
                     
-                    import_logger.update_import(f"Profile: {profile_name}", "added")
+                    import_logger.update_import(f"Profile: {profile_name}", "added", started)
                     results['added'] += 1
                     results['details'].append({
                         'name': profile_name,
@@ -246,7 +265,7 @@ class ProfileStrategy(ImportStrategy):
                     })
                     
             except Exception as e:
-                import_logger.update_import(f"Profile: {profile_name}", "failed")
+                import_logger.update_import(f"Profile: {profile_name}", "failed", started)
                 import_logger.error(f"Failed to import profile {profile_name}: {e}", profile_name)
                 results['failed'] += 1
                 results['details'].append({
@@ -1,9 +1,10 @@
 """Utility functions for import operations."""
 import logging
-import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Set
+from ..utils import yaml_io
 from ..data.utils import get_category_directory
+from ..compile.language_cache import language_format_cache, get_template
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,7 @@ def load_yaml(file_path: str) -> Dict[str, Any]:
         
     Raises:
         FileNotFoundError: If file doesn't exist
-        yaml.YAMLError: If YAML is invalid
+        yaml_io.YAMLError: If YAML is invalid
     """
     # Handle both absolute and relative paths
     if file_path.startswith('/'):
@@ -43,7 +44,7 @@ def load_yaml(file_path: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"File not found: {full_path}")
     
     with open(full_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+        return yaml_io.load(f)
 
 
 def extract_format_names(profile_data: Dict[str, Any], arr_type: str = None) -> Set[str]:
@@ -97,56 +98,64 @@ def generate_language_formats(language: str, arr_type: str) -> List[Dict[str, An
         return []
     
     behavior, language_code = language.split('_', 1)
-    formats = []
     
     # Handle behaviors: 'must' and 'only' (matching old working logic)
-    if behavior in ['must', 'only']:
-        # Load base "Not English" format as template
-        try:
-            base_format = load_yaml('custom_format/Not English.yml')
-            
-            # Create "Not [Language]" format
-            not_format = base_format.copy()
-            lang_display = language_code.capitalize()
-            not_format['name'] = f"Not {lang_display}"
+    if behavior not in ['must', 'only']:
+        return []
+    
+    try:
+        return language_format_cache.get_variants(
+            'importer', behavior, language_code, arr_type,
+            lambda templates: _build_language_formats(templates, behavior, language_code))
+    except Exception as e:
+        # Silent fail - will be caught at higher level
+        return []
+
+
+def _build_language_formats(templates: Dict[str, Any], behavior: str,
+                            language_code: str) -> List[Dict[str, Any]]:
+    """Build the language variants from the cached templates."""
+    formats = []
+    
+    # Use "Not English" as the base template
+    not_format = get_template(templates, 'Not English')
+    
+    # Create "Not [Language]" format
+    lang_display = language_code.capitalize()
+    not_format['name'] = f"Not {lang_display}"
+    
+    # Update conditions for the specific language
+    for condition in not_format.get('conditions', []):
+        if condition.get('type') == 'language':
+            condition['language'] = language_code
+            if 'name' in condition:
+                condition['name'] = condition['name'].replace('English', lang_display)
+            # Note: exceptLanguage field is preserved from the base format
+    
+    formats.append(not_format)
+    
+    # For 'only' behavior, add additional formats
+    if behavior == 'only':
+        additional_format_names = [
+            "Not Only English",
+            "Not Only English (Missing)"
+        ]
+        
+        for format_name in additional_format_names:
+            # Silent skip - format doesn't exist
+            if format_name not in templates:
+                continue
+            additional = templates[format_name]
+            additional['name'] = additional['name'].replace('English', lang_display)
             
-            # Update conditions for the specific language
-            for condition in not_format.get('conditions', []):
+            for condition in additional.get('conditions', []):
                 if condition.get('type') == 'language':
                     condition['language'] = language_code
                     if 'name' in condition:
                         condition['name'] = condition['name'].replace('English', lang_display)
                     # Note: exceptLanguage field is preserved from the base format
             
-            formats.append(not_format)
-            
-            # For 'only' behavior, add additional formats
-            if behavior == 'only':
-                additional_format_names = [
-                    "Not Only English",
-                    "Not Only English (Missing)"
-                ]
-                
-                for format_name in additional_format_names:
-                    try:
-                        additional = load_yaml(f'custom_format/{format_name}.yml')
-                        additional['name'] = additional['name'].replace('English', lang_display)
-                        
-                        for condition in additional.get('conditions', []):
-                            if condition.get('type') == 'language':
-                                condition['language'] = language_code
-                                if 'name' in condition:
-                                    condition['name'] = condition['name'].replace('English', lang_display)
-                                # Note: exceptLanguage field is preserved from the base format
-                        
-                        formats.append(additional)
-                    except Exception as e:
-                        # Silent fail - format doesn't exist
-                        pass
-        
-        except Exception as e:
-            # Silent fail - will be caught at higher level
-            pass
+            formats.append(additional)
     
     return formats
 
@@ -169,7 +178,7 @@ def load_regex_patterns() -> Dict[str, str]:
     for pattern_file in pattern_dir.glob('*.yml'):
         try:
             with open(pattern_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml_io.load(f)
                 if data and 'name' in data and 'pattern' in data:
                     patterns[data['name']] = data['pattern']
         except Exception as e:
@@ -1,6 +1,12 @@
-from flask import Blueprint, jsonify, request, send_file
+from flask import (Blueprint, Response, jsonify, request, send_file,
+                   stream_with_context)
+import json
 import os
+import threading
+import time
 from ..config import config
+from .follow import get_follower
+from .reader import count_lines, make_matcher, read_forward, read_tail
 import logging
 
 bp = Blueprint('logs', __name__)
@@ -47,45 +53,172 @@ def get_log_content(filename):
                                  type=int)  # Number of lines to return
         level = request.args.get('level')  # Log level filter
         search = request.args.get('search')  # Search term
+        cursor = request.args.get('cursor', type=int)  # Forward byte offset
+        limit = request.args.get('limit', type=int)  # Page size for cursor
+        before = request.args.get('before', type=int)  # Tail byte offset
+        since = request.args.get('since')  # 'YYYY-MM-DD HH:MM:SS'
 
         # If no filters, return the whole file
-        if not any([lines, level, search]):
+        if not any([lines, level, search, since, cursor is not None]):
             return send_file(file_path, mimetype='text/plain')
 
-        # Read and filter log content
-        with open(file_path, 'r') as f:
-            content = f.readlines()
+        result = {'filename': filename, 'total_lines': count_lines(file_path)}
 
-        # Apply filters
-        filtered_content = content
+        if lines and cursor is None:
+            # Tail: read backwards from EOF (or from `before`)
+            content, result['cursor'] = read_tail(file_path,
+                                                  lines,
+                                                  level=level,
+                                                  search=search,
+                                                  before=before)
+        else:
+            # Forward page starting at a byte offset
+            content, result['next_cursor'], result[
+                'has_more'] = read_forward(file_path,
+                                           cursor=cursor or 0,
+                                           limit=limit,
+                                           level=level,
+                                           search=search,
+                                           since=since)
 
-        if level:
-            filtered_content = [
-                line for line in filtered_content
-                if f' - {level.upper()} - ' in line
-            ]
-
-        if search:
-            filtered_content = [
-                line for line in filtered_content
-                if search.lower() in line.lower()
-            ]
-
-        if lines:
-            filtered_content = filtered_content[-lines:]
-
-        return jsonify({
-            'filename': filename,
-            'total_lines': len(content),
-            'filtered_lines': len(filtered_content),
-            'content': filtered_content
-        }), 200
+        result['filtered_lines'] = len(content)
+        result['content'] = content
+        return jsonify(result), 200
 
     except Exception as e:
         logger.error(f"Error reading log file {filename}: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 
+STREAMABLE_LOGS = (config.GENERAL_LOG_FILE, config.IMPORTARR_LOG_FILE)
+STREAM_POLL_SECONDS = 1.0
+STREAM_KEEPALIVE_SECONDS = 15
+# Lines read per step when a watcher is behind the ring buffer
+STREAM_CATCHUP_LINES = 500
+# Seconds a client turned away because every stream slot is taken is
+# asked to wait
+STREAM_RETRY_SECONDS = 30
+
+_stream_slots = threading.BoundedSemaphore(config.LOG_STREAM_MAX_CONCURRENT)
+
+
+def _sse_event(lines, inode, cursor):
+    """One SSE message carrying a batch of lines; the id resumes after them"""
+    return (f'id: {inode}:{cursor}\n'
+            f'data: {json.dumps({"lines": lines})}\n\n')
+
+
+def _follow(file_path):
+    """The event-stream response following file_path for this request"""
+    level = request.args.get('level')
+    search = request.args.get('search')
+    backlog = request.args.get('backlog', 0, type=int)
+    offset = request.args.get('offset', type=int)
+    matches = make_matcher(level, search)
+
+    follower = get_follower(file_path, config.LOG_STREAM_BUFFER_LINES)
+    follower.poll()
+
+    # Event ids are '<inode>:<offset>' so a reconnect after rotation
+    # starts over on the new file instead of seeking into it
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    if ':' in last_event_id:
+        inode, _, last_offset = last_event_id.partition(':')
+        if inode == str(follower.inode) and last_offset.isdigit():
+            offset = int(last_offset)
+        else:
+            offset = 0
+
+    def generate():
+        inode = follower.inode
+        cursor = offset
+        if cursor is None:
+            cursor = follower.position
+            if backlog > 0:
+                recent = [
+                    line for _, _, line in follower.recent(
+                        config.LOG_STREAM_BUFFER_LINES) if matches(line)
+                ]
+                if recent:
+                    yield _sse_event(recent[-backlog:], inode, cursor)
+
+        deadline = time.monotonic() + config.LOG_STREAM_MAX_SECONDS
+        last_sent = time.monotonic()
+        while time.monotonic() < deadline:
+            follower.poll()
+            if follower.inode != inode:
+                inode = follower.inode
+                cursor = 0
+                yield 'event: rotated\ndata: {}\n\n'
+
+            entries, covered = follower.read_since(cursor)
+            if not covered:
+                # Behind the ring buffer: catch up from disk in pages
+                lines, cursor, _ = read_forward(file_path,
+                                                cursor,
+                                                limit=STREAM_CATCHUP_LINES,
+                                                level=level,
+                                                search=search)
+                if lines:
+                    yield _sse_event(lines, inode, cursor)
+                    last_sent = time.monotonic()
+                continue
+
+            if entries:
+                cursor = entries[-1][1]
+                lines = [line for _, _, line in entries if matches(line)]
+                if lines:
+                    yield _sse_event(lines, inode, cursor)
+                    last_sent = time.monotonic()
+
+            if time.monotonic() - last_sent >= STREAM_KEEPALIVE_SECONDS:
+                yield ': keepalive\n\n'
+                last_sent = time.monotonic()
+            time.sleep(STREAM_POLL_SECONDS)
+
+        # Streams are bounded so they never pin a worker; EventSource
+        # reconnects with Last-Event-ID and resumes where this one stopped
+        yield f'id: {inode}:{cursor}\nevent: reconnect\ndata: {{}}\n\n'
+
+    return Response(stream_with_context(generate()),
+                    mimetype='text/event-stream',
+                    headers={
+                        'Cache-Control': 'no-cache',
+                        'X-Accel-Buffering': 'no'
+                    })
+
+
+@bp.route('/<filename>/stream', methods=['GET'])
+def stream_log(filename):
+    """
+    Follow a log file as server-sent events. Starts at `offset` (or the
+    Last-Event-ID of a reconnecting client), otherwise at the end of the
+    file after sending `backlog` recent lines. `level` and `search`
+    filter lines server-side. At most config.LOG_STREAM_MAX_CONCURRENT
+    streams are open at once; further ones get a 503.
+    """
+    file_paths = {os.path.basename(path): path for path in STREAMABLE_LOGS}
+    file_path = file_paths.get(filename)
+    if not file_path or not os.path.exists(file_path):
+        return jsonify({'error': 'Log file not found'}), 404
+
+    if not _stream_slots.acquire(blocking=False):
+        return jsonify({
+            'error': 'Too many open log streams',
+            'retry': STREAM_RETRY_SECONDS
+        }), 503, {
+            'Retry-After': str(STREAM_RETRY_SECONDS)
+        }
+    try:
+        response = _follow(file_path)
+    except Exception:
+        _stream_slots.release()
+        raise
+    # The slot is held until the stream has been closed
+    response.call_on_close(_stream_slots.release)
+    return response
+
+
 @bp.route('/level/<level>', methods=['GET'])
 def get_logs_by_level(level):
     """Get all logs of a specific level."""
@@ -96,13 +229,8 @@ def get_logs_by_level(level):
         for filename in os.listdir(log_dir):
             if filename.endswith('.log'):
                 file_path = os.path.join(log_dir, filename)
-                with open(file_path, 'r') as f:
-                    matching_lines = [
-                        line.strip() for line in f
-                        if f' - {level.upper()} - ' in line
-                    ]
-                    if matching_lines:
-                        results.extend(matching_lines)
+                matching_lines, _, _ = read_forward(file_path, level=level)
+                results.extend(line.strip() for line in matching_lines)
 
         return jsonify({
             'level': level.upper(),
@@ -129,13 +257,8 @@ def search_logs():
         for filename in os.listdir(log_dir):
             if filename.endswith('.log'):
                 file_path = os.path.join(log_dir, filename)
-                with open(file_path, 'r') as f:
-                    matching_lines = [
-                        line.strip() for line in f
-                        if term.lower() in line.lower()
-                    ]
-                    if matching_lines:
-                        results.extend(matching_lines)
+                matching_lines, _, _ = read_forward(file_path, search=term)
+                results.extend(line.strip() for line in matching_lines)
 
         return jsonify({
             'term': term,
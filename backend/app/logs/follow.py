@@ -0,0 +1,103 @@
+# app/logs/follow.py
+from collections import deque
+import os
+import threading
+
+# How far back a fresh follower starts reading, so new watchers get some
+# context without the whole file being read
+INITIAL_BACKFILL_BYTES = 64 * 1024
+
+_followers = {}
+_followers_lock = threading.Lock()
+
+
+class LogFollower:
+    """
+    Follows one log file for every watcher in this process. Each poll
+    reads only the bytes appended since the previous one and keeps the
+    most recent lines in a bounded ring buffer, so any number of watchers
+    cost a single stat plus O(new bytes).
+
+    Byte offsets only apply to the file with the current `inode`; when
+    the file is rotated or truncated the buffer starts over.
+    """
+
+    def __init__(self, file_path, capacity):
+        self.file_path = file_path
+        self.lines = deque(maxlen=capacity)
+        self.position = 0
+        self.inode = None
+        self._lock = threading.Lock()
+
+    def poll(self):
+        """Read newly appended complete lines into the buffer"""
+        with self._lock:
+            try:
+                stat = os.stat(self.file_path)
+            except FileNotFoundError:
+                return
+
+            if self.inode is None:
+                self.inode = stat.st_ino
+                self.position = self._next_line_start(
+                    max(0, stat.st_size - INITIAL_BACKFILL_BYTES))
+            elif stat.st_ino != self.inode or stat.st_size < self.position:
+                self.inode = stat.st_ino
+                self.position = 0
+                self.lines.clear()
+
+            if stat.st_size == self.position:
+                return
+
+            with open(self.file_path, 'rb') as f:
+                f.seek(self.position)
+                while True:
+                    raw = f.readline()
+                    # A line without its newline is still being written
+                    if not raw.endswith(b'\n'):
+                        break
+                    end = self.position + len(raw)
+                    self.lines.append((self.position, end,
+                                       raw.decode('utf-8',
+                                                  errors='replace')))
+                    self.position = end
+
+    def _next_line_start(self, offset):
+        """First line boundary at or after `offset`"""
+        if offset == 0:
+            return 0
+        with open(self.file_path, 'rb') as f:
+            f.seek(offset - 1)
+            f.readline()
+            return f.tell()
+
+    def recent(self, count):
+        """The last `count` buffered (offset, end, line) entries"""
+        with self._lock:
+            entries = list(self.lines)
+        return entries[-count:] if count > 0 else []
+
+    def read_since(self, offset):
+        """
+        Buffered (offset, end, line) entries starting at or after `offset`.
+        Returns (entries, covered); covered is False when `offset` is older
+        than the buffer and the gap has to be read from the file.
+        """
+        with self._lock:
+            entries = list(self.lines)
+            position = self.position
+        if offset >= position:
+            return [], True
+        if not entries or offset < entries[0][0]:
+            return [], False
+        return [entry for entry in entries if entry[0] >= offset], True
+
+
+def get_follower(file_path, capacity):
+    """Shared LogFollower for a file"""
+    with _followers_lock:
+        follower = _followers.get(file_path)
+        if follower is None:
+            follower = LogFollower(file_path, capacity)
+            _followers[file_path] = follower
+        return follower
@@ -0,0 +1,260 @@
+# app/logs/reader.py
+from collections import OrderedDict, namedtuple
+import os
+import re
+import threading
+
+LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+# Log files are indexed in line-aligned blocks of about this size
+BLOCK_SIZE = 256 * 1024
+READ_SIZE = 64 * 1024
+MAX_INDEXED_FILES = 64
+
+TIMESTAMP_RE = re.compile(rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - ',
+                          re.M)
+
+LogBlock = namedtuple('LogBlock',
+                      ['start', 'end', 'lines', 'levels', 'first_ts',
+                       'last_ts'])
+
+
+class LogIndex:
+    """
+    Sparse index of a log file: for each block, its byte range, line count,
+    the levels that occur in it and the first/last timestamps. Log files
+    only ever grow, so updating the index reads just the new bytes.
+    """
+
+    def __init__(self):
+        self.blocks = []
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def update(self, file_path):
+        with open(file_path, 'rb') as f:
+            f.seek(self.size)
+            while True:
+                data = f.read(BLOCK_SIZE)
+                if not data:
+                    break
+                # Only index complete lines; a partial trailing line is
+                # picked up on the next update
+                cut = data.rfind(b'\n')
+                if cut == -1:
+                    if len(data) < BLOCK_SIZE:
+                        break
+                    cut = len(data) - 1
+                data = data[:cut + 1]
+
+                timestamps = TIMESTAMP_RE.findall(data)
+                self.blocks.append(
+                    LogBlock(
+                        start=self.size,
+                        end=self.size + len(data),
+                        lines=data.count(b'\n'),
+                        levels=frozenset(
+                            level for level in LEVELS
+                            if f' - {level} - '.encode() in data),
+                        first_ts=timestamps[0].decode() if timestamps else None,
+                        last_ts=timestamps[-1].decode() if timestamps else None))
+                self.size += len(data)
+                f.seek(self.size)
+
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_index(file_path):
+    """
+    Return an up-to-date LogIndex for a file. Indexes are keyed by inode,
+    so when the handler rotates profilarr.log to profilarr.log.1 the
+    existing index moves with the file and the new file starts fresh.
+    """
+    stat = os.stat(file_path)
+    key = (stat.st_dev, stat.st_ino)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None or stat.st_size < index.size:
+            index = LogIndex()
+            _indexes[key] = index
+        _indexes.move_to_end(key)
+        while len(_indexes) > MAX_INDEXED_FILES:
+            _indexes.popitem(last=False)
+
+    with index.lock:
+        index.update(file_path)
+    return index
+
+
+def make_matcher(level=None, search=None):
+    level_token = f' - {level.upper()} - ' if level else None
+    search = search.lower() if search else None
+
+    def matches(line):
+        if level_token and level_token not in line:
+            return False
+        if search and search not in line.lower():
+            return False
+        return True
+
+    return matches
+
+
+def _candidate_ranges(index, file_size, level=None, since=None):
+    """
+    Byte ranges that may contain matching lines, skipping indexed blocks
+    that lack the requested level or end before `since`. Bytes past the
+    indexed size are always included.
+    """
+    level = level.upper() if level else None
+    ranges = []
+    for block in index.blocks:
+        if level and level not in block.levels:
+            continue
+        if since and block.last_ts and block.last_ts < since:
+            continue
+        if ranges and ranges[-1][1] == block.start:
+            ranges[-1][1] = block.end
+        else:
+            ranges.append([block.start, block.end])
+    if file_size > index.size:
+        if ranges and ranges[-1][1] == index.size:
+            ranges[-1][1] = file_size
+        else:
+            ranges.append([index.size, file_size])
+    return ranges
+
+
+def _iter_lines_forward(f, start, end):
+    """Yield (offset, line_bytes) for lines starting in [start, end)"""
+    f.seek(start)
+    offset = start
+    while offset < end:
+        line = f.readline()
+        if not line:
+            break
+        yield offset, line
+        offset += len(line)
+
+
+def _iter_lines_reverse(f, start, end):
+    """Yield (offset, line_bytes) for lines in [start, end), last first"""
+    pos = end
+    carry = b''
+    while pos > start:
+        size = min(READ_SIZE, pos - start)
+        pos -= size
+        f.seek(pos)
+        parts = (f.read(size) + carry).split(b'\n')
+        # The first part may continue a line that began before `pos`
+        carry = parts[0]
+        offsets = []
+        offset = pos
+        for part in parts:
+            offsets.append(offset)
+            offset += len(part) + 1
+        for i in range(len(parts) - 1, 0, -1):
+            if offsets[i] >= end:
+                continue
+            newline = b'\n' if offsets[i] + len(parts[i]) < end else b''
+            yield offsets[i], parts[i] + newline
+    if carry:
+        newline = b'\n' if start + len(carry) < end else b''
+        yield start, carry + newline
+
+
+def _decode(line):
+    return line.decode('utf-8', errors='replace')
+
+
+def count_lines(file_path):
+    """Total number of lines in a log file, answered from the index"""
+    index = get_index(file_path)
+    total = sum(block.lines for block in index.blocks)
+    if os.path.getsize(file_path) > index.size:
+        with open(file_path, 'rb') as f:
+            f.seek(index.size)
+            tail = f.read()
+        total += tail.count(b'\n') + (0 if tail.endswith(b'\n') else 1)
+    return total
+
+
+def read_tail(file_path, lines, level=None, search=None, before=None):
+    """
+    Return the last `lines` matching lines, oldest first, reading backwards
+    from EOF (or from byte offset `before`). Also returns the offset of
+    the oldest line returned, which pages further back when passed as
+    `before`, or None once the start of the file is reached.
+    """
+    index = get_index(file_path)
+    file_size = os.path.getsize(file_path)
+    end = file_size if before is None else min(before, file_size)
+    matches = make_matcher(level, search)
+
+    found = []
+    cursor = None
+    with open(file_path, 'rb') as f:
+        for start, range_end in reversed(_candidate_ranges(
+                index, file_size, level)):
+            if start >= end:
+                continue
+            for offset, raw in _iter_lines_reverse(f, start,
+                                                   min(range_end, end)):
+                line = _decode(raw)
+                if matches(line):
+                    found.append(line)
+                    cursor = offset
+                    if len(found) >= lines:
+                        break
+            if len(found) >= lines:
+                break
+
+    found.reverse()
+    if len(found) < lines:
+        cursor = None
+    return found, cursor
+
+
+def read_forward(file_path, cursor=0, limit=None, level=None, search=None,
+                 since=None):
+    """
+    Stream matching lines from byte offset `cursor`. Returns
+    (lines, next_cursor, has_more); passing next_cursor back resumes right
+    after the last complete line read, so it also works for following a
+    growing file. `since` ('YYYY-MM-DD HH:MM:SS') skips older entries.
+    """
+    index = get_index(file_path)
+    file_size = os.path.getsize(file_path)
+    matches = make_matcher(level, search)
+
+    found = []
+    position = cursor
+    current_ts = None
+    with open(file_path, 'rb') as f:
+        for start, end in _candidate_ranges(index, file_size, level, since):
+            if end <= cursor:
+                continue
+            for offset, raw in _iter_lines_forward(f, max(start, cursor),
+                                                   end):
+                if limit is not None and len(found) >= limit:
+                    return found, offset, True
+                # A line without its newline is still being written
+                if not raw.endswith(b'\n'):
+                    break
+                position = offset + len(raw)
+                line = _decode(raw)
+                if since:
+                    # Continuation lines (tracebacks) share their header's
+                    # timestamp
+                    header = TIMESTAMP_RE.match(raw)
+                    if header:
+                        current_ts = header.group(1).decode()
+                    if current_ts is None or current_ts < since:
+                        continue
+                if matches(line):
+                    found.append(line)
+
+    # Skipped blocks hold no matches, so it is safe to resume past them
+    return found, max(position, index.size), False
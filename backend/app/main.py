@@ -1,26 +1,49 @@
 # backend/app/main.py
 
-from flask import Flask, jsonify, send_from_directory
-import os
+import threading
+
+from flask import Flask, jsonify
 from flask_cors import CORS
 from .config import config
-from .git import bp as git_bp
-from .arr import bp as arr_bp
-from .data import bp as data_bp
-from .importarr import bp as importarr_bp
-from .importer.routes import bp as new_import_bp
-from .task import bp as tasks_bp, TaskScheduler
-from .backup import bp as backup_bp
 from .db import run_migrations, get_settings
-from .auth import bp as auth_bp
-from .settings import bp as settings_bp
-from .logs import bp as logs_bp
-from .media_management import media_management_bp
-from .middleware import init_middleware
+from .middleware import init_middleware, init_compression
+from .metrics import init_metrics
+from .profiling import init_profiling
+from .static_assets import init_static
+from .subsystems import LazyBlueprints, Subsystem
 from .init import setup_logging, init_app_config, init_git_user
 
+# Needed to log in and load the UI shell, so always registered up front
+CORE_BLUEPRINTS = (
+    Subsystem('/api/auth', '.auth', 'bp', '/api/auth'),
+    Subsystem('/api/settings', '.settings', 'bp', '/api/settings'),
+    Subsystem('/api/logs', '.logs', 'bp', '/api/logs'),
+)
+
+# Registered on first use, or by the startup thread, when lazy
+LAZY_BLUEPRINTS = (
+    Subsystem('/api/backup', '.backup', 'bp', '/api/backup'),
+    Subsystem('/api/git', '.git', 'bp', '/api/git'),
+    Subsystem('/api/data', '.data', 'bp', '/api/data'),
+    Subsystem('/api/import', '.importarr', 'bp', '/api/import'),
+    Subsystem('/api/v2/import', '.importer.routes', 'bp', '/api/v2/import'),
+    Subsystem('/api/arr', '.arr', 'bp', '/api/arr'),
+    Subsystem('/api/tasks', '.task', 'bp', '/api/tasks'),
+    Subsystem('/api/media-management', '.media_management',
+              'media_management_bp', None),
+)
+
+
+def create_app(lazy=None):
+    """
+    Build the app. When lazy (config.LAZY_STARTUP outside debug mode) it
+    serves as soon as migrations have run: the git user, the subsystems in
+    LAZY_BLUEPRINTS and the task scheduler are set up by a background
+    thread, and a request reaching a subsystem first loads it itself.
+    """
+    if lazy is None:
+        lazy = config.LAZY_STARTUP and not config.DEBUG
 
-def create_app():
     # Set up logging first
     logger = setup_logging()
 
@@ -28,15 +51,8 @@ def create_app():
     app = Flask(__name__, static_folder='static')
     CORS(app, resources={r"/*": {"origins": "*"}})
 
-    # Serve static files
-    @app.route('/', defaults={'path': ''})
-    @app.route('/<path:path>')
-    def serve_static(path):
-        if path.startswith('api/'):
-            return  # Let API routes handle these
-        if path and os.path.exists(os.path.join(app.static_folder, path)):
-            return send_from_directory(app.static_folder, path)
-        return send_from_directory(app.static_folder, 'index.html')
+    # Serve static files from a manifest built once at startup
+    init_static(app)
 
     # Initialize directories and database
     logger.info("Ensuring required directories exist")
@@ -45,51 +61,81 @@ def create_app():
     logger.info("Initializing database")
     run_migrations()
 
-    # Initialize Git user configuration
-    logger.info("Initializing Git user")
-    success, message = init_git_user()
-    if not success:
-        logger.warning(f"Git user initialization issue: {message}")
-    else:
-        logger.info("Git user initialized successfully")
+    git_user_lock = threading.Lock()
+    git_user_ready = []
+
+    def setup_git_user():
+        # Git operations need the repository's user configured first
+        with git_user_lock:
+            if git_user_ready:
+                return
+            logger.info("Initializing Git user")
+            success, message = init_git_user()
+            if not success:
+                logger.warning(f"Git user initialization issue: {message}")
+            else:
+                logger.info("Git user initialized successfully")
+            git_user_ready.append(True)
+
+    def start_scheduler():
+        # Every worker runs one, but only the holder of the scheduler lease
+        # loads and runs the tasks
+        from .task import TaskScheduler
+
+        logger.info("Starting task scheduler")
+        scheduler = TaskScheduler()
+        scheduler.start()
 
     # Initialize app configuration
     init_app_config(app)
 
-    # Initialize and start task scheduler
-    logger.info("Starting task scheduler")
-    scheduler = TaskScheduler()
-    scheduler.load_tasks_from_db()
-    scheduler.start()
-
     # Register all blueprints
     logger.info("Registering blueprints")
-    app.register_blueprint(auth_bp, url_prefix='/api/auth')
-    app.register_blueprint(settings_bp, url_prefix='/api/settings')
-    app.register_blueprint(backup_bp, url_prefix='/api/backup')
-    app.register_blueprint(logs_bp, url_prefix='/api/logs')
-    app.register_blueprint(git_bp, url_prefix='/api/git')
-    app.register_blueprint(data_bp, url_prefix='/api/data')
-    app.register_blueprint(importarr_bp, url_prefix='/api/import')
-    app.register_blueprint(new_import_bp, url_prefix='/api/v2/import')
-    app.register_blueprint(arr_bp, url_prefix='/api/arr')
-    app.register_blueprint(tasks_bp, url_prefix='/api/tasks')
-    app.register_blueprint(media_management_bp)
-
-    # Initialize middleware
+    subsystems = tuple(
+        subsystem._replace(setup=setup_git_user)
+        if subsystem.path == '/api/git' else subsystem
+        for subsystem in LAZY_BLUEPRINTS)
+    if not lazy:
+        setup_git_user()
+        start_scheduler()
+    blueprints = LazyBlueprints(app, CORE_BLUEPRINTS + subsystems)
+    for subsystem in CORE_BLUEPRINTS:
+        blueprints.load(subsystem)
+    if not lazy:
+        blueprints.load_all()
+
+    # Initialize middleware. Metrics go first so their timer also covers
+    # requests the auth check turns away; profiling comes after it so only
+    # authenticated requests can ask to be profiled.
     logger.info("Initializing middleware")
+    init_metrics(app)
     init_middleware(app)
+    init_profiling(app)
+    init_compression(app)
 
     # Add settings route
     @app.route('/api/settings', methods=['GET'])
     def handle_settings():
         settings = get_settings()
-        return jsonify(settings), 200
+        return jsonify(dict(settings) if settings is not None else None), 200
+
+    if lazy:
+
+        def finish_startup():
+            setup_git_user()
+            blueprints.load_all()
+            start_scheduler()
+            logger.info("Deferred startup completed")
+
+        threading.Thread(target=finish_startup,
+                         name='deferred-startup',
+                         daemon=True).start()
 
     logger.info("Flask application creation completed")
     return app
 
 
 if __name__ == '__main__':
-    app = create_app()
+    # The debug server refuses blueprints registered after it has served
+    app = create_app(lazy=False)
     app.run(debug=True, host='0.0.0.0')
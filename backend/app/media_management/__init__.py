@@ -7,11 +7,7 @@ from .utils import (
     get_all_media_management_data,
     MEDIA_MANAGEMENT_CATEGORIES
 )
-from .sync import (
-    sync_naming_config,
-    sync_media_management_config,
-    sync_quality_definitions
-)
+from .sync import sync_media_management_to_arrs
 from ..arr.manager import get_arr_config
 
 logger = logging.getLogger(__name__)
@@ -64,17 +60,21 @@ def update_media_management(category):
 
 @media_management_bp.route('/api/media-management/sync', methods=['POST'])
 def sync_media_management():
-    """Sync media management data to arr instance"""
+    """
+    Sync media management data to one arr instance (`arr_id`) or several
+    (`arr_ids`). All arrs and categories are synced concurrently.
+    """
     try:
         data = request.get_json()
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
         arr_id = data.get('arr_id')
+        arr_ids = data.get('arr_ids') or ([arr_id] if arr_id else [])
         categories = data.get('categories', [])
         
-        if not arr_id:
-            return jsonify({'error': 'arr_id is required'}), 400
+        if not arr_ids:
+            return jsonify({'error': 'arr_id or arr_ids is required'}), 400
         
         if not categories:
             return jsonify({'error': 'categories list is required'}), 400
@@ -84,51 +84,31 @@ def sync_media_management():
         if invalid_categories:
             return jsonify({'error': f'Invalid categories: {invalid_categories}'}), 400
         
-        # Get arr config
-        arr_result = get_arr_config(arr_id)
-        if not arr_result.get('success'):
-            return jsonify({'error': 'Arr configuration not found'}), 404
-        
-        arr_config = arr_result.get('data')
-        base_url = arr_config['arrServer']
-        api_key = arr_config['apiKey']
-        arr_type = arr_config['type']
+        # Get arr configs
+        arr_configs = []
+        for requested_id in arr_ids:
+            arr_result = get_arr_config(requested_id)
+            if not arr_result.get('success'):
+                return jsonify({'error': f'Arr configuration not found: {requested_id}'}), 404
+            arr_configs.append(arr_result.get('data'))
         
-        results = {}
+        # Read each category once and share it across all arrs
+        data_by_category = {
+            category: get_media_management_data(category)
+            for category in categories
+        }
         
-        # Sync each requested category
-        for category in categories:
-            try:
-                # Get the current media management data for this category
-                category_data = get_media_management_data(category)
-                
-                if category == 'naming':
-                    arr_type_data = category_data.get(arr_type, {})
-                    success, message = sync_naming_config(base_url, api_key, arr_type, arr_type_data)
-                elif category == 'misc':
-                    arr_type_data = category_data.get(arr_type, {})
-                    success, message = sync_media_management_config(base_url, api_key, arr_type, arr_type_data)
-                elif category == 'quality_definitions':
-                    # Quality definitions has a nested structure: qualityDefinitions -> arr_type -> qualities
-                    quality_defs = category_data.get('qualityDefinitions', {}).get(arr_type, {})
-                    success, message = sync_quality_definitions(base_url, api_key, arr_type, quality_defs)
-                else:
-                    success, message = False, f"Unknown category: {category}"
-                
-                results[category] = {
-                    'success': success,
-                    'message': message
-                }
-                
-            except Exception as e:
-                logger.error(f"Error syncing {category}: {e}")
-                results[category] = {
-                    'success': False,
-                    'message': str(e)
-                }
+        results = sync_media_management_to_arrs(arr_configs, categories,
+                                                data_by_category)
         
         # Determine overall success
-        overall_success = all(result['success'] for result in results.values())
+        overall_success = all(
+            result['success'] for arr_results in results.values()
+            for result in arr_results.values())
+        
+        if 'arr_ids' not in data:
+            # Single-arr requests keep the original response shape
+            results = results[arr_configs[0]['id']]
         
         return jsonify({
             'success': overall_success,
@@ -137,4 +117,4 @@ def sync_media_management():
         
     except Exception as e:
         logger.error(f"Error in media management sync: {e}")
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
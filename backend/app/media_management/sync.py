@@ -1,186 +1,230 @@
+import copy
 import logging
-from typing import Dict, Any, Tuple
-from ..importer.arr_handler import ArrHandler, ArrApiError
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
+from ..importer.arr_handler import ArrHandler
 
 logger = logging.getLogger(__name__)
 
-def sync_naming_config(base_url: str, api_key: str, arr_type: str, naming_data: Dict[str, Any]) -> Tuple[bool, str]:
+# Upper bound on concurrent requests across all arrs in one sync
+MAX_SYNC_WORKERS = 8
+
+# Our YML field -> arr API field
+NAMING_FIELDS = {
+    'radarr': {
+        'rename': 'renameMovies',
+        'replaceIllegalCharacters': 'replaceIllegalCharacters',
+        'colonReplacementFormat': 'colonReplacementFormat',
+        'movieFormat': 'standardMovieFormat',
+        'movieFolderFormat': 'movieFolderFormat'
+    },
+    'sonarr': {
+        'rename': 'renameEpisodes',
+        'replaceIllegalCharacters': 'replaceIllegalCharacters',
+        'colonReplacementFormat': 'colonReplacementFormat',
+        'customColonReplacementFormat': 'customColonReplacementFormat',
+        'multiEpisodeStyle': 'multiEpisodeStyle',
+        'standardEpisodeFormat': 'standardEpisodeFormat',
+        'dailyEpisodeFormat': 'dailyEpisodeFormat',
+        'animeEpisodeFormat': 'animeEpisodeFormat',
+        'seriesFolderFormat': 'seriesFolderFormat',
+        'seasonFolderFormat': 'seasonFolderFormat',
+        'specialsFolderFormat': 'specialsFolderFormat'
+    }
+}
+
+MISC_FIELDS = {
+    'propersRepacks': 'downloadPropersAndRepacks',
+    'enableMediaInfo': 'enableMediaInfo'
+}
+
+QUALITY_SIZE_FIELDS = {
+    'min': 'minSize',
+    'preferred': 'preferredSize',
+    'max': 'maxSize'
+}
+
+
+def _apply_fields(current: Dict[str, Any], data: Dict[str, Any],
+                  fields: Dict[str, str]) -> Dict[str, Any]:
+    """Return a copy of current with our mapped fields applied"""
+    updated = copy.deepcopy(current)
+    for our_key, api_key in fields.items():
+        if our_key in data:
+            updated[api_key] = data[our_key]
+    return updated
+
+
+def _sync_config(arr: ArrHandler, endpoint: str, label: str, arr_type: str,
+                 data: Dict[str, Any],
+                 fields: Dict[str, str]) -> Tuple[bool, str]:
+    """
+    GET a config resource, apply our fields and PUT it back only if
+    something actually changed.
+    """
+    try:
+        logger.info(f"Syncing {label} to {arr_type}")
+        current_config = arr.get(endpoint)
+        updated_config = _apply_fields(current_config, data, fields)
+
+        if updated_config == current_config:
+            logger.info(f"{label.capitalize()} already up to date on {arr_type}")
+            return True, f"{label.capitalize()} already up to date"
+
+        arr.put(endpoint, updated_config)
+        logger.info(f"Successfully synced {label} to {arr_type}")
+        return True, f"{label.capitalize()} sync successful"
+
+    except Exception as e:
+        error_msg = f"Failed to sync {label}: {str(e)}"
+        logger.error(error_msg)
+        return False, error_msg
+
+
+def sync_naming_config(arr: ArrHandler, arr_type: str, naming_data: Dict[str, Any]) -> Tuple[bool, str]:
     """
     Sync naming configuration to arr instance.
-    First GET current config, update with our data, then PUT back.
-    
+    GET current config, apply our data, and PUT back if it differs.
+
     Args:
-        base_url: The arr instance base URL
-        api_key: The arr instance API key
+        arr: Handler for the arr instance
         arr_type: Either 'radarr' or 'sonarr'
         naming_data: The naming configuration from our YML file
-        
+
     Returns:
         Tuple of (success, message)
     """
-    arr = None
-    try:
-        # Initialize ArrHandler
-        arr = ArrHandler(base_url, api_key)
-        logger.info(f"Syncing naming config to {arr_type}")
-        
-        # GET current naming config using ArrHandler
-        current_config = arr.get("/api/v3/config/naming")
-        
-        # Update current_config with fields from naming_data
-        if arr_type == 'radarr':
-            # Map our YML fields to Radarr API fields
-            if 'rename' in naming_data:
-                current_config['renameMovies'] = naming_data['rename']
-            if 'replaceIllegalCharacters' in naming_data:
-                current_config['replaceIllegalCharacters'] = naming_data['replaceIllegalCharacters']
-            if 'colonReplacementFormat' in naming_data:
-                current_config['colonReplacementFormat'] = naming_data['colonReplacementFormat']
-            if 'movieFormat' in naming_data:
-                current_config['standardMovieFormat'] = naming_data['movieFormat']
-            if 'movieFolderFormat' in naming_data:
-                current_config['movieFolderFormat'] = naming_data['movieFolderFormat']
-        else:  # sonarr
-            # Map our YML fields to Sonarr API fields
-            if 'rename' in naming_data:
-                current_config['renameEpisodes'] = naming_data['rename']
-            if 'replaceIllegalCharacters' in naming_data:
-                current_config['replaceIllegalCharacters'] = naming_data['replaceIllegalCharacters']
-            if 'colonReplacementFormat' in naming_data:
-                current_config['colonReplacementFormat'] = naming_data['colonReplacementFormat']
-            if 'customColonReplacementFormat' in naming_data:
-                current_config['customColonReplacementFormat'] = naming_data['customColonReplacementFormat']
-            if 'multiEpisodeStyle' in naming_data:
-                current_config['multiEpisodeStyle'] = naming_data['multiEpisodeStyle']
-            if 'standardEpisodeFormat' in naming_data:
-                current_config['standardEpisodeFormat'] = naming_data['standardEpisodeFormat']
-            if 'dailyEpisodeFormat' in naming_data:
-                current_config['dailyEpisodeFormat'] = naming_data['dailyEpisodeFormat']
-            if 'animeEpisodeFormat' in naming_data:
-                current_config['animeEpisodeFormat'] = naming_data['animeEpisodeFormat']
-            if 'seriesFolderFormat' in naming_data:
-                current_config['seriesFolderFormat'] = naming_data['seriesFolderFormat']
-            if 'seasonFolderFormat' in naming_data:
-                current_config['seasonFolderFormat'] = naming_data['seasonFolderFormat']
-            if 'specialsFolderFormat' in naming_data:
-                current_config['specialsFolderFormat'] = naming_data['specialsFolderFormat']
-        
-        # PUT the updated config back using ArrHandler
-        arr.put("/api/v3/config/naming", current_config)
-        logger.info(f"Successfully synced naming config to {arr_type}")
-        return True, "Naming config sync successful"
-        
-    except ArrApiError as e:
-        error_msg = f"Failed to sync naming config: {str(e)}"
-        logger.error(error_msg)
-        return False, error_msg
-    except Exception as e:
-        error_msg = f"Failed to sync naming config: {str(e)}"
-        logger.error(error_msg)
-        return False, error_msg
-    finally:
-        if arr:
-            arr.close()
+    return _sync_config(arr, "/api/v3/config/naming", "naming config",
+                        arr_type, naming_data,
+                        NAMING_FIELDS.get(arr_type, NAMING_FIELDS['sonarr']))
 
 
-def sync_media_management_config(base_url: str, api_key: str, arr_type: str, misc_data: Dict[str, Any]) -> Tuple[bool, str]:
+def sync_media_management_config(arr: ArrHandler, arr_type: str, misc_data: Dict[str, Any]) -> Tuple[bool, str]:
     """
     Sync media management (misc) configuration to arr instance.
-    First GET current config, update with our data, then PUT back.
-    
+    GET current config, apply our data, and PUT back if it differs.
+
     Args:
-        base_url: The arr instance base URL
-        api_key: The arr instance API key
+        arr: Handler for the arr instance
         arr_type: Either 'radarr' or 'sonarr'
         misc_data: The misc configuration from our YML file
-        
+
     Returns:
         Tuple of (success, message)
     """
-    arr = None
-    try:
-        # Initialize ArrHandler
-        arr = ArrHandler(base_url, api_key)
-        logger.info(f"Syncing media management config to {arr_type}")
-        
-        # GET current media management config using ArrHandler
-        current_config = arr.get("/api/v3/config/mediamanagement")
-        
-        # Update current_config with fields from misc_data
-        if 'propersRepacks' in misc_data:
-            current_config['downloadPropersAndRepacks'] = misc_data['propersRepacks']
-        if 'enableMediaInfo' in misc_data:
-            current_config['enableMediaInfo'] = misc_data['enableMediaInfo']
-        
-        # PUT the updated config back using ArrHandler
-        arr.put("/api/v3/config/mediamanagement", current_config)
-        logger.info(f"Successfully synced media management config to {arr_type}")
-        return True, "Media management config sync successful"
-        
-    except ArrApiError as e:
-        error_msg = f"Failed to sync media management config: {str(e)}"
-        logger.error(error_msg)
-        return False, error_msg
-    except Exception as e:
-        error_msg = f"Failed to sync media management config: {str(e)}"
-        logger.error(error_msg)
-        return False, error_msg
-    finally:
-        if arr:
-            arr.close()
+    return _sync_config(arr, "/api/v3/config/mediamanagement",
+                        "media management config", arr_type, misc_data,
+                        MISC_FIELDS)
 
 
-def sync_quality_definitions(base_url: str, api_key: str, arr_type: str, quality_data: Dict[str, Any]) -> Tuple[bool, str]:
+def sync_quality_definitions(arr: ArrHandler, arr_type: str, quality_data: Dict[str, Any]) -> Tuple[bool, str]:
     """
     Sync quality definitions to arr instance.
-    Quality definitions contain all required data, so we can directly PUT.
-    
+    Only definitions whose sizes differ from ours are sent.
+
     Args:
-        base_url: The arr instance base URL
-        api_key: The arr instance API key
+        arr: Handler for the arr instance
         arr_type: Either 'radarr' or 'sonarr'
         quality_data: The quality definitions from our YML file
-        
+
     Returns:
         Tuple of (success, message)
     """
-    arr = None
     try:
-        # Initialize ArrHandler
-        arr = ArrHandler(base_url, api_key)
         logger.info(f"Syncing quality definitions to {arr_type}")
-        
+
         # GET current quality definitions using ArrHandler
         current_definitions = arr.get("/api/v3/qualitydefinition")
-        
-        # Create a mapping of quality names to current definitions for easier lookup
-        quality_map = {def_['quality']['name']: def_ for def_ in current_definitions}
-        
-        # Update each quality definition with our values
-        for quality_name, settings in quality_data.items():
-            if quality_name in quality_map:
-                definition = quality_map[quality_name]
-                # Update size limits from our YML data
-                if 'min' in settings:
-                    definition['minSize'] = settings['min']
-                if 'preferred' in settings:
-                    definition['preferredSize'] = settings['preferred']
-                if 'max' in settings:
-                    definition['maxSize'] = settings['max']
-        
-        # PUT the updated definitions back using ArrHandler
-        arr.put("/api/v3/qualitydefinition/update", current_definitions)
-        logger.info(f"Successfully synced quality definitions to {arr_type}")
-        return True, "Quality definitions sync successful"
-        
-    except ArrApiError as e:
-        error_msg = f"Failed to sync quality definitions: {str(e)}"
-        logger.error(error_msg)
-        return False, error_msg
+
+        changed = []
+        for definition in current_definitions:
+            settings = quality_data.get(definition['quality']['name'])
+            if not settings:
+                continue
+            updated = _apply_fields(definition, settings, QUALITY_SIZE_FIELDS)
+            if updated != definition:
+                changed.append(updated)
+
+        if not changed:
+            logger.info(f"Quality definitions already up to date on {arr_type}")
+            return True, "Quality definitions already up to date"
+
+        arr.put("/api/v3/qualitydefinition/update", changed)
+        logger.info(
+            f"Successfully synced {len(changed)} quality definitions to {arr_type}")
+        return True, f"Quality definitions sync successful ({len(changed)} updated)"
+
     except Exception as e:
         error_msg = f"Failed to sync quality definitions: {str(e)}"
         logger.error(error_msg)
         return False, error_msg
+
+
+def _category_payload(category: str, category_data: Dict[str, Any],
+                      arr_type: str) -> Dict[str, Any]:
+    """Pick the part of a category's data that applies to arr_type"""
+    if category == 'quality_definitions':
+        # Quality definitions has a nested structure: qualityDefinitions -> arr_type -> qualities
+        return category_data.get('qualityDefinitions', {}).get(arr_type, {})
+    return category_data.get(arr_type, {})
+
+
+CATEGORY_SYNCS = {
+    'naming': sync_naming_config,
+    'misc': sync_media_management_config,
+    'quality_definitions': sync_quality_definitions
+}
+
+
+def sync_media_management_to_arrs(arr_configs: List[Dict[str, Any]],
+                                  categories: List[str],
+                                  data_by_category: Dict[str, Any]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Sync categories to several arr instances at once. Every
+    (arr, category) pair runs concurrently; categories for the same arr
+    share one ArrHandler and its connection pool.
+
+    Args:
+        arr_configs: Arr configs as returned by get_arr_config
+        categories: Categories to sync
+        data_by_category: Our media management data keyed by category
+
+    Returns:
+        {arr_id: {category: {'success': bool, 'message': str}}}
+    """
+    handlers = {
+        arr_config['id']: ArrHandler(arr_config['arrServer'],
+                                     arr_config['apiKey'])
+        for arr_config in arr_configs
+    }
+
+    def run(arr_config, category):
+        try:
+            arr_type = arr_config['type']
+            payload = _category_payload(category, data_by_category[category],
+                                        arr_type)
+            success, message = CATEGORY_SYNCS[category](
+                handlers[arr_config['id']], arr_type, payload)
+        except Exception as e:
+            logger.error(f"Error syncing {category}: {e}")
+            success, message = False, str(e)
+        return {'success': success, 'message': message}
+
+    jobs = [(arr_config, category) for arr_config in arr_configs
+            for category in categories]
+    results = {arr_config['id']: {} for arr_config in arr_configs}
+    try:
+        with ThreadPoolExecutor(max_workers=min(MAX_SYNC_WORKERS,
+                                                len(jobs) or 1)) as executor:
+            futures = {
+                executor.submit(run, arr_config, category):
+                (arr_config['id'], category)
+                for arr_config, category in jobs
+            }
+            for future, (arr_id, category) in futures.items():
+                results[arr_id][category] = future.result()
     finally:
-        if arr:
-            arr.close()
\ No newline at end of file
+        for handler in handlers.values():
+            handler.close()
+
+    return results
@@ -1,8 +1,8 @@
 import os
-import yaml
 import logging
 from typing import Dict, Any
 from datetime import datetime
+from ..utils import yaml_io
 from ..config.config import config
 
 logger = logging.getLogger(__name__)
@@ -87,7 +87,7 @@ def _load_yaml_file(file_path: str) -> Dict[str, Any]:
     
     try:
         with open(file_path, 'r') as f:
-            return yaml.safe_load(f) or {}
+            return yaml_io.load(f) or {}
     except Exception as e:
         logger.error(f"Error loading {file_path}: {e}")
         raise
@@ -101,7 +101,7 @@ def _save_yaml_file(file_path: str, data: Dict[str, Any], category: str = None)
             data = _preserve_order(data, category)
             
         with open(file_path, 'w') as f:
-            yaml.safe_dump(
+            yaml_io.dump(
                 data, 
                 f, 
                 sort_keys=False,
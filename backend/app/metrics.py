@@ -0,0 +1,289 @@
+# backend/app/metrics.py
+"""
+In-process metrics, exposed in the Prometheus text format at /api/metrics.
+
+Counters and histograms live in this module's registry and are updated
+inline by the code they measure (routes, Arr API calls, git commands,
+YAML parses, SQLite statements, caches). Each gunicorn worker keeps its
+own registry, so a scrape reports the worker that answered it; the
+`pid` label on profilarr_process_start_time_seconds tells them apart.
+"""
+from bisect import bisect_left
+import functools
+import logging
+import os
+import re
+import threading
+import time
+
+from flask import Response, g, request
+
+logger = logging.getLogger(__name__)
+
+# Seconds; chosen to separate cached (<1ms) from disk (ms) and network
+# or subprocess (10ms+) work
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Numeric path segments collapse into one label value, so every item id
+# doesn't become its own series
+_ID_SEGMENT_RE = re.compile(r'/\d+(?=/|$)')
+
+
+def _escape(value):
+    return (str(value).replace('\\', r'\\').replace('\n', r'\n').replace(
+        '"', r'\"'))
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"'
+             for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _label_values(labels):
+    # Label values are strings in the exposition format; storing them that
+    # way keeps e.g. a 200 status and an 'error' status sortable together
+    return tuple(str(label) for label in labels)
+
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """
+    A monotonically increasing count per label combination. Sources add
+    counts kept elsewhere (e.g. lru_cache statistics) when scraped.
+    """
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._sources = []
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        labels = _label_values(labels)
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def add_source(self, source):
+        """`source()` returns {labels tuple: count}, read at scrape time"""
+        self._sources.append(source)
+
+    def expose(self):
+        with self._lock:
+            values = dict(self._values)
+        for source in self._sources:
+            try:
+                for labels, value in source().items():
+                    labels = _label_values(labels)
+                    values[labels] = values.get(labels, 0) + value
+            except Exception as e:
+                logger.error(f"Metrics source for {self.name} failed: {e}")
+        lines = [f'# HELP {self.name}_total {self.documentation}',
+                 f'# TYPE {self.name}_total counter']
+        for labels, value in sorted(values.items(),
+                                    key=lambda item: item[0]):
+            lines.append(f'{self.name}_total'
+                         f'{_format_labels(self.labelnames, labels)} '
+                         f'{_format_value(value)}')
+        return lines
+
+
+class Histogram:
+    """Observations bucketed by upper bound, per label combination"""
+
+    def __init__(self, name, documentation, labelnames=(),
+                 buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [count per bucket (last is +Inf)..., sum]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect_left(self.buckets, value)
+        labels = _label_values(labels)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [0] * (len(self.buckets) + 2)
+            state[index] += 1
+            state[-1] += value
+
+    def expose(self):
+        lines = [f'# HELP {self.name} {self.documentation}',
+                 f'# TYPE {self.name} histogram']
+        with self._lock:
+            values = sorted(((k, list(v)) for k, v in self._values.items()),
+                            key=lambda item: item[0])
+        bounds = [_format_value(float(b)) for b in self.buckets] + ['+Inf']
+        for labels, state in values:
+            cumulative = 0
+            for bound, count in zip(bounds, state[:-1]):
+                cumulative += count
+                bucket_labels = _format_labels(self.labelnames, labels,
+                                               f'le="{bound}"')
+                lines.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f'{self.name}_sum{label_text} {state[-1]!r}')
+            lines.append(f'{self.name}_count{label_text} {cumulative}')
+        return lines
+
+
+class Registry:
+    """Metrics plus collectors that are read only when scraped"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        """`collector()` returns exposition lines, computed at scrape time"""
+        self._collectors.append(collector)
+        return collector
+
+    def expose(self):
+        lines = []
+        for metric in self._metrics:
+            # One broken metric shouldn't take the whole scrape down
+            try:
+                lines.extend(metric.expose())
+            except Exception as e:
+                logger.error(f"Metric {metric.name} failed: {e}")
+        for collector in self._collectors:
+            try:
+                lines.extend(collector())
+            except Exception as e:
+                logger.error(f"Metrics collector failed: {e}")
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+PROCESS_START = time.time()
+
+http_requests = registry.register(
+    Counter('profilarr_http_requests', 'HTTP requests handled',
+            ('method', 'route', 'status')))
+http_duration = registry.register(
+    Histogram('profilarr_http_request_duration_seconds',
+              'Time to produce a response (streamed bodies excluded)',
+              ('method', 'route')))
+arr_requests = registry.register(
+    Counter('profilarr_arr_requests', 'Arr API calls',
+            ('instance', 'method', 'endpoint', 'status')))
+arr_duration = registry.register(
+    Histogram('profilarr_arr_request_duration_seconds',
+              'Arr API call latency', ('instance', 'method', 'endpoint')))
+git_commands = registry.register(
+    Counter('profilarr_git_commands', 'git subprocess calls',
+            ('command', 'status')))
+git_duration = registry.register(
+    Histogram('profilarr_git_command_duration_seconds',
+              'git subprocess call duration', ('command', )))
+git_status_duration = registry.register(
+    Histogram('profilarr_git_status_update_duration_seconds',
+              'Git status manager refreshes', ('scope', )))
+yaml_parses = registry.register(
+    Histogram('profilarr_yaml_parse_duration_seconds', 'YAML documents parsed'))
+sqlite_queries = registry.register(
+    Histogram('profilarr_sqlite_query_duration_seconds',
+              'SQLite statement execution, by statement type', ('statement', )))
+cache_requests = registry.register(
+    Counter('profilarr_cache_requests', 'Cache lookups',
+            ('cache', 'result')))
+
+
+@registry.register_collector
+def _process_info():
+    return [
+        '# HELP profilarr_process_start_time_seconds Worker start time',
+        '# TYPE profilarr_process_start_time_seconds gauge',
+        f'profilarr_process_start_time_seconds{{pid="{os.getpid()}"}} '
+        f'{PROCESS_START!r}'
+    ]
+
+
+def register_lru_cache(name, cached_function):
+    """Report a functools.lru_cache's hits and misses with the other caches"""
+
+    def collect():
+        info = cached_function.cache_info()
+        return {(name, 'hit'): info.hits, (name, 'miss'): info.misses}
+
+    cache_requests.add_source(collect)
+
+
+def record_cache(cache, hits=0, misses=0):
+    if hits:
+        cache_requests.inc(cache, 'hit', amount=hits)
+    if misses:
+        cache_requests.inc(cache, 'miss', amount=misses)
+
+
+def endpoint_label(path):
+    """A low-cardinality label for a URL path"""
+    return _ID_SEGMENT_RE.sub('/{id}', path.split('?', 1)[0])
+
+
+def statement_label(sql):
+    """The statement type (SELECT, INSERT, ...) of a SQL string"""
+    words = sql.lstrip().split(None, 1)
+    return words[0].upper() if words else 'EMPTY'
+
+
+def timed(histogram, *labels):
+    """Decorator observing each call's duration on histogram"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start, *labels)
+
+        return wrapper
+
+    return decorator
+
+
+def init_metrics(app):
+    """Time every request and serve the registry at /api/metrics"""
+
+    @app.before_request
+    def start_timer():
+        g.metrics_start = time.perf_counter()
+
+    @app.after_request
+    def record_request(response):
+        start = g.pop('metrics_start', None)
+        if start is not None:
+            route = (request.url_rule.rule
+                     if request.url_rule is not None else 'unmatched')
+            http_duration.observe(time.perf_counter() - start,
+                                  request.method, route)
+            http_requests.inc(request.method, route,
+                              str(response.status_code))
+        return response
+
+    @app.route('/api/metrics', methods=['GET'])
+    def metrics():
+        return Response(registry.expose(), content_type=CONTENT_TYPE)
@@ -1,8 +1,11 @@
 # backend/app/middleware.py
 
-from flask import request, session, jsonify, send_from_directory
+from flask import request, session, jsonify
 from .db import get_db
+from .static_assets import serve_static_path
+import gzip
 import logging
+import zlib
 
 logger = logging.getLogger(__name__)
 
@@ -57,4 +60,60 @@ def init_middleware(app):
 
         # For all other routes (frontend routes), serve index.html
         # This lets React handle auth and routing
-        return send_from_directory(app.static_folder, 'index.html')
+        return serve_static_path('index.html')
+
+
+# Responses smaller than this aren't worth compressing
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+GZIP_MIMETYPES = ('application/json', )
+
+
+def _gzip_stream(chunks):
+    """Compress a streamed body, flushing after every chunk so data keeps
+    flowing to the client as it is produced"""
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            data = compressor.compress(chunk) + compressor.flush(
+                zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+def init_compression(app):
+    """Gzip JSON responses, including streamed ones, for clients that accept it"""
+
+    @app.after_request
+    def compress_response(response):
+        if (response.mimetype not in GZIP_MIMETYPES
+                or response.direct_passthrough
+                or not 200 <= response.status_code < 300
+                or response.status_code in (204, 206)
+                or 'Content-Encoding' in response.headers
+                or not request.accept_encodings['gzip']):
+            return response
+
+        if response.is_streamed:
+            response.response = _gzip_stream(response.response)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < GZIP_MIN_SIZE:
+                return response
+            response.set_data(gzip.compress(data, GZIP_LEVEL))
+
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        # The compressed body is a different byte sequence, so a strong
+        # validator for the identity body only holds weakly
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
@@ -0,0 +1,307 @@
+# backend/app/profiling.py
+"""
+On-demand profiling of API requests.
+
+A request is profiled when it carries an `X-Profile` header (`sample` or
+`cprofile`) or while the profiling toggle, set through /api/profiling,
+covers its path. Only authenticated requests get this far, since the
+auth check runs first. The `sample` profiler records the request
+thread's stack every few milliseconds and writes collapsed stacks (the
+input format of flamegraph tools); it sees time spent waiting on git,
+SQLite and Arr servers as well as CPU time. `cprofile` is deterministic,
+slower, and writes a pstats file.
+
+Profiles are written to config.PROFILING_DIR when the response has been
+sent, so streamed bodies are included, and only the newest
+config.PROFILING_KEEP of them are kept. One request per worker is
+profiled at a time.
+"""
+import cProfile
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from flask import g, jsonify, request, send_from_directory
+
+from .config import config
+from .db import get_settings_snapshot, save_settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+MODES = ('sample', 'cprofile')
+DEFAULT_TOGGLE_MINUTES = 15
+
+# Settings keys holding the toggle, shared by every worker
+UNTIL_SETTING = 'profiling_until'
+PATH_SETTING = 'profiling_path'
+MODE_SETTING = 'profiling_mode'
+
+# The profiling routes themselves and the metrics scrape are never
+# profiled
+_EXCLUDED_PREFIXES = ('/api/profiling', '/api/metrics', '/api/auth/')
+_NAME_RE = re.compile(r'^[\w.-]+\.(collapsed|prof)$')
+_CONVERTER_RE = re.compile(r'<(?:\w+:)?(\w+)>')
+_SLUG_RE = re.compile(r'[^\w]+')
+
+_active = threading.Lock()
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class SamplingProfiler:
+    """Collapsed stacks of one thread, sampled from a background thread"""
+    extension = 'collapsed'
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._labels = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            path = code.co_filename
+            if path.startswith(_APP_ROOT):
+                path = os.path.relpath(path, _APP_ROOT)
+            else:
+                path = os.path.basename(path)
+            label = self._labels[code] = f'{code.co_name} ({path})'
+        return label
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._sample,
+                                        name='request-profiler',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f'{stack} {count}\n')
+
+
+class DeterministicProfiler:
+    """cProfile over the calling thread, saved as pstats"""
+    extension = 'prof'
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def save(self, path):
+        self.profile.dump_stats(path)
+
+
+def get_toggle():
+    """The profiling toggle as {enabled, until, path, mode}"""
+    settings = get_settings_snapshot().settings
+    try:
+        until = float(settings.get(UNTIL_SETTING) or 0)
+    except ValueError:
+        until = 0
+    return {
+        'enabled': until > time.time(),
+        'until': until or None,
+        'path': settings.get(PATH_SETTING) or '/api/',
+        'mode': settings.get(MODE_SETTING) or 'sample'
+    }
+
+
+def _requested_mode():
+    """Profiler mode for the current request, or None to skip it"""
+    if (not request.path.startswith('/api/')
+            or request.path.startswith(_EXCLUDED_PREFIXES)):
+        return None
+    header = request.headers.get(PROFILE_HEADER, '').strip().lower()
+    if header:
+        if header in MODES:
+            return header
+        return 'sample' if header in ('1', 'true', 'yes') else None
+    toggle = get_toggle()
+    if toggle['enabled'] and request.path.startswith(toggle['path']):
+        return toggle['mode']
+    return None
+
+
+def _profile_name(mode):
+    route = (request.url_rule.rule
+             if request.url_rule is not None else request.path)
+    slug = _SLUG_RE.sub('_', _CONVERTER_RE.sub(r'\1', route)).strip('_')
+    extension = (SamplingProfiler
+                 if mode == 'sample' else DeterministicProfiler).extension
+    return (f'{datetime.now():%Y%m%d-%H%M%S-%f}-{request.method.lower()}-'
+            f'{slug}-{os.getpid()}.{extension}')
+
+
+def prune_profiles(keep=None):
+    """Delete all but the newest `keep` profiles"""
+    keep = config.PROFILING_KEEP if keep is None else keep
+    profiles = list_profiles()
+    for profile in profiles[keep:]:
+        try:
+            os.remove(os.path.join(config.PROFILING_DIR, profile['name']))
+        except OSError as e:
+            logger.warning(f"Could not remove profile {profile['name']}: {e}")
+
+
+def list_profiles():
+    """Stored profiles, newest first"""
+    try:
+        entries = list(os.scandir(config.PROFILING_DIR))
+    except FileNotFoundError:
+        return []
+    profiles = []
+    for entry in entries:
+        if entry.is_file() and _NAME_RE.match(entry.name):
+            stat = entry.stat()
+            profiles.append({
+                'name': entry.name,
+                'size': stat.st_size,
+                'created': stat.st_mtime
+            })
+    profiles.sort(key=lambda profile: profile['name'], reverse=True)
+    return profiles
+
+
+def _finish(profiler, name, started):
+    try:
+        profiler.stop()
+        os.makedirs(config.PROFILING_DIR, exist_ok=True)
+        profiler.save(os.path.join(config.PROFILING_DIR, name))
+        logger.info(f"Saved profile {name} "
+                    f"({time.perf_counter() - started:.3f}s)")
+        prune_profiles()
+    except Exception as e:
+        logger.error(f"Could not save profile {name}: {e}")
+    finally:
+        _active.release()
+
+
+def init_profiling(app):
+    """Profile opted-in requests; register after the auth middleware"""
+
+    @app.before_request
+    def start_profile():
+        mode = _requested_mode()
+        if mode is None:
+            return
+        if not _active.acquire(blocking=False):
+            g.profile_busy = True
+            return
+        try:
+            if mode == 'sample':
+                profiler = SamplingProfiler(
+                    threading.get_ident(),
+                    config.PROFILING_SAMPLE_INTERVAL_MS / 1000)
+            else:
+                profiler = DeterministicProfiler()
+            profiler.start()
+        except Exception as e:
+            _active.release()
+            logger.error(f"Could not start {mode} profiler: {e}")
+            return
+        g.profile = (profiler, _profile_name(mode), time.perf_counter())
+
+    @app.after_request
+    def hand_off_profile(response):
+        # The body may still be streaming; stop once it has been sent
+        profile = g.pop('profile', None)
+        if profile is not None:
+            response.headers[PROFILE_ID_HEADER] = profile[1]
+            response.call_on_close(lambda: _finish(*profile))
+        elif g.pop('profile_busy', False):
+            response.headers[PROFILE_ID_HEADER] = 'busy'
+        return response
+
+    @app.teardown_request
+    def abandon_profile(exc):
+        # Only reached with a profile still set if no response was made
+        profile = g.pop('profile', None)
+        if profile is not None:
+            _finish(*profile)
+
+    @app.route('/api/profiling', methods=['GET'])
+    def get_profiling():
+        return jsonify({
+            'toggle': get_toggle(),
+            'keep': config.PROFILING_KEEP,
+            'profiles': list_profiles()
+        }), 200
+
+    @app.route('/api/profiling', methods=['PUT'])
+    def update_profiling():
+        """
+        Turn the toggle on for `minutes` (profiling requests under `path`
+        with `mode`) or off.
+        """
+        data = request.get_json() or {}
+        if not data.get('enabled'):
+            save_settings({UNTIL_SETTING: '0'})
+            return jsonify(get_toggle()), 200
+
+        mode = data.get('mode', 'sample')
+        if mode not in MODES:
+            return jsonify(
+                {'error': f"mode must be one of {', '.join(MODES)}"}), 400
+        path = data.get('path') or '/api/'
+        if not path.startswith('/api/'):
+            return jsonify({'error': 'path must start with /api/'}), 400
+        try:
+            minutes = float(data.get('minutes', DEFAULT_TOGGLE_MINUTES))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'minutes must be a number'}), 400
+        if minutes <= 0:
+            return jsonify({'error': 'minutes must be positive'}), 400
+
+        save_settings({
+            UNTIL_SETTING: str(time.time() + minutes * 60),
+            PATH_SETTING: path,
+            MODE_SETTING: mode
+        })
+        logger.info(f"Profiling {mode} enabled for {path} "
+                    f"for {minutes:g} minutes")
+        return jsonify(get_toggle()), 200
+
+    @app.route('/api/profiling/<name>', methods=['GET'])
+    def download_profile(name):
+        if not _NAME_RE.match(name):
+            return jsonify({'error': 'Profile not found'}), 404
+        return send_from_directory(config.PROFILING_DIR, name,
+                                   as_attachment=True)
+
+    @app.route('/api/profiling/<name>', methods=['DELETE'])
+    def delete_profile(name):
+        path = os.path.join(config.PROFILING_DIR, name)
+        if not _NAME_RE.match(name) or not os.path.isfile(path):
+            return jsonify({'error': 'Profile not found'}), 404
+        os.remove(path)
+        return jsonify({'message': f'Deleted {name}'}), 200
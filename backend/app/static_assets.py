@@ -0,0 +1,180 @@
+# backend/app/static_assets.py
+"""
+Serving of the bundled frontend. The static folder is scanned once at
+startup into an in-memory manifest, so requests never stat the disk to
+find a file, and precompressed .br/.gz siblings (written at image build
+time by `python -m app.static_assets <static dir>`) are served to
+clients that accept them.
+"""
+from collections import namedtuple
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import sys
+
+from flask import Response, abort, current_app, request
+from werkzeug.wsgi import wrap_file
+
+logger = logging.getLogger(__name__)
+
+# Vite names bundled assets like assets/index-4f9a1c2e.js; their content
+# never changes under the same name
+FINGERPRINT_RE = re.compile(r'(^|/)assets/.+[.-][A-Za-z0-9_-]{8,}\.[a-z0-9]+$')
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json',
+                      'image/svg+xml', 'application/manifest+json')
+MIN_COMPRESS_SIZE = 1024
+# Preferred first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+StaticEntry = namedtuple(
+    'StaticEntry',
+    ['path', 'size', 'mimetype', 'etag', 'cache_control', 'variants'])
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _mimetype(file_name):
+    mimetype, _ = mimetypes.guess_type(file_name)
+    if mimetype is None:
+        return 'application/octet-stream'
+    if mimetype.startswith('text/') or mimetype == 'application/javascript':
+        mimetype += '; charset=utf-8'
+    return mimetype
+
+
+def _compressible(file_name):
+    mimetype, _ = mimetypes.guess_type(file_name)
+    return bool(mimetype) and mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+class StaticManifest:
+    """Every servable file under the static folder, keyed by URL path"""
+
+    def __init__(self, root):
+        self.root = root
+        self.entries = {}
+        if root and os.path.isdir(root):
+            self._scan()
+        logger.info(f"Static manifest: {len(self.entries)} files")
+
+    def _scan(self):
+        for dir_path, _, file_names in os.walk(self.root):
+            names = set(file_names)
+            for file_name in file_names:
+                if file_name.endswith(tuple(s for _, s in ENCODINGS)):
+                    continue
+                full_path = os.path.join(dir_path, file_name)
+                stat = os.stat(full_path)
+                rel_path = os.path.relpath(full_path, self.root).replace(
+                    os.sep, '/')
+                variants = {}
+                for encoding, suffix in ENCODINGS:
+                    if file_name + suffix in names:
+                        variant_path = full_path + suffix
+                        variants[encoding] = (variant_path,
+                                              os.path.getsize(variant_path))
+                fingerprinted = bool(FINGERPRINT_RE.search(rel_path))
+                self.entries[rel_path] = StaticEntry(
+                    path=full_path,
+                    size=stat.st_size,
+                    mimetype=_mimetype(file_name),
+                    etag=hashlib.sha1(
+                        f'{rel_path}:{stat.st_size}:{stat.st_mtime_ns}'.
+                        encode()).hexdigest()[:20],
+                    cache_control=(IMMUTABLE_CACHE
+                                   if fingerprinted else REVALIDATE_CACHE),
+                    variants=variants)
+
+    def get(self, path):
+        return self.entries.get(path)
+
+    def response(self, entry):
+        """Serve an entry, picking the best encoding the client accepts"""
+        path, size, encoding = entry.path, entry.size, None
+        for name, _ in ENCODINGS:
+            if name in entry.variants and request.accept_encodings[name]:
+                (path, size), encoding = entry.variants[name], name
+                break
+
+        # Each encoding is its own representation with its own validator
+        etag = f'{entry.etag}-{encoding}' if encoding else entry.etag
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(wrap_file(request.environ, open(path, 'rb')),
+                                direct_passthrough=True)
+            response.content_length = size
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
+        response.headers['Content-Type'] = entry.mimetype
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = entry.cache_control
+        if entry.variants:
+            response.vary.add('Accept-Encoding')
+        return response
+
+
+def serve_static_path(path):
+    """The static file at `path`, or index.html for client-side routes"""
+    manifest = current_app.extensions['static_manifest']
+    entry = manifest.get(path) if path else None
+    if entry is None:
+        entry = manifest.get('index.html')
+    if entry is None:
+        abort(404)
+    return manifest.response(entry)
+
+
+def init_static(app):
+    """Build the manifest and register the catch-all frontend route"""
+    app.extensions['static_manifest'] = StaticManifest(app.static_folder)
+
+    @app.route('/', defaults={'path': ''})
+    @app.route('/<path:path>')
+    def serve_static(path):
+        if path.startswith('api/'):
+            abort(404)  # Let API routes handle these
+        return serve_static_path(path)
+
+
+def precompress(root):
+    """Write .gz (and .br when brotli is installed) next to every
+    compressible file, for the manifest to pick up"""
+    written = 0
+    for dir_path, _, file_names in os.walk(root):
+        for file_name in file_names:
+            if (file_name.endswith(tuple(s for _, s in ENCODINGS))
+                    or not _compressible(file_name)):
+                continue
+            full_path = os.path.join(dir_path, file_name)
+            with open(full_path, 'rb') as f:
+                data = f.read()
+            if len(data) < MIN_COMPRESS_SIZE:
+                continue
+            compressed = {'.gz': gzip.compress(data, 9, mtime=0)}
+            if brotli is not None:
+                compressed['.br'] = brotli.compress(data, quality=11)
+            for suffix, payload in compressed.items():
+                # Only worth serving if it actually saves bytes
+                if len(payload) < len(data):
+                    with open(full_path + suffix, 'wb') as f:
+                        f.write(payload)
+                    written += 1
+    return written
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        sys.exit('usage: python -m app.static_assets <static dir>')
+    count = precompress(sys.argv[1])
+    print(f'Wrote {count} precompressed files'
+          f'{"" if brotli else " (brotli not installed, gzip only)"}')
@@ -0,0 +1,104 @@
+# backend/app/subsystems.py
+"""
+Blueprints registered on first use instead of at startup.
+
+Importing every blueprint pulls in GitPython, aiohttp, requests and the
+compile mappings, which is most of the app's startup time. A
+LazyBlueprints loader wraps app.wsgi_app and registers a blueprint just
+before the first request under its path is dispatched; load_all()
+registers the rest, e.g. from a background thread once the app is
+serving. Flask 2.0 only refuses late registration in debug mode, so
+debug apps register everything up front.
+
+Registering adds rules to the url_map that other request threads are
+matching against, and Werkzeug re-sorts that list in place on the next
+match. Until every subsystem is loaded, each request therefore holds the
+loader's lock from arrival until its URL has been matched, and
+registration takes the same lock; once nothing is pending, requests skip
+the lock entirely.
+"""
+from collections import namedtuple
+import importlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# path: URL prefix the blueprint's routes live under
+# module, blueprint: where the blueprint is defined, relative to app
+# url_prefix: passed to register_blueprint
+# setup: called once before the blueprint is registered
+Subsystem = namedtuple('Subsystem',
+                       ['path', 'module', 'blueprint', 'url_prefix', 'setup'],
+                       defaults=(None, ))
+
+
+class LazyBlueprints:
+    """WSGI wrapper registering each subsystem's blueprint on first use"""
+
+    def __init__(self, app, subsystems):
+        self.app = app
+        self.pending = list(subsystems)
+        self._lock = threading.Lock()
+        self._matching = threading.local()
+        self._wsgi_app = app.wsgi_app
+        app.wsgi_app = self
+        # Runs before any other before_request function, once Flask has
+        # matched the request's URL
+        app.before_request_funcs.setdefault(None, []).insert(
+            0, self._release_match_lock)
+
+    def __call__(self, environ, start_response):
+        if not self.pending:
+            return self._wsgi_app(environ, start_response)
+
+        self._lock.acquire()
+        self._matching.locked = True
+        try:
+            path = environ.get('PATH_INFO', '')
+            for subsystem in list(self.pending):
+                if path == subsystem.path or path.startswith(
+                        subsystem.path + '/'):
+                    self._load(subsystem)
+            return self._wsgi_app(environ, start_response)
+        finally:
+            # Requests that fail before reaching before_request
+            self._release_match_lock()
+
+    def _release_match_lock(self):
+        if getattr(self._matching, 'locked', False):
+            self._matching.locked = False
+            self._lock.release()
+
+    def load(self, subsystem):
+        with self._lock:
+            self._load(subsystem)
+
+    def _load(self, subsystem):
+        if subsystem not in self.pending:
+            return
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(subsystem.module,
+                                             package=__package__)
+            if subsystem.setup is not None:
+                subsystem.setup()
+            self.app.register_blueprint(getattr(module, subsystem.blueprint),
+                                        url_prefix=subsystem.url_prefix)
+            # Sort the new rules in while no request is matching
+            self.app.url_map.update()
+        except Exception:
+            logger.exception(f"Failed to load {subsystem.path}")
+            raise
+        self.pending.remove(subsystem)
+        logger.info(f"Loaded {subsystem.path} in "
+                    f"{(time.perf_counter() - start) * 1000:.0f}ms")
+
+    def load_all(self):
+        """Load every pending subsystem; failed ones stay pending"""
+        for subsystem in list(self.pending):
+            try:
+                self.load(subsystem)
+            except Exception:
+                continue
@@ -1,12 +1,25 @@
 # app/task/__init__.py
 from flask import Blueprint, jsonify, request
 import logging
-from ..db import get_db
-from .tasks import TaskScheduler
+from ..db import get_db, get_task_runs, get_task_run_stats
+from .tasks import TaskScheduler, ExecutionSlotBusy
 
 bp = Blueprint('tasks', __name__)
 logger = logging.getLogger(__name__)
 
+# Seconds clients are told to wait while the scheduler is still starting
+SCHEDULER_RETRY_AFTER = 2
+
+
+@bp.before_request
+def require_scheduler():
+    # With lazy startup these routes can be reached before the scheduler
+    # has started; answering from the database alone would list no tasks
+    if TaskScheduler.get_instance() is None:
+        return jsonify({"error": "Task scheduler is starting"}), 503, {
+            'Retry-After': str(SCHEDULER_RETRY_AFTER)
+        }
+
 
 @bp.route('', methods=['GET'])
 def get_all_tasks():
@@ -15,12 +28,12 @@ def get_all_tasks():
             tasks = conn.execute('SELECT * FROM scheduled_tasks').fetchall()
             result = []
 
+            run_stats = get_task_run_stats([task['id'] for task in tasks])
+
             scheduler_instance = TaskScheduler.get_instance()
             if scheduler_instance:
                 for task in tasks:
-                    # Get the job from scheduler
-                    job = scheduler_instance.scheduler.get_job(str(task['id']))
-                    next_run = job.next_run_time if job else None
+                    next_run = scheduler_instance.get_next_run_time(task)
 
                     result.append({
                         'id':
@@ -36,7 +49,9 @@ def get_all_tasks():
                         'next_run':
                         next_run.isoformat() if next_run else None,
                         'status':
-                        task['status']
+                        task['status'],
+                        'stats':
+                        run_stats.get(task['id'])
                     })
 
             return jsonify(result), 200
@@ -58,8 +73,7 @@ def get_task(task_id):
 
             scheduler_instance = TaskScheduler.get_instance()
             if scheduler_instance:
-                job = scheduler_instance.scheduler.get_job(str(task['id']))
-                next_run = job.next_run_time if job else None
+                next_run = scheduler_instance.get_next_run_time(task)
             else:
                 next_run = None
 
@@ -70,7 +84,8 @@ def get_task(task_id):
                 'interval_minutes': task['interval_minutes'],
                 'last_run': task['last_run'],
                 'next_run': next_run.isoformat() if next_run else None,
-                'status': task['status']
+                'status': task['status'],
+                'stats': get_task_run_stats([task_id]).get(task_id)
             }), 200
 
     except Exception as e:
@@ -78,6 +93,29 @@ def get_task(task_id):
         return jsonify({"error": "An unexpected error occurred"}), 500
 
 
+@bp.route('/<int:task_id>/runs', methods=['GET'])
+def get_task_history(task_id):
+    try:
+        limit = request.args.get('limit', 50, type=int)
+        if limit < 1:
+            return jsonify({"error": "limit must be a positive integer"}), 400
+
+        with get_db() as conn:
+            task = conn.execute('SELECT id FROM scheduled_tasks WHERE id = ?',
+                                (task_id, )).fetchone()
+        if not task:
+            return jsonify({"error": "Task not found"}), 404
+
+        return jsonify({
+            'stats': get_task_run_stats([task_id]).get(task_id),
+            'runs': get_task_runs(task_id, limit)
+        }), 200
+
+    except Exception as e:
+        logger.exception("Unexpected error occurred")
+        return jsonify({"error": "An unexpected error occurred"}), 500
+
+
 @bp.route('/<int:task_id>', methods=['PUT'])
 def update_task(task_id):
     try:
@@ -110,9 +148,6 @@ def update_task(task_id):
             # Update the scheduler
             scheduler_instance = TaskScheduler.get_instance()
             if scheduler_instance and interval_minutes > 0:
-                # Remove old job
-                scheduler_instance.scheduler.remove_job(str(task_id))
-                
                 # Create new task instance with updated interval
                 task_class = TaskScheduler.get_task_class(task['type'])
                 if task_class:
@@ -121,7 +156,7 @@ def update_task(task_id):
                         name=task['name'],
                         interval_minutes=interval_minutes
                     )
-                    scheduler_instance.schedule_task(new_task)
+                    scheduler_instance.reschedule_task(new_task)
             
             logger.info(f"Updated task {task_id} interval to {interval_minutes} minutes")
             
@@ -155,16 +190,23 @@ def trigger_task(task_id):
                 name=task['name'],
                 interval_minutes=task['interval_minutes'])
 
-            try:
-                task_instance.update_status('running')
-                task_instance.run_job()
-                task_instance.update_status('success')
-                return jsonify(
-                    {"message": f"Task {task_id} triggered successfully"}), 200
-            except Exception as e:
-                task_instance.update_status('failed')
-                logger.error(f"Task {task_id} failed: {str(e)}")
-                return jsonify({"error": f"Task failed: {str(e)}"}), 500
+        # Manual runs share the scheduled runs' per-server lock and sync slots
+        try:
+            status, error = TaskScheduler.get_instance().run_now(
+                task_instance)
+        except ExecutionSlotBusy as e:
+            return jsonify({"error": f"Task {task_id} not started: {e}"}), 409
+
+        if status == 'success':
+            return jsonify(
+                {"message": f"Task {task_id} triggered successfully"}), 200
+        if status == 'partial':
+            return jsonify({
+                "message": f"Task {task_id} completed with failures: {error}",
+                "status": status
+            }), 200
+        logger.error(f"Task {task_id} failed: {error}")
+        return jsonify({"error": f"Task failed: {error}"}), 500
 
     except Exception as e:
         logger.exception("Unexpected error occurred")
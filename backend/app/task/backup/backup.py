@@ -2,15 +2,28 @@
 import os
 import shutil
 from datetime import datetime, timedelta
+import gzip
+import json
 import logging
 from pathlib import Path
+import sqlite3
 import zipfile
 import tempfile
 from ...config.config import config
 from ...db import get_db
+from .chunk_store import ChunkStore
+from .pipeline import (COMPRESSION_LEVELS, ChunkPipeline, Throttle,
+                       write_zip_entry, zip_compression)
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_SUFFIX = '.manifest.json.gz'
+BACKUP_MODES = ('full', 'incremental')
+
+# Pages copied per step of the online backup. Between steps the source
+# database is unlocked, so writers are only ever blocked briefly.
+SNAPSHOT_PAGES_PER_STEP = 1024
+
 
 class BackupManager:
 
@@ -18,34 +31,116 @@ class BackupManager:
         self.backup_dir = os.path.join(config.CONFIG_DIR, 'backups')
         self.retention_days = 30
         self._ensure_backup_directory()
+        self._store = None
 
     def _ensure_backup_directory(self):
         """Ensure backup directory exists"""
         os.makedirs(self.backup_dir, exist_ok=True)
 
-    def create_backup(self):
-        """Create a new backup of the config directory"""
+    @property
+    def store(self):
+        """Chunk store shared by all incremental backups"""
+        if self._store is None:
+            self._store = ChunkStore(os.path.join(self.backup_dir, 'store'))
+        return self._store
+
+    @staticmethod
+    def is_incremental(backup_filename):
+        return backup_filename.endswith(MANIFEST_SUFFIX)
+
+    def _snapshot_database(self, dest_path):
+        """
+        Copy the live database into dest_path through SQLite's online
+        backup API, then verify the copy. Raises if the snapshot is bad.
+        """
+        source = sqlite3.connect(config.DB_PATH)
+        try:
+            dest = sqlite3.connect(dest_path)
+            try:
+                source.backup(dest, pages=SNAPSHOT_PAGES_PER_STEP)
+                result = dest.execute('PRAGMA integrity_check').fetchone()[0]
+            finally:
+                dest.close()
+        finally:
+            source.close()
+
+        if result != 'ok':
+            raise RuntimeError(
+                f'Database snapshot failed integrity check: {result}')
+
+        # Keep the live database's permissions rather than the temp file's
+        os.chmod(dest_path, os.stat(config.DB_PATH).st_mode & 0o777)
+
+    def _iter_config_files(self, db_snapshot_path):
+        """
+        Yield (file_path, arc_path) for every file to back up. The live
+        database and its journal files are replaced by the snapshot.
+        """
+        db_files = {
+            config.DB_PATH, f'{config.DB_PATH}-wal', f'{config.DB_PATH}-shm',
+            f'{config.DB_PATH}-journal'
+        }
+        yield db_snapshot_path, os.path.relpath(config.DB_PATH,
+                                                config.CONFIG_DIR)
+
+        for root, dirs, files in os.walk(config.CONFIG_DIR):
+            # Skip the backups directory itself
+            if 'backups' in root:
+                continue
+
+            for file in files:
+                file_path = os.path.join(root, file)
+                if file_path in db_files:
+                    continue
+                # Calculate path relative to config directory
+                arc_path = os.path.relpath(file_path, config.CONFIG_DIR)
+                yield file_path, arc_path
+
+    def create_backup(self, mode=None):
+        """
+        Create a new backup of the config directory. `mode` is 'full' for a
+        standalone zip or 'incremental' for a manifest over the chunk store;
+        it defaults to config.BACKUP_MODE.
+        """
+        backup_path = None
+        snapshot_path = None
         try:
+            mode = mode or config.BACKUP_MODE
+            if mode not in BACKUP_MODES:
+                return False, f'Unknown backup mode: {mode}'
+            if config.BACKUP_COMPRESSION not in COMPRESSION_LEVELS:
+                return False, (f'Unknown backup compression: '
+                               f'{config.BACKUP_COMPRESSION}')
+
             # Generate backup filename with timestamp
             timestamp = datetime.now().strftime('%Y_%m_%d_%H%M%S')
-            backup_filename = f'backup_{timestamp}.zip'
+            if mode == 'incremental':
+                backup_filename = f'backup_{timestamp}{MANIFEST_SUFFIX}'
+            else:
+                backup_filename = f'backup_{timestamp}.zip'
             backup_path = os.path.join(self.backup_dir, backup_filename)
 
-            # Create zip file
-            with zipfile.ZipFile(backup_path, 'w',
-                                 zipfile.ZIP_DEFLATED) as zipf:
-                # Walk through all files in config directory
-                for root, dirs, files in os.walk(config.CONFIG_DIR):
-                    # Skip the backups directory itself
-                    if 'backups' in root:
-                        continue
-
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # Calculate path relative to config directory
-                        arc_path = os.path.relpath(file_path,
-                                                   config.CONFIG_DIR)
-                        zipf.write(file_path, arc_path)
+            # Snapshot the database first so archiving never reads a file
+            # that is being written to
+            fd, snapshot_path = tempfile.mkstemp(suffix='.db',
+                                                 dir=self.backup_dir)
+            os.close(fd)
+            self._snapshot_database(snapshot_path)
+            files = self._iter_config_files(snapshot_path)
+            throttle = Throttle(config.BACKUP_THROTTLE_MBPS)
+
+            if mode == 'incremental':
+                self._create_incremental_backup(backup_path, files, throttle)
+            else:
+                # Create zip file
+                compression, level = zip_compression(
+                    config.BACKUP_COMPRESSION)
+                with zipfile.ZipFile(backup_path,
+                                     'w',
+                                     compression,
+                                     compresslevel=level) as zipf:
+                    for file_path, arc_path in files:
+                        write_zip_entry(zipf, file_path, arc_path, throttle)
 
             # Record backup in database
             with get_db() as conn:
@@ -61,8 +156,138 @@ class BackupManager:
 
         except Exception as e:
             logger.error(f'Error creating backup: {str(e)}')
+            if backup_path and os.path.exists(backup_path):
+                os.remove(backup_path)
             return False, str(e)
 
+        finally:
+            if snapshot_path and os.path.exists(snapshot_path):
+                os.remove(snapshot_path)
+
+    def _latest_manifest(self):
+        """Load the newest incremental manifest, or None"""
+        manifests = sorted(name for name in os.listdir(self.backup_dir)
+                           if self.is_incremental(name))
+        for name in reversed(manifests):
+            try:
+                return self._read_manifest(os.path.join(
+                    self.backup_dir, name))
+            except Exception as e:
+                logger.warning(f'Skipping unreadable manifest {name}: {e}')
+        return None
+
+    @staticmethod
+    def _read_manifest(manifest_path):
+        with gzip.open(manifest_path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _create_incremental_backup(self, manifest_path, files_to_backup,
+                                   throttle):
+        """
+        Store changed files in the chunk store and write a manifest listing
+        the chunks of every file. Files whose size and mtime match the
+        previous manifest reuse its chunk list without being read.
+        """
+        # Chunks only count as live for garbage collection once the manifest
+        # naming them exists, so hold the store until it is written
+        with self.store.lock():
+            self._write_incremental_backup(manifest_path, files_to_backup,
+                                           throttle)
+
+    def _write_incremental_backup(self, manifest_path, files_to_backup,
+                                  throttle):
+        previous = self._latest_manifest()
+        previous_files = previous['files'] if previous else {}
+
+        files = {}
+        pending = {}
+        reused = 0
+        with ChunkPipeline(self.store,
+                           workers=config.BACKUP_WORKERS,
+                           level=COMPRESSION_LEVELS[config.BACKUP_COMPRESSION],
+                           throttle=throttle) as pipeline:
+            for file_path, arc_path in files_to_backup:
+                stat = os.stat(file_path)
+                entry = {
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'mode': stat.st_mode & 0o777
+                }
+
+                prev = previous_files.get(arc_path)
+                if (prev and prev['size'] == entry['size']
+                        and prev['mtime_ns'] == entry['mtime_ns']
+                        and all(self.store.has(d) for d in prev['chunks'])):
+                    entry['chunks'] = prev['chunks']
+                    reused += 1
+                else:
+                    pending[arc_path] = pipeline.submit_file(file_path)
+                files[arc_path] = entry
+
+            for arc_path, futures in pending.items():
+                files[arc_path]['chunks'] = [f.result() for f in futures]
+            written = pipeline.bytes_written
+
+        manifest = {
+            'version': 1,
+            'created_at': datetime.now().isoformat(),
+            'files': files
+        }
+        # Write to a temp name so a partial manifest is never picked up
+        tmp_path = f'{manifest_path}.tmp'
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(manifest, f, separators=(',', ':'))
+        os.replace(tmp_path, manifest_path)
+
+        logger.info(f'Incremental backup: {len(files)} files, '
+                    f'{reused} unchanged, {written} bytes of new chunks')
+
+    def _restore_manifest(self, manifest_path, dest_dir):
+        """Reassemble every file in a manifest under dest_dir"""
+        manifest = self._read_manifest(manifest_path)
+        for arc_path, entry in manifest['files'].items():
+            dest_path = os.path.join(dest_dir, arc_path)
+            self.store.restore_file(entry['chunks'], dest_path)
+            os.chmod(dest_path, entry['mode'])
+            os.utime(dest_path, ns=(entry['mtime_ns'], entry['mtime_ns']))
+
+    def _extract_backup(self, backup_path, dest_dir):
+        """Unpack a zip or incremental backup into dest_dir"""
+        if self.is_incremental(backup_path):
+            self._restore_manifest(backup_path, dest_dir)
+        else:
+            with zipfile.ZipFile(backup_path, 'r') as zipf:
+                zipf.extractall(dest_dir)
+
+    def export_backup(self, backup_filename, dest_path):
+        """Write any backup out as a standalone zip archive"""
+        backup_path = os.path.join(self.backup_dir, backup_filename)
+        with tempfile.TemporaryDirectory(dir=self.backup_dir) as temp_dir:
+            self._extract_backup(backup_path, temp_dir)
+            with zipfile.ZipFile(dest_path, 'w',
+                                 zipfile.ZIP_DEFLATED) as zipf:
+                for root, dirs, files in os.walk(temp_dir):
+                    for file in files:
+                        file_path = os.path.join(root, file)
+                        zipf.write(file_path,
+                                   os.path.relpath(file_path, temp_dir))
+
+    def prune_chunk_store(self):
+        """Drop chunks no longer referenced by any incremental backup"""
+        store_dir = os.path.join(self.backup_dir, 'store')
+        if not os.path.isdir(store_dir):
+            return 0
+
+        with self.store.lock():
+            live = set()
+            for name in os.listdir(self.backup_dir):
+                if self.is_incremental(name):
+                    manifest = self._read_manifest(
+                        os.path.join(self.backup_dir, name))
+                    for entry in manifest['files'].values():
+                        live.update(entry['chunks'])
+            return self.store.collect_garbage(live)
+
     def restore_backup(self, backup_filename):
         """Restore from a backup file"""
         backup_path = os.path.join(self.backup_dir, backup_filename)
@@ -76,8 +301,7 @@ class BackupManager:
             os.makedirs(temp_dir, exist_ok=True)
 
             # Extract backup to temporary directory
-            with zipfile.ZipFile(backup_path, 'r') as zipf:
-                zipf.extractall(temp_dir)
+            self._extract_backup(backup_path, temp_dir)
 
             # Move files to config directory
             for item in os.listdir(temp_dir):
@@ -117,17 +341,23 @@ class BackupManager:
                 ''', (cutoff_date.isoformat(), )).fetchall()
 
                 # Remove old backup files and database entries
+                removed_incremental = False
                 for backup in old_backups:
                     backup_path = os.path.join(self.backup_dir,
                                                backup['filename'])
                     if os.path.exists(backup_path):
                         os.remove(backup_path)
+                    if self.is_incremental(backup['filename']):
+                        removed_incremental = True
 
                     conn.execute('DELETE FROM backups WHERE filename = ?',
                                  (backup['filename'], ))
 
                 conn.commit()
 
+            if removed_incremental:
+                self.prune_chunk_store()
+
             logger.info('Old backups cleaned up successfully')
             return True, "Cleanup completed successfully"
 
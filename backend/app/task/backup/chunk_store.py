@@ -0,0 +1,112 @@
+# app/task/backup/chunk_store.py
+from contextlib import contextmanager
+import hashlib
+import logging
+import os
+import threading
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # Not on POSIX; the thread lock still applies
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkStore:
+    """
+    Content-addressed store of compressed file chunks.
+
+    Files are split into fixed-size chunks, each stored once under its
+    SHA-256 digest. Fixed offsets suit SQLite databases, which rewrite
+    pages in place, so a small change only produces a few new chunks.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    # Serializes writers and garbage collection within this process; the
+    # lock file does the same across worker processes
+    _thread_lock = threading.Lock()
+
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.lock_path = os.path.join(root, 'lock')
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+    @contextmanager
+    def lock(self):
+        """
+        Exclusive hold on the store. A backup holds it from its first chunk
+        until its manifest is written, and garbage collection holds it
+        while it reads the manifests and deletes, so it never removes the
+        chunks of a backup that is still being written.
+        """
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def has(self, digest):
+        return os.path.exists(self._object_path(digest))
+
+    def put(self, data, level=6):
+        """
+        Store a chunk if it isn't already present. Safe to call from
+        several threads. Returns (digest, bytes_written).
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return digest, 0
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        compressed = zlib.compress(data, level)
+        # Write to a temp name so a crash never leaves a truncated object
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+        return digest, len(compressed)
+
+    def get(self, digest):
+        """Read a chunk back, verifying it against its digest."""
+        with open(self._object_path(digest), 'rb') as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f'Chunk {digest} is corrupt')
+        return data
+
+    def restore_file(self, digests, dest_path):
+        """Reassemble a file from its chunks."""
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        with open(dest_path, 'wb') as f:
+            for digest in digests:
+                f.write(self.get(digest))
+
+    def collect_garbage(self, live_digests):
+        """
+        Delete every chunk not in `live_digests`. Returns count removed.
+        Call with lock() held, having read `live_digests` under it.
+        """
+        removed = 0
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for name in os.listdir(prefix_dir):
+                if name not in live_digests:
+                    os.remove(os.path.join(prefix_dir, name))
+                    removed += 1
+        logger.info(f'Removed {removed} unreferenced backup chunks')
+        return removed
@@ -0,0 +1,123 @@
+# app/task/backup/pipeline.py
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+import zipfile
+
+logger = logging.getLogger(__name__)
+
+# Compression presets shared by zip and chunk store backups. 'fast' trades
+# ratio for speed the way zstd's low levels do, using deflate level 1 so
+# archives stay readable by any unzip tool.
+COMPRESSION_LEVELS = {'default': 6, 'fast': 1, 'none': 0}
+
+READ_BLOCK_SIZE = 1024 * 1024
+
+# ZipFile.open(zinfo, 'w') compresses at the ZipInfo's own level, not the
+# archive's, and that attribute only has a public name from Python 3.13
+_ZINFO_LEVEL_ATTR = ('compress_level' if hasattr(zipfile.ZipInfo(),
+                                                 'compress_level') else
+                     '_compresslevel')
+
+
+def zip_compression(codec):
+    """Return (compress_type, compresslevel) for a compression preset"""
+    level = COMPRESSION_LEVELS[codec]
+    if level == 0:
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, level
+
+
+class Throttle:
+    """
+    Caps average read throughput by sleeping once reads get ahead of the
+    allowed rate, leaving disk and CPU headroom for request handling.
+    A rate of 0 disables throttling.
+    """
+
+    def __init__(self, mb_per_second=0):
+        self.bytes_per_second = mb_per_second * 1024 * 1024
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._consumed = 0
+
+    def consume(self, nbytes):
+        if self.bytes_per_second <= 0:
+            return
+        with self._lock:
+            self._consumed += nbytes
+            expected = self._consumed / self.bytes_per_second
+            delay = expected - (time.monotonic() - self._start)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ChunkPipeline:
+    """
+    Reads files block by block on the calling thread and hashes/compresses
+    the blocks into a ChunkStore on a small worker pool. At most
+    `max_pending` blocks are in flight, so memory stays bounded no matter
+    how large the files are. zlib and hashlib release the GIL, so the
+    workers genuinely run in parallel.
+    """
+
+    def __init__(self, store, workers=2, level=6, throttle=None):
+        self.store = store
+        self.level = level
+        self.throttle = throttle or Throttle()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='backup-chunk')
+        self._pending = threading.BoundedSemaphore(workers * 2)
+        self._written = 0
+        self._written_lock = threading.Lock()
+
+    def _put(self, data):
+        try:
+            digest, size = self.store.put(data, self.level)
+            with self._written_lock:
+                self._written += size
+            return digest
+        finally:
+            self._pending.release()
+
+    def submit_file(self, file_path):
+        """Queue a file's chunks. Returns futures resolving to digests."""
+        futures = []
+        with open(file_path, 'rb') as f:
+            while True:
+                data = f.read(self.store.CHUNK_SIZE)
+                if not data:
+                    break
+                self.throttle.consume(len(data))
+                self._pending.acquire()
+                futures.append(self._executor.submit(self._put, data))
+        return futures
+
+    @property
+    def bytes_written(self):
+        return self._written
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_zip_entry(zipf, file_path, arc_path, throttle):
+    """Stream a file into an open archive in fixed-size blocks"""
+    zinfo = zipfile.ZipInfo.from_file(file_path, arc_path)
+    # Same settings ZipFile.write applies to the entries it creates
+    zinfo.compress_type = zipf.compression
+    setattr(zinfo, _ZINFO_LEVEL_ATTR, zipf.compresslevel)
+    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dest:
+        while True:
+            data = src.read(READ_BLOCK_SIZE)
+            if not data:
+                break
+            throttle.consume(len(data))
+            dest.write(data)
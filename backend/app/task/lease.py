@@ -0,0 +1,83 @@
+# app/task/lease.py
+import logging
+import os
+import socket
+import time
+import uuid
+
+from ..db import get_db
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLease:
+    """
+    A named, time-limited lease stored in SQLite.
+
+    Every worker process competes for the same lease; whoever holds an
+    unexpired row is the leader. The holder must renew before `ttl_seconds`
+    elapses, otherwise another worker may take over.
+    """
+
+    def __init__(self, name='scheduler', ttl_seconds=30, holder_id=None):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.holder_id = holder_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}")
+        self.expires_at = 0.0
+
+    def try_acquire(self):
+        """
+        Acquire the lease, or renew it if we already hold it.
+        Returns True if this process holds the lease afterwards.
+        """
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+
+        with get_db() as conn:
+            # Single statement so the check-and-take is atomic across workers
+            cursor = conn.execute(
+                '''
+                INSERT INTO leader_leases (name, holder, acquired_at, expires_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    holder = excluded.holder,
+                    acquired_at = CASE
+                        WHEN leader_leases.holder = excluded.holder
+                        THEN leader_leases.acquired_at
+                        ELSE excluded.acquired_at
+                    END,
+                    expires_at = excluded.expires_at
+                WHERE leader_leases.holder = excluded.holder
+                    OR leader_leases.expires_at < ?
+                ''', (self.name, self.holder_id, now, expires_at, now))
+            conn.commit()
+            acquired = cursor.rowcount > 0
+
+        if acquired:
+            self.expires_at = expires_at
+        return acquired
+
+    def release(self):
+        """Give up the lease so another worker can take over immediately."""
+        with get_db() as conn:
+            conn.execute(
+                'DELETE FROM leader_leases WHERE name = ? AND holder = ?',
+                (self.name, self.holder_id))
+            conn.commit()
+        self.expires_at = 0.0
+        logger.info(f"Released '{self.name}' lease held by {self.holder_id}")
+
+    def is_expired(self):
+        """Whether our last successful renewal has run out."""
+        return time.time() >= self.expires_at
+
+    def get_holder(self):
+        """Return the current lease row as a dict, or None if unheld."""
+        with get_db() as conn:
+            row = conn.execute(
+                '''
+                SELECT holder, acquired_at, expires_at
+                FROM leader_leases WHERE name = ? AND expires_at >= ?
+                ''', (self.name, time.time())).fetchone()
+            return dict(row) if row else None
@@ -1,17 +1,46 @@
 # app/task/tasks.py
 from abc import ABC, abstractmethod
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import atexit
 import logging
 import re
+import threading
+import zlib
 
-from ..db import get_db
+from ..db import get_db, record_task_run
+from ..config.config import config
+from ..utils.repo_lock import repo_lock
+from .lease import LeaderLease
 
 task_logger = logging.getLogger('task_system')
 task_logger.setLevel(logging.DEBUG)
 
+# Fixed reference point for task phases, so a task keeps the same offset
+# across restarts and reloads
+PHASE_ANCHOR = datetime(2024, 1, 1)
+
+# Slowest items kept per strategy in an import run's stored timings
+RUN_DETAIL_ITEMS = 10
+
+# Threads for tasks that aren't arr syncs (APScheduler's default pool size)
+DEFAULT_EXECUTOR_THREADS = 10
+
+# How long a scheduled sync whose execution slot was taken waits before
+# trying again
+SYNC_RETRY_SECONDS = 60
+
+
+class ExecutionSlotBusy(Exception):
+    """A task's execution slot is taken and the caller chose not to wait"""
+
 
 class Task(ABC):
+    # Arr sync tasks share the global concurrency cap and are serialized
+    # per arr server
+    is_arr_sync = False
 
     def __init__(self, id=None, name=None, interval_minutes=None):
         self.id = id
@@ -24,6 +53,95 @@ class Task(ABC):
     def run_job(self):
         pass
 
+    def get_concurrency_key(self):
+        """Key of the remote this task talks to; tasks sharing a key never overlap."""
+        return None
+
+    def get_run_counts(self, result):
+        """
+        Extract (items_processed, items_failed) from what run_job returned.
+        Jobs that return an import-style result dict report their counts;
+        anything else records no counts.
+        """
+        if not isinstance(result, dict):
+            return None, None
+        processed = result.get('added', 0) + result.get('updated', 0)
+        return processed, result.get('failed', 0)
+
+    def get_run_status(self, result):
+        """
+        Get (status, error) for a job that returned without raising. Jobs
+        that return an import-style result dict report 'partial' or
+        'failed' through it; anything else counts as 'success'.
+        """
+        if not isinstance(result, dict):
+            return 'success', None
+        error = result.get('error') or (
+            f"{result.get('failed', 0)} item(s) failed")
+        if result.get('status') == 'partial':
+            return 'partial', error
+        if result.get('success') is False or result.get('status') == 'failed':
+            return 'failed', error
+        return 'success', None
+
+    def get_run_details(self, result):
+        """Extra breakdown of a run to store with it, or None"""
+        return None
+
+    def execute(self):
+        """
+        Run the job, keeping scheduled_tasks.status current and recording
+        the run in task_runs. Returns (status, error_message), status being
+        'success', 'partial' or 'failed'.
+        """
+        task_logger.info(f"Starting task: {self.name} (ID: {self.id})")
+        start_time = datetime.now()
+        result = None
+        error = None
+        try:
+            self.update_status('running')
+            result = self.run_job()
+        except Exception as e:
+            error = str(e)
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+
+        if error is None:
+            status, error = self.get_run_status(result)
+        else:
+            status = 'failed'
+
+        if status == 'success':
+            task_logger.info(
+                f"Task {self.name} completed successfully in {duration:.2f} seconds"
+            )
+        elif status == 'partial':
+            task_logger.warning(
+                f"Task {self.name} partially failed after {duration:.2f} seconds: {error}"
+            )
+        else:
+            task_logger.error(
+                f"Task {self.name} failed after {duration:.2f} seconds: {error}"
+            )
+        self.update_status(status)
+
+        try:
+            items_processed, items_failed = self.get_run_counts(result)
+            record_task_run(self.id,
+                            start_time,
+                            end_time,
+                            status,
+                            items_processed=items_processed,
+                            items_failed=items_failed,
+                            error=error,
+                            details=self.get_run_details(result),
+                            keep=config.TASK_RUN_HISTORY_LIMIT)
+        except Exception as e:
+            task_logger.error(
+                f"Could not record run of task {self.name}: {str(e)}")
+
+        return status, error
+
     def update_status(self, status):
         task_logger.info(
             f"Task {self.name} (ID: {self.id}) status changed to: {status}")
@@ -39,10 +157,28 @@ class Task(ABC):
 
 class TaskScheduler:
     _instance = None
+    LEASE_JOB_ID = 'scheduler_lease'
 
     def __init__(self):
-        self.scheduler = BackgroundScheduler()
+        # Syncs get a pool no larger than the number that may run at once,
+        # and the lease job its own thread, so neither can be starved by
+        # the other or by the remaining tasks
+        self.scheduler = BackgroundScheduler(
+            executors={
+                'default': ThreadPoolExecutor(DEFAULT_EXECUTOR_THREADS),
+                'sync': ThreadPoolExecutor(config.MAX_CONCURRENT_SYNC_TASKS),
+                'lease': ThreadPoolExecutor(1)
+            })
         self.logger = logging.getLogger('TaskScheduler')
+        self.lease = LeaderLease('scheduler',
+                                 ttl_seconds=config.SCHEDULER_LEASE_SECONDS)
+        self.is_leader = False
+        self._leader_lock = threading.RLock()
+        self._task_signature = None
+        self._sync_slots = threading.BoundedSemaphore(
+            config.MAX_CONCURRENT_SYNC_TASKS)
+        self._server_locks = {}
+        self._server_locks_lock = threading.Lock()
         TaskScheduler._instance = self
 
     @classmethod
@@ -53,54 +189,254 @@ class TaskScheduler:
         """
         Reload tasks from the DB, removing all old jobs first
         so we don't collide with existing job IDs.
+        Only the lease holder schedules tasks; other workers ignore this and
+        the leader picks up DB changes on its next lease renewal.
         """
-        self.logger.debug(
-            "[TaskScheduler] remove_all_jobs to avoid duplicates")
-        self.scheduler.remove_all_jobs()
-
-        with get_db() as conn:
-            task_rows = conn.execute(
-                'SELECT * FROM scheduled_tasks').fetchall()
-            for row in task_rows:
-                task_class = self.get_task_class(row['type'])
-                if task_class:
-                    task = task_class(id=row['id'],
-                                      name=row['name'],
-                                      interval_minutes=row['interval_minutes'])
-                    self.schedule_task(task)
+        with self._leader_lock:
+            if not self.is_leader:
+                self.logger.debug(
+                    "[TaskScheduler] Not the leader - skipping task load")
+                return
+
+            self.logger.debug(
+                "[TaskScheduler] Removing task jobs to avoid duplicates")
+            self._remove_task_jobs()
+
+            with get_db() as conn:
+                task_rows = conn.execute(
+                    'SELECT * FROM scheduled_tasks').fetchall()
+                for row in task_rows:
+                    task_class = self.get_task_class(row['type'])
+                    if task_class:
+                        task = task_class(
+                            id=row['id'],
+                            name=row['name'],
+                            interval_minutes=row['interval_minutes'])
+                        self.schedule_task(task)
+
+            self._task_signature = self._read_task_signature()
 
     def schedule_task(self, task):
+        # Missed runs collapse into one, and a task never overlaps itself
         self.scheduler.add_job(self._run_task_wrapper(task),
                                'interval',
                                minutes=task.interval_minutes,
-                               id=str(task.id))
+                               start_date=self._phase_start_date(task),
+                               id=str(task.id),
+                               executor='sync' if task.is_arr_sync else
+                               'default',
+                               coalesce=True,
+                               max_instances=1,
+                               misfire_grace_time=None)
 
-    def _run_task_wrapper(self, task):
+    @staticmethod
+    def _phase_start_date(task):
+        """
+        Spread tasks with the same interval across that interval. The offset
+        is derived from the task's identity, so it is stable between runs
+        instead of every task firing at the moment they were loaded.
+        """
+        interval_seconds = int((task.interval_minutes or 0) * 60)
+        if interval_seconds <= 0:
+            return None
+        key = f"{task.__class__.__name__}:{task.id}".encode()
+        offset = zlib.crc32(key) % interval_seconds
+        return PHASE_ANCHOR + timedelta(seconds=offset)
+
+    def _get_server_lock(self, key):
+        with self._server_locks_lock:
+            if key not in self._server_locks:
+                self._server_locks[key] = threading.Lock()
+            return self._server_locks[key]
+
+    @contextmanager
+    def _execution_slot(self, task):
+        """
+        Hold the resources a task needs before it runs: its arr server's
+        lock, then one of the global sync slots. Non-sync tasks run freely.
+        Raises ExecutionSlotBusy instead of waiting when either is taken.
+        """
+        if not task.is_arr_sync:
+            yield
+            return
 
-        def wrapped():
-            task_logger.info(f"Starting task: {task.name} (ID: {task.id})")
-            start_time = datetime.now()
+        key = None
+        try:
+            key = task.get_concurrency_key()
+        except Exception as e:
+            task_logger.warning(
+                f"Could not resolve concurrency key for {task.name}: {str(e)}"
+            )
+
+        server_lock = self._get_server_lock(key) if key else None
+        if server_lock and not server_lock.acquire(blocking=False):
+            raise ExecutionSlotBusy(f"Another sync to {key} is running")
+        try:
+            if not self._sync_slots.acquire(blocking=False):
+                raise ExecutionSlotBusy(
+                    f"All {config.MAX_CONCURRENT_SYNC_TASKS} sync slots "
+                    f"are in use")
             try:
-                task.update_status('running')
-                task.run_job()
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                task_logger.info(
-                    f"Task {task.name} completed successfully in {duration:.2f} seconds"
-                )
-                task.update_status('success')
+                yield
+            finally:
+                self._sync_slots.release()
+        finally:
+            if server_lock:
+                server_lock.release()
+
+    def run_now(self, task):
+        """
+        Run a task immediately on the calling thread, in the same execution
+        slot scheduled runs use. Raises ExecutionSlotBusy rather than
+        waiting when the slot is taken. Returns what task.execute() does.
+        """
+        with self._execution_slot(task):
+            return task.execute()
+
+    def reschedule_task(self, task):
+        """
+        Replace the job for a single task. On followers this is a no-op; the
+        leader notices the DB change on its next lease renewal.
+        """
+        with self._leader_lock:
+            if not self.is_leader:
+                return
+            if self.scheduler.get_job(str(task.id)):
+                self.scheduler.remove_job(str(task.id))
+            self.schedule_task(task)
+            self._task_signature = self._read_task_signature()
+
+    def _remove_task_jobs(self):
+        """
+        Remove every scheduled task and pending retry, keeping the lease
+        maintenance job.
+        """
+        for job in self.scheduler.get_jobs():
+            if job.id != self.LEASE_JOB_ID:
+                job.remove()
+
+    @staticmethod
+    def _read_task_signature():
+        """Cheap fingerprint of scheduled_tasks used to detect edits."""
+        with get_db() as conn:
+            return tuple(
+                tuple(row) for row in conn.execute(
+                    'SELECT id, type, interval_minutes FROM scheduled_tasks ORDER BY id'
+                ).fetchall())
+
+    def _maintain_lease(self):
+        """
+        Acquire or renew the scheduler lease and start/stop running tasks
+        when leadership changes hands.
+        """
+        with self._leader_lock:
+            try:
+                acquired = self.lease.try_acquire()
             except Exception as e:
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                task_logger.error(
-                    f"Task {task.name} failed after {duration:.2f} seconds: {str(e)}"
+                self.logger.error(
+                    f"[TaskScheduler] Lease renewal failed: {str(e)}")
+                # Keep leading until our last renewal runs out
+                acquired = self.is_leader and not self.lease.is_expired()
+
+            if acquired and not self.is_leader:
+                self.logger.info(
+                    f"[TaskScheduler] Acquired scheduler lease ({self.lease.holder_id}), starting tasks"
+                )
+                self.is_leader = True
+                self.load_tasks_from_db()
+            elif not acquired and self.is_leader:
+                self.logger.warning(
+                    f"[TaskScheduler] Lost scheduler lease ({self.lease.holder_id}), stopping tasks"
                 )
-                task.update_status('failed')
+                self.is_leader = False
+                self._remove_task_jobs()
+            elif acquired:
+                try:
+                    if self._read_task_signature() != self._task_signature:
+                        self.logger.info(
+                            "[TaskScheduler] Scheduled tasks changed, reloading"
+                        )
+                        self.load_tasks_from_db()
+                except Exception as e:
+                    self.logger.error(
+                        f"[TaskScheduler] Failed to check for task changes: {str(e)}"
+                    )
+
+    def get_next_run_time(self, task_row):
+        """
+        Next run time for a scheduled_tasks row. Followers have no jobs of
+        their own, so estimate it from last_run and the interval.
+        """
+        job = self.scheduler.get_job(str(task_row['id']))
+        if job:
+            return job.next_run_time
+        if self.is_leader or not task_row['last_run']:
+            return None
+        try:
+            last_run = datetime.fromisoformat(str(task_row['last_run']))
+        except ValueError:
+            return None
+        return last_run + timedelta(minutes=task_row['interval_minutes'])
+
+    def _run_task_wrapper(self, task):
+
+        def wrapped():
+            # A run already handed to a pool thread may start after the
+            # lease was lost
+            if not self.is_leader:
+                return
+            try:
+                with self._execution_slot(task):
+                    task.execute()
+            except ExecutionSlotBusy as e:
+                self._schedule_retry(task, wrapped, str(e))
 
         return wrapped
 
+    def _schedule_retry(self, task, run, reason):
+        """Try a scheduled run again shortly instead of waiting on a thread"""
+        task_logger.info(f"Task {task.name} deferred by {SYNC_RETRY_SECONDS}s: "
+                         f"{reason}")
+        with self._leader_lock:
+            if not self.is_leader:
+                return
+            self.scheduler.add_job(
+                run,
+                'date',
+                run_date=datetime.now() +
+                timedelta(seconds=SYNC_RETRY_SECONDS),
+                id=f"{task.id}-retry",
+                executor='sync' if task.is_arr_sync else 'default',
+                replace_existing=True,
+                misfire_grace_time=None)
+
     def start(self):
+        # Try for the lease right away so a single worker starts its
+        # tasks without waiting for the first renewal interval
+        self._maintain_lease()
+        self.scheduler.add_job(self._maintain_lease,
+                               'interval',
+                               seconds=config.SCHEDULER_LEASE_RENEW_SECONDS,
+                               id=self.LEASE_JOB_ID,
+                               executor='lease',
+                               max_instances=1,
+                               coalesce=True,
+                               misfire_grace_time=None)
         self.scheduler.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self):
+        """Stop scheduling and hand the lease to another worker."""
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        with self._leader_lock:
+            if self.is_leader:
+                self.is_leader = False
+                try:
+                    self.lease.release()
+                except Exception as e:
+                    self.logger.error(
+                        f"[TaskScheduler] Failed to release lease: {str(e)}")
 
     @staticmethod
     def get_task_class(task_type):
@@ -127,12 +463,14 @@ class SyncTask(Task):
             task_logger.info("No valid git repository found - skipping sync")
             return
 
-        # If we have a valid repo, proceed with sync
+        # If we have a valid repo, proceed with sync. Fetching (and
+        # auto-pulling) writes to the repository like the git routes do.
         status_manager = GitStatusManager.get_instance(repo_path)
         if status_manager:
-            success = status_manager.update_remote_status()
+            with repo_lock:
+                success = status_manager.update_remote_status()
             if not success:
-                task_logger.error("Failed to update remote git status")
+                raise RuntimeError("Failed to update remote git status")
 
 
 class BackupTask(Task):
@@ -152,8 +490,8 @@ class BackupTask(Task):
             # Run cleanup to remove old backups
             manager.cleanup_old_backups()
         else:
-            logger.error(f"Backup failed: {backup_name}"
-                         )  # backup_name contains error message in this case
+            # backup_name contains error message in this case
+            raise RuntimeError(f"Backup failed: {backup_name}")
 
 
 class ImportScheduleTask(Task):
@@ -163,6 +501,32 @@ class ImportScheduleTask(Task):
     For example, if the scheduled_tasks.name is 'Import for ARR #1 - radarr',
     we parse '1' out of that string to know which arr_config to import.
     """
+    is_arr_sync = True
+
+    def get_concurrency_key(self):
+        """Imports to the same arr server are serialized."""
+        with get_db() as conn:
+            row = conn.execute(
+                'SELECT arr_server FROM arr_config WHERE import_task_id = ?',
+                (self.id, )).fetchone()
+        if not row or not row['arr_server']:
+            return None
+        return row['arr_server'].rstrip('/').lower()
+
+    def get_run_details(self, result):
+        """
+        The import's timing breakdown per strategy, keeping only the
+        slowest items so stored runs stay small.
+        """
+        if not isinstance(result, dict) or not result.get('timings'):
+            return None
+        return {
+            'timings': {
+                strategy: dict(timings,
+                               items=timings['items'][:RUN_DETAIL_ITEMS])
+                for strategy, timings in result['timings'].items()
+            }
+        }
 
     def run_job(self):
         from ..importer import handle_scheduled_import
@@ -179,3 +543,4 @@ class ImportScheduleTask(Task):
             task_logger.info(
                 f"[ImportScheduleTask] Scheduled import completed for task_id={self.id}: added={result.get('added', 0)}, updated={result.get('updated', 0)}, failed={result.get('failed', 0)}"
             )
+        return result
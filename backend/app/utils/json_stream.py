@@ -0,0 +1,108 @@
+# app/utils/json_stream.py
+"""
+Incremental JSON encoding for large responses. Dicts and lists are
+written piece by piece and generators are written as arrays while they
+are being consumed, so a response starts flowing immediately and only
+one item at a time has to be held in memory.
+
+Once the 200 headers are out an error can no longer become an error
+response. The first item of every generator is therefore produced before
+the response starts, so failures that hit every item still surface as a
+normal error. A later failure is logged and aborts the response, so the
+client sees an incomplete transfer rather than a complete-looking body.
+"""
+from itertools import chain
+import logging
+from typing import Any, Iterator
+
+from flask import Response, json, stream_with_context
+
+logger = logging.getLogger(__name__)
+
+# Encoded pieces are batched into writes of roughly this size
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_json(value: Any, depth: int = 3) -> Iterator[str]:
+    """
+    Yield the JSON encoding of value in pieces. Dicts and lists are split
+    up to `depth` levels deep, which keeps each piece about the size of
+    one collection item; generators are always written incrementally.
+    """
+    if hasattr(value, '__next__'):
+        yield '['
+        for i, item in enumerate(value):
+            if i:
+                yield ','
+            yield from iter_json(item, max(depth - 1, 0))
+        yield ']'
+    elif depth <= 0:
+        yield json.dumps(value)
+    elif isinstance(value, dict):
+        yield '{'
+        for i, (key, item) in enumerate(value.items()):
+            yield f'{"," if i else ""}{json.dumps(str(key))}:'
+            yield from iter_json(item, depth - 1)
+        yield '}'
+    elif isinstance(value, (list, tuple)):
+        yield '['
+        for i, item in enumerate(value):
+            if i:
+                yield ','
+            yield from iter_json(item, depth - 1)
+        yield ']'
+    else:
+        yield json.dumps(value)
+
+
+def _prefetch(value: Any, depth: int = 3) -> Any:
+    """
+    Produce the first item of every generator iter_json would stream,
+    rebuilding the containers around them, so errors raise here.
+    """
+    if hasattr(value, '__next__'):
+        for first in value:
+            return chain([_prefetch(first, max(depth - 1, 0))], value)
+        return iter(())
+    if depth <= 0:
+        return value
+    if isinstance(value, dict):
+        return {key: _prefetch(item, depth - 1) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_prefetch(item, depth - 1) for item in value]
+    return value
+
+
+def _logged(pieces: Iterator[bytes]) -> Iterator[bytes]:
+    try:
+        yield from pieces
+    except Exception:
+        logger.exception("Aborting streamed JSON response")
+        raise
+
+
+def _batched(pieces: Iterator[str]) -> Iterator[bytes]:
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= CHUNK_SIZE:
+            yield ''.join(buffer).encode('utf-8')
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+def stream_json(value: Any, status: int = 200) -> Response:
+    """
+    Streaming counterpart of jsonify. Apart from their first item,
+    generators inside value are only consumed while the response is
+    written, inside the request context. Use jsonify for values that are
+    already fully built; streaming them only defers the encoding.
+    """
+    value = _prefetch(value)
+    return Response(stream_with_context(_logged(_batched(iter_json(value)))),
+                    status=status,
+                    mimetype='application/json')
@@ -0,0 +1,31 @@
+# app/utils/repo_lock.py
+"""
+One lock around changes to the database repository (config.DB_DIR).
+
+Git commands, and the data routes' YAML writes and renames, were written
+for a server that handled one request at a time. Now that requests run
+on several threads, anything that writes to the repository (its files,
+index or refs) holds this lock so that two writers never interleave.
+"""
+import threading
+
+from flask import g, request
+
+repo_lock = threading.RLock()
+
+_READ_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def serialize_writes(bp):
+    """Hold repo_lock through every request to `bp` that isn't a read"""
+
+    @bp.before_request
+    def acquire_repo_lock():
+        if request.method not in _READ_METHODS:
+            repo_lock.acquire()
+            g.holds_repo_lock = True
+
+    @bp.teardown_request
+    def release_repo_lock(exc):
+        if g.pop('holds_repo_lock', False):
+            repo_lock.release()
@@ -0,0 +1,11 @@
+# app/utils/stats.py
+
+from typing import List, Optional
+
+
+def percentile(sorted_values: List[float], pct: int) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
@@ -0,0 +1,52 @@
+# app/utils/yaml_io.py
+"""
+Shared YAML load/dump. Uses libyaml's C loader and dumper when PyYAML was
+built with it and falls back to the pure-Python safe classes otherwise;
+both are restricted to standard YAML tags.
+"""
+import time
+
+import yaml
+
+from ..metrics import yaml_parses
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    LIBYAML = False
+
+YAMLError = yaml.YAMLError
+
+
+class QuotingDumper(SafeDumper):
+    """Safe dumper that writes every string single-quoted"""
+
+
+def _quoted_str(dumper, data):
+    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style="'")
+
+
+QuotingDumper.add_representer(str, _quoted_str)
+
+
+def load(stream):
+    """Parse a YAML document from a string, bytes or open file"""
+    start = time.perf_counter()
+    try:
+        return yaml.load(stream, Loader=SafeLoader)
+    finally:
+        yaml_parses.observe(time.perf_counter() - start)
+
+
+def dump(data, stream=None, quoted=False, **kwargs):
+    """
+    Serialize data to `stream`, or return it as a string when no stream
+    is given. Takes the same options as yaml.safe_dump; `quoted` forces
+    single quotes on every string.
+    """
+    return yaml.dump(data,
+                     stream,
+                     Dumper=QuotingDumper if quoted else SafeDumper,
+                     **kwargs)
@@ -0,0 +1,78 @@
+"""
+Cost of resolving format/profile condition values through ValueResolver.
+
+    cd backend && python -m benchmarks.bench_mappings [--number N]
+
+Reports nanoseconds per resolved condition for each condition type, both
+warm (normal operation) and cold (normalization caches cleared before
+every pass, i.e. the cost of the first compile after startup).
+"""
+import argparse
+import timeit
+
+from app.compile import mappings
+from app.compile.mappings import TargetApp, ValueResolver
+
+# A representative mix of the spellings found in the database YAML
+CONDITIONS = {
+    'source': [('web_dl', TargetApp.RADARR), ('WEBRIP', TargetApp.SONARR),
+               ('bluray', TargetApp.RADARR)],
+    'resolution': [('1080p', ), ('2160P', ), ('720p', )],
+    'indexer_flag': [('freeleech', TargetApp.RADARR),
+                     ('Scene', TargetApp.SONARR)],
+    'quality_modifier': [('remux', ), ('BRDISK', )],
+    'release_type': [('season_pack', ), ('single_episode', )],
+    'quality_name': [('Remux-1080p', TargetApp.SONARR),
+                     ('BluRay_Disk', TargetApp.RADARR),
+                     ('WEBDL-1080p', TargetApp.RADARR)],
+    'language': [('english', TargetApp.RADARR, False),
+                 ('Portuguese Brazil', TargetApp.RADARR, False),
+                 ('spanish-latino', TargetApp.SONARR, False)]
+}
+
+RESOLVERS = {
+    'source': ValueResolver.get_source,
+    'resolution': ValueResolver.get_resolution,
+    'indexer_flag': ValueResolver.get_indexer_flag,
+    'quality_modifier': ValueResolver.get_quality_modifier,
+    'release_type': ValueResolver.get_release_type,
+    'quality_name': ValueResolver.get_quality_name,
+    'language': ValueResolver.get_language
+}
+
+CACHES = (mappings._normalize_language_name, mappings._quality_alias)
+
+
+def _clear_caches():
+    for cache in CACHES:
+        cache.cache_clear()
+
+
+def bench(condition_type, number, cold):
+    resolver = RESOLVERS[condition_type]
+    args_list = CONDITIONS[condition_type]
+
+    def run():
+        if cold:
+            _clear_caches()
+        for args in args_list:
+            resolver(*args)
+
+    seconds = min(timeit.repeat(run, number=number, repeat=5))
+    return seconds / (number * len(args_list)) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'condition':<18}{'warm ns':>10}{'cold ns':>10}")
+    for condition_type in CONDITIONS:
+        warm = bench(condition_type, args.number, cold=False)
+        cold = bench(condition_type, max(1, args.number // 10), cold=True)
+        print(f"{condition_type:<18}{warm:>10.0f}{cold:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
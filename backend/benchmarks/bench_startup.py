@@ -0,0 +1,188 @@
+"""
+Cold start of the backend, from process launch to its first 200.
+
+    cd backend && python -m benchmarks.bench_startup [--repeat N]
+        [--modes lazy,eager] [--server werkzeug|gunicorn] [--output FILE]
+
+Every run launches a fresh server process on a throwaway config
+directory that is already migrated and has a login, as a container
+restart finds /config. It then polls an endpoint registered at startup
+(/api/settings/general) and one that lazy startup loads on first use
+(/api/data/regex_pattern) until each answers 200. 'eager' runs set
+LAZY_STARTUP=false, which loads every subsystem and starts the scheduler
+before serving. The gunicorn server runs the app the way the container
+does.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+from .bench_suite import _configure, _git_commit
+
+API_KEY = 'benchmark'
+ROOT_ENV = 'PROFILARR_BENCH_ROOT'
+CORE_PATH = '/api/settings/general'
+LAZY_PATH = '/api/data/regex_pattern'
+POLL_SECONDS = 0.005
+MODES = ('lazy', 'eager')
+SERVERS = ('werkzeug', 'gunicorn')
+
+
+def create_benchmark_app():
+    """The app over the config directory in $PROFILARR_BENCH_ROOT"""
+    _configure(os.environ[ROOT_ENV])
+    from app.main import create_app
+    return create_app()
+
+
+def _serve(port):
+    from werkzeug.serving import make_server
+    make_server('127.0.0.1', port, create_benchmark_app(),
+                threaded=True).serve_forever()
+
+
+def _prepare(root):
+    """Migrate the database and add a login, as a restart would find them"""
+    _configure(root)
+    from app.db import get_db, run_migrations
+    run_migrations()
+    with get_db() as conn:
+        conn.execute(
+            'INSERT INTO auth (username, password_hash, api_key) '
+            'VALUES (?, ?, ?)', ('benchmark', 'unused', API_KEY))
+        conn.commit()
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _command(server, port):
+    if server == 'gunicorn':
+        return [sys.executable, '-m', 'gunicorn', '--bind',
+                f'127.0.0.1:{port}', '--threads', '8',
+                'benchmarks.bench_startup:create_benchmark_app()']
+    return [sys.executable, '-m', 'benchmarks.bench_startup', '--serve',
+            str(port)]
+
+
+def _wait_for_200(url, started, process, timeout):
+    request = urllib.request.Request(url, headers={'X-Api-Key': API_KEY})
+    while time.perf_counter() - started < timeout:
+        if process.poll() is not None:
+            raise RuntimeError(f'Server exited with {process.returncode}')
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                response.read()
+                if response.status == 200:
+                    return (time.perf_counter() - started) * 1000
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(POLL_SECONDS)
+    raise RuntimeError(f'No 200 from {url} within {timeout}s')
+
+
+def run_once(root, mode, server, timeout):
+    port = _free_port()
+    env = dict(os.environ,
+               **{ROOT_ENV: root,
+                  'LAZY_STARTUP': 'true' if mode == 'lazy' else 'false'})
+    started = time.perf_counter()
+    process = subprocess.Popen(_command(server, port),
+                               env=env,
+                               stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+    try:
+        base = f'http://127.0.0.1:{port}'
+        return {
+            'first_200_ms': _wait_for_200(base + CORE_PATH, started, process,
+                                          timeout),
+            'subsystem_200_ms': _wait_for_200(base + LAZY_PATH, started,
+                                              process, timeout)
+        }
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def _summarize(runs):
+    summary = {}
+    for key in runs[0]:
+        values = [run[key] for run in runs]
+        summary[key] = {
+            'best_ms': round(min(values), 1),
+            'median_ms': round(statistics.median(values), 1)
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--modes', default=','.join(MODES),
+                        help=f'comma separated, from {", ".join(MODES)}')
+    parser.add_argument('--server', choices=SERVERS, default='werkzeug')
+    parser.add_argument('--timeout', type=float, default=60.0,
+                        help='seconds to wait for each 200')
+    parser.add_argument('--output',
+                        default=f'startup-{datetime.now():%Y%m%d-%H%M%S}.json')
+    parser.add_argument('--serve', type=int, metavar='PORT',
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve)
+        return
+
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        parser.error(f'Unknown mode(s): {", ".join(unknown)}')
+
+    root = tempfile.mkdtemp(prefix='profilarr-startup-')
+    results = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'server': args.server,
+        'repeat': args.repeat,
+        'modes': {}
+    }
+    try:
+        _prepare(root)
+        for mode in modes:
+            print(f'== {mode} ==', file=sys.stderr)
+            runs = [run_once(root, mode, args.server, args.timeout)
+                    for _ in range(args.repeat)]
+            results['modes'][mode] = _summarize(runs)
+            for name, timing in results['modes'][mode].items():
+                print(f"{name:<40}{timing['best_ms']:>12.1f} ms"
+                      f"{timing['median_ms']:>12.1f} ms median")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'Wrote {args.output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,360 @@
+"""
+End-to-end timings of the main backend paths over synthetic databases.
+
+    cd backend && python -m benchmarks.bench_suite [--scales small,medium]
+        [--repeat N] [--latency MS] [--failure-rate F] [--output FILE]
+        [--keep]
+
+For each scale a synthetic database (see benchmarks.synthetic_db) is
+written into a throwaway config directory, committed to git, and then
+the data listing, format condition tests, format/profile imports (new
+importer and legacy async importarr) and media management syncs against
+app.importer.mock_arr, git status and backups are timed. Results are
+printed and written as JSON so runs can be compared over time.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from . import synthetic_db
+
+
+# Our media management data, as the sync receives it
+MEDIA_MANAGEMENT = {
+    'naming': {
+        'radarr': {
+            'rename': True,
+            'movieFormat': '{Movie CleanTitle} {(Release Year)} '
+                           '{edition-{Edition Tags}} {[Quality Full]}',
+            'movieFolderFormat': '{Movie CleanTitle} ({Release Year})'
+        }
+    },
+    'misc': {
+        'radarr': {
+            'propersRepacks': 'doNotPrefer',
+            'enableMediaInfo': True
+        }
+    },
+    'quality_definitions': {
+        'qualityDefinitions': {
+            'radarr': {
+                'Bluray-1080p': {'min': 50, 'preferred': 1999, 'max': 2000},
+                'WEBDL-1080p': {'min': 20, 'preferred': 1999, 'max': 2000},
+                'Remux-2160p': {'min': 200, 'preferred': 1999, 'max': 2000}
+            }
+        }
+    }
+}
+
+
+def _configure(root):
+    """
+    Point every configured path into root. App modules copy these paths
+    when they are imported, so this has to run before any of them are.
+    """
+    from app.config.config import Config
+    Config.CONFIG_DIR = root
+    Config.DB_PATH = os.path.join(root, 'profilarr.db')
+    Config.DB_DIR = os.path.join(root, 'db')
+    Config.REGEX_DIR = os.path.join(Config.DB_DIR,
+                                    synthetic_db.REGEX_SUBDIR)
+    Config.FORMAT_DIR = os.path.join(Config.DB_DIR,
+                                     synthetic_db.FORMAT_SUBDIR)
+    Config.PROFILE_DIR = os.path.join(Config.DB_DIR,
+                                      synthetic_db.PROFILE_SUBDIR)
+    Config.MEDIA_MANAGEMENT_DIR = os.path.join(Config.DB_DIR,
+                                               'media_management')
+    Config.LOG_DIR = os.path.join(root, 'log')
+    Config.PROFILING_DIR = os.path.join(Config.LOG_DIR, 'profiles')
+    Config.ensure_directories()
+    return Config
+
+
+def _time(func, repeat):
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append((time.perf_counter() - start) * 1000)
+    return {
+        'best_ms': round(min(runs), 3),
+        'median_ms': round(statistics.median(runs), 3),
+        'runs': len(runs)
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'],
+                              capture_output=True,
+                              text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _build_database(db_dir, sizes, seed):
+    """Regenerate db_dir as a git repository with a few local edits"""
+    import git
+
+    for name in os.listdir(db_dir):
+        path = os.path.join(db_dir, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    names = synthetic_db.generate(db_dir, *sizes, seed=seed)
+
+    repo = git.Repo.init(db_dir)
+    repo.git.add(A=True)
+    actor = git.Actor('Benchmark', 'benchmark@localhost')
+    repo.index.commit('Synthetic database', author=actor, committer=actor)
+
+    # Leave some outgoing changes for git status to find
+    format_dir = os.path.join(db_dir, synthetic_db.FORMAT_SUBDIR)
+    for file_name in sorted(os.listdir(format_dir))[::50]:
+        with open(os.path.join(format_dir, file_name), 'a') as f:
+            f.write('# edited\n')
+    return names
+
+
+def _drain(response):
+    # Listings stream, so the work happens while the body is read
+    body = response.get_data()
+    if response.status_code != 200:
+        raise RuntimeError(f'{response.status_code}: {body[:200]!r}')
+    return body
+
+
+def run_scale(client, sizes, args):
+    from app.config.config import config
+    from app.data.utils import test_format_conditions
+    from app.git.status.status import GitStatusManager, get_git_status
+    from app.importarr.format import async_import_formats_to_arr
+    from app.importer import compiler
+    from app.importer.mock_arr import MockArrServer
+    from app.importer.strategies.format import FormatStrategy
+    from app.importer.strategies.profile import ProfileStrategy
+    from app.media_management.sync import sync_media_management_to_arrs
+    from app.task.backup.backup import BackupManager
+    from app.utils import yaml_io
+
+    _, format_names, profile_names = _build_database(config.DB_DIR, sizes,
+                                                     args.seed)
+    # Caches keyed by path would otherwise carry over from the last scale
+    compiler._CACHED_PATTERNS = None
+    GitStatusManager._instance = None
+
+    timings = {}
+    for category in ('regex_pattern', 'custom_format', 'profile'):
+        timings[f'retrieve_all.{category}'] = _time(
+            lambda: _drain(client.get(f'/api/data/{category}')), args.repeat)
+    timings['retrieve_all.custom_format.summary'] = _time(
+        lambda: _drain(client.get('/api/data/custom_format?summary=1')),
+        args.repeat)
+
+    sample = []
+    for name in format_names[:20]:
+        with open(os.path.join(config.FORMAT_DIR, f'{name}.yml')) as f:
+            data = yaml_io.load(f)
+        sample.append((data['conditions'], data['tests']))
+
+    def test_formats():
+        for conditions, tests in sample:
+            success, message, _ = test_format_conditions(conditions, tests)
+            if not success:
+                raise RuntimeError(message)
+
+    timings[f'test_format_conditions.x{len(sample)}'] = _time(
+        test_formats, args.repeat)
+
+    arr_requests = 0
+    with MockArrServer(latency=args.latency / 1000) as server:
+
+        def reset_server():
+            nonlocal arr_requests
+            arr_requests += server.state.stats['requests']
+            server.state.reset()
+
+        arr_config = {
+            'type': 'radarr',
+            'arr_server': server.url,
+            'api_key': 'benchmark',
+            'import_as_unique': False
+        }
+
+        def import_with(strategy, names):
+            def run():
+                results = strategy(arr_config).execute(names)
+                if results.get('failed'):
+                    raise RuntimeError(f'Import failed: {results}')
+            return run
+
+        # The first run adds everything, later ones update in place
+        reset_server()
+        timings['format_import.add'] = _time(
+            import_with(FormatStrategy, format_names), 1)
+        timings['format_import.update'] = _time(
+            import_with(FormatStrategy, format_names), args.repeat)
+        reset_server()
+        timings['profile_import.add'] = _time(
+            import_with(ProfileStrategy, profile_names), 1)
+        timings['profile_import.update'] = _time(
+            import_with(ProfileStrategy, profile_names), args.repeat)
+
+        def legacy_import():
+            results = asyncio.run(
+                async_import_formats_to_arr(format_names, server.url,
+                                            'benchmark', 'radarr',
+                                            format_names))
+            if not results.get('success') or results.get('failed'):
+                raise RuntimeError(f'Import failed: {results}')
+
+        reset_server()
+        timings['importarr_async.format.add'] = _time(legacy_import, 1)
+        timings['importarr_async.format.update'] = _time(
+            legacy_import, args.repeat)
+
+        def media_management_sync():
+            results = sync_media_management_to_arrs(
+                [dict(arr_config, id=1, arrServer=server.url,
+                      apiKey='benchmark')],
+                list(MEDIA_MANAGEMENT), MEDIA_MANAGEMENT)
+            failed = [r for r in results[1].values() if not r['success']]
+            if failed:
+                raise RuntimeError(f'Sync failed: {failed}')
+
+        reset_server()
+        timings['media_management_sync'] = _time(media_management_sync,
+                                                 args.repeat)
+        arr_requests += server.state.stats['requests']
+
+    faults = None
+    if args.failure_rate:
+        # Same import against a flaky server; the failed count is part of
+        # the result rather than an error
+        with MockArrServer(latency=args.latency / 1000,
+                           failure_rate=args.failure_rate,
+                           seed=args.seed) as server:
+            arr_config['arr_server'] = server.url
+            faulty = {}
+
+            def faulty_import():
+                faulty.update(FormatStrategy(arr_config).execute(format_names))
+
+            timings['format_import.faulty'] = _time(faulty_import, 1)
+            faults = {
+                'failure_rate': args.failure_rate,
+                'import_failed': faulty.get('failed', 0),
+                'injected': server.state.stats['failed']
+            }
+
+    def git_status():
+        success, status = get_git_status(config.DB_DIR)
+        if not success:
+            raise RuntimeError(status)
+
+    timings['git_status'] = _time(git_status, args.repeat)
+
+    backup_manager = BackupManager()
+
+    def backup(mode):
+        def run():
+            success, message = backup_manager.create_backup(mode)
+            if not success:
+                raise RuntimeError(message)
+        return run
+
+    timings['backup.full'] = _time(backup('full'), 1)
+    # Second incremental run only stores what changed, i.e. nothing
+    timings['backup.incremental.first'] = _time(backup('incremental'), 1)
+    timings['backup.incremental.unchanged'] = _time(backup('incremental'), 1)
+    shutil.rmtree(backup_manager.backup_dir, ignore_errors=True)
+    os.makedirs(backup_manager.backup_dir, exist_ok=True)
+
+    return {
+        'sizes': dict(zip(('patterns', 'formats', 'profiles'), sizes)),
+        'arr_requests': arr_requests,
+        'faults': faults,
+        'timings': timings
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scales', default='small,medium',
+                        help=f'comma separated, from '
+                        f'{", ".join(synthetic_db.SCALES)}')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='milliseconds the mock Arr server adds per request')
+    parser.add_argument('--failure-rate', type=float, default=0.0,
+                        help='also time a format import against a mock '
+                        'server failing this fraction of requests')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output',
+                        default=f'bench-{datetime.now():%Y%m%d-%H%M%S}.json')
+    parser.add_argument('--keep', action='store_true',
+                        help='keep the generated config directory')
+    args = parser.parse_args()
+
+    scales = [s.strip() for s in args.scales.split(',') if s.strip()]
+    unknown = [s for s in scales if s not in synthetic_db.SCALES]
+    if unknown:
+        parser.error(f'Unknown scale(s): {", ".join(unknown)}')
+
+    root = tempfile.mkdtemp(prefix='profilarr-bench-')
+    _configure(root)
+    # The app logs every condition it tests; keep that out of the timings
+    logging.disable(logging.CRITICAL)
+
+    from flask import Flask
+    from app.data import bp as data_bp
+    from app.db import run_migrations
+
+    run_migrations()
+    app = Flask(__name__)
+    app.register_blueprint(data_bp, url_prefix='/api/data')
+    client = app.test_client()
+
+    results = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'latency_ms': args.latency,
+        'failure_rate': args.failure_rate,
+        'scales': {}
+    }
+    try:
+        for scale in scales:
+            print(f'== {scale} ==', file=sys.stderr)
+            result = run_scale(client, synthetic_db.SCALES[scale], args)
+            results['scales'][scale] = result
+            for name, timing in result['timings'].items():
+                print(f"{name:<40}{timing['best_ms']:>12.1f} ms"
+                      f"{timing['median_ms']:>12.1f} ms median")
+    finally:
+        if args.keep:
+            print(f'Kept {root}', file=sys.stderr)
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'Wrote {args.output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+YAML load/dump cost over every file in the database repository.
+
+    cd backend && python -m benchmarks.bench_yaml [--path DIR] [--repeat N]
+
+Times the pure-Python safe loader/dumper against the ones app.utils.yaml_io
+uses (libyaml when available) and checks that both load the same data and
+dump the same text, so switching backends never rewrites a file.
+"""
+import argparse
+import os
+import time
+
+import yaml
+
+from app.config.config import config
+from app.utils import yaml_io
+
+
+def _read_database(path):
+    documents = {}
+    for root, _, files in os.walk(path):
+        if os.sep + '.git' in root:
+            continue
+        for name in files:
+            if name.endswith('.yml'):
+                file_path = os.path.join(root, name)
+                with open(file_path, 'rb') as f:
+                    documents[file_path] = f.read()
+    return documents
+
+
+def _best(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--path', default=config.DB_DIR)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    documents = _read_database(args.path)
+    if not documents:
+        parser.error(f'No .yml files found under {args.path}')
+    total_bytes = sum(len(content) for content in documents.values())
+    loaded = {
+        path: yaml.load(content, Loader=yaml.SafeLoader)
+        for path, content in documents.items()
+    }
+
+    load_mismatches = sum(
+        1 for path, content in documents.items()
+        if yaml_io.load(content) != loaded[path])
+    dump_mismatches = sum(
+        1 for data in loaded.values()
+        if yaml_io.dump(data, sort_keys=False) != yaml.dump(
+            data, Dumper=yaml.SafeDumper, sort_keys=False))
+
+    timings = {
+        'load':
+        (_best(lambda: [
+            yaml.load(content, Loader=yaml.SafeLoader)
+            for content in documents.values()
+        ], args.repeat),
+         _best(lambda: [yaml_io.load(content)
+                        for content in documents.values()], args.repeat)),
+        'dump':
+        (_best(lambda: [
+            yaml.dump(data, Dumper=yaml.SafeDumper, sort_keys=False)
+            for data in loaded.values()
+        ], args.repeat),
+         _best(lambda: [yaml_io.dump(data, sort_keys=False)
+                        for data in loaded.values()], args.repeat))
+    }
+
+    print(f'{len(documents)} files, {total_bytes / 1024:.0f} KiB, '
+          f'libyaml: {"yes" if yaml_io.LIBYAML else "no"}')
+    print(f"{'operation':<12}{'python ms':>12}{'yaml_io ms':>12}{'speedup':>10}")
+    for operation, (python_s, fast_s) in timings.items():
+        print(f'{operation:<12}{python_s * 1000:>12.1f}{fast_s * 1000:>12.1f}'
+              f'{python_s / fast_s:>9.1f}x')
+    print(f'load mismatches: {load_mismatches}, '
+          f'dump mismatches: {dump_mismatches}')
+
+
+if __name__ == '__main__':
+    main()
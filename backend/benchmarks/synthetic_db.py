@@ -0,0 +1,229 @@
+"""
+Synthetic database repositories for benchmarking.
+
+    cd backend && python -m benchmarks.synthetic_db DIR [--patterns N]
+        [--formats M] [--profiles P] [--seed S]
+
+Writes regex patterns, custom formats and quality profiles shaped like the
+real database (pattern conditions with release-title tests, source and
+resolution conditions, quality groups, per-app scores) into the category
+directories under DIR. The same seed always produces the same files.
+"""
+import argparse
+import os
+import random
+
+from app.utils import yaml_io
+
+# Category directory names inside a database repository
+REGEX_SUBDIR = 'regex_patterns'
+FORMAT_SUBDIR = 'custom_formats'
+PROFILE_SUBDIR = 'profiles'
+
+# Scale name -> (regex patterns, custom formats, quality profiles)
+SCALES = {
+    'small': (50, 40, 5),
+    'medium': (500, 400, 25),
+    'large': (2500, 2000, 100)
+}
+
+GROUPS = ('FraMeSToR', 'BHDStudio', 'NTb', 'FLUX', 'CMRG', 'HONE', 'EDITH',
+          'playWEB', 'TEPES', 'KiNGS', 'SiCFoI', 'DON', 'ZQ', 'W4NK3R')
+SOURCES = ('bluray', 'web_dl', 'webrip', 'hdtv', 'dvd')
+RESOLUTIONS = ('480p', '720p', '1080p', '2160p')
+QUALITIES = ('Bluray-2160p', 'WEBDL-2160p', 'WEBRip-2160p', 'Bluray-1080p',
+             'WEBDL-1080p', 'WEBRip-1080p', 'HDTV-1080p', 'Bluray-720p',
+             'WEBDL-720p', 'WEBRip-720p', 'HDTV-720p', 'DVD')
+LANGUAGES = ('any', 'english', 'must_english', 'only_english', 'french')
+TITLE_WORDS = ('Dune', 'Part', 'Two', 'The', 'Last', 'Of', 'Us', 'Severance',
+               'Blade', 'Runner', 'Arrival', 'Heat', 'Alien', 'Andor')
+
+
+def _release_title(rng, group=None):
+    words = ' '.join(rng.sample(TITLE_WORDS, rng.randint(1, 4)))
+    return (f"{words.replace(' ', '.')}.{rng.randint(1970, 2025)}."
+            f"{rng.choice(RESOLUTIONS)}.{rng.choice(('BluRay', 'WEB-DL', 'WEBRip'))}."
+            f"DDP5.1.x264-{group or rng.choice(GROUPS)}")
+
+
+def _tests(rng, group, count):
+    tests = []
+    for i in range(count):
+        expected = rng.random() < 0.5
+        tests.append({
+            'id': i + 1,
+            'input': _release_title(rng, group if expected else None),
+            'expected': expected,
+            'passes': False,
+            'lastRun': None
+        })
+    return tests
+
+
+def _regex_pattern(rng, index):
+    group = rng.choice(GROUPS)
+    return {
+        'name': f'Pattern {index:05d}',
+        'pattern': rf'(?<=^|[\s.-]){group}{index}?\b',
+        'description': f'Release group {group} (synthetic {index})',
+        'tags': rng.sample(('Release Group', 'Tier 1', 'Tier 2', 'HDR',
+                            'Streaming'), 2),
+        'tests': _tests(rng, group, rng.randint(2, 6))
+    }
+
+
+def _custom_format(rng, index, pattern_names):
+    conditions = []
+    for i in range(rng.randint(1, 6)):
+        conditions.append({
+            'name': f'Condition {i + 1}',
+            'type': rng.choice(('release_title', 'release_group')),
+            'pattern': rng.choice(pattern_names),
+            'required': rng.random() < 0.3,
+            'negate': rng.random() < 0.15
+        })
+    if rng.random() < 0.5:
+        conditions.append({
+            'name': 'Source',
+            'type': 'source',
+            'source': rng.choice(SOURCES),
+            'required': True,
+            'negate': False
+        })
+    if rng.random() < 0.4:
+        conditions.append({
+            'name': 'Resolution',
+            'type': 'resolution',
+            'resolution': rng.choice(RESOLUTIONS),
+            'required': False,
+            'negate': False
+        })
+    return {
+        'name': f'Format {index:05d}',
+        'description': f'Synthetic custom format {index}',
+        'tags': rng.sample(('Release Group', 'Audio', 'HDR', 'Unwanted',
+                            'Streaming'), 2),
+        'conditions': conditions,
+        'tests': _tests(rng, rng.choice(GROUPS), rng.randint(2, 8))
+    }
+
+
+def _profile(rng, index, format_names):
+    qualities = []
+    chosen = sorted(rng.sample(range(len(QUALITIES)), rng.randint(3, 8)))
+    # Fold the best qualities into a group, as most real profiles do
+    group = [{'id': i, 'name': QUALITIES[i]} for i in chosen[:2]]
+    qualities.append({'id': -1, 'name': 'Top Tier',
+                      'description': '', 'qualities': group})
+    qualities.extend({'id': i, 'name': QUALITIES[i]} for i in chosen[2:])
+
+    def scores(count):
+        return [{'name': name, 'score': rng.choice((-10000, -100, 10, 50, 250,
+                                                    1000))}
+                for name in rng.sample(format_names,
+                                       min(count, len(format_names)))]
+
+    return {
+        'name': f'Profile {index:04d}',
+        'description': f'Synthetic quality profile {index}',
+        'tags': ['Synthetic'],
+        'upgradesAllowed': True,
+        'minCustomFormatScore': 0,
+        'upgradeUntilScore': 10000,
+        'minScoreIncrement': 1,
+        'custom_formats': scores(rng.randint(10, 40)),
+        'custom_formats_radarr': scores(rng.randint(0, 5)),
+        'custom_formats_sonarr': scores(rng.randint(0, 5)),
+        'qualities': qualities,
+        'upgrade_until': {'id': -1, 'name': 'Top Tier'},
+        'language': rng.choice(LANGUAGES)
+    }
+
+
+def _language_templates():
+    """The formats language-restricted profiles derive their variants from"""
+    def language(name, negate, except_language=False):
+        return {'name': name, 'type': 'language', 'language': 'english',
+                'exceptLanguage': except_language, 'required': True,
+                'negate': negate}
+
+    return [{
+        'name': 'Not English',
+        'description': 'Release is not in English',
+        'tags': ['Language'],
+        'conditions': [language('Not English', True)],
+        'tests': []
+    }, {
+        'name': 'Not Only English',
+        'description': 'Release has languages other than English',
+        'tags': ['Language'],
+        'conditions': [language('Not Only English', True, True)],
+        'tests': []
+    }, {
+        'name': 'Not Only English (Missing)',
+        'description': 'Release language could not be determined',
+        'tags': ['Language'],
+        'conditions': [language('English', False),
+                       language('Original', True)],
+        'tests': []
+    }]
+
+
+def _write(directory, name, data):
+    with open(os.path.join(directory, f'{name}.yml'), 'w') as f:
+        yaml_io.dump(data, f, sort_keys=False)
+
+
+def generate(root, patterns, formats, profiles, seed=0):
+    """
+    Write a synthetic database into the category directories under root
+    and return the generated (pattern, format, profile) names. The
+    language templates are written as well but not returned.
+    """
+    rng = random.Random(seed)
+    directories = [os.path.join(root, subdir)
+                   for subdir in (REGEX_SUBDIR, FORMAT_SUBDIR, PROFILE_SUBDIR)]
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+    regex_dir, format_dir, profile_dir = directories
+
+    pattern_names = []
+    for i in range(patterns):
+        data = _regex_pattern(rng, i)
+        _write(regex_dir, data['name'], data)
+        pattern_names.append(data['name'])
+
+    format_names = []
+    for i in range(formats):
+        data = _custom_format(rng, i, pattern_names)
+        _write(format_dir, data['name'], data)
+        format_names.append(data['name'])
+    for data in _language_templates():
+        _write(format_dir, data['name'], data)
+
+    profile_names = []
+    for i in range(profiles):
+        data = _profile(rng, i, format_names)
+        _write(profile_dir, data['name'], data)
+        profile_names.append(data['name'])
+
+    return pattern_names, format_names, profile_names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('root')
+    parser.add_argument('--patterns', type=int, default=SCALES['medium'][0])
+    parser.add_argument('--formats', type=int, default=SCALES['medium'][1])
+    parser.add_argument('--profiles', type=int, default=SCALES['medium'][2])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    names = generate(args.root, args.patterns, args.formats, args.profiles,
+                     args.seed)
+    print(f'Wrote {len(names[0])} patterns, {len(names[1])} formats and '
+          f'{len(names[2])} profiles to {args.root}')
+
+
+if __name__ == '__main__':
+    main()